@@ -0,0 +1,57 @@
+"""
+Throughput of the messages pipe fan-out.
+
+Measures how many messages per second a single pipe delivers to all of its subscribers.
+Run from the root of the repository: python tests/benchmarks/bench_fanout.py
+"""
+from __future__ import annotations
+import asyncio
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from xoa_core.core.messenger.handler import OutMessagesHandler  # noqa: E402
+
+MESSAGES = 20_000
+SUBSCRIBERS = (1, 10, 100)
+
+
+async def consume(handler: OutMessagesHandler, name: str, expected: int, done: asyncio.Queue) -> None:
+    received = 0
+    async for _ in handler.changes(name):
+        received += 1
+        if received == expected:
+            break
+    await done.put(received)
+
+
+async def measure(subscribers: int) -> float:
+    handler = OutMessagesHandler()
+    pipe = handler.get_pipe("BENCH")
+    done: asyncio.Queue[int] = asyncio.Queue()
+    tasks = [asyncio.create_task(consume(handler, "BENCH", MESSAGES, done)) for _ in range(subscribers)]
+    await asyncio.sleep(0.1)  # let all subscribers attach to the pipe
+
+    begin = time.perf_counter()
+    for idx in range(MESSAGES):
+        pipe.transmit(idx)
+    for _ in range(subscribers):
+        await done.get()
+    elapsed = time.perf_counter() - begin
+
+    await asyncio.gather(*tasks)
+    await handler.disable_pipe("BENCH")
+    return MESSAGES / elapsed
+
+
+async def main() -> None:
+    print(f"{'subscribers':>12} | {'messages/sec':>14} | {'deliveries/sec':>15}")
+    for subscribers in SUBSCRIBERS:
+        rate = await measure(subscribers)
+        print(f"{subscribers:>12} | {rate:>14,.0f} | {rate * subscribers:>15,.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+"""
+Latency of the execution history queries.
+
+Records a large amount of executions and measures the typical queries.
+Run from the root of the repository: python tests/benchmarks/bench_history.py
+"""
+from __future__ import annotations
+import asyncio
+import random
+import sys
+import os
+import tempfile
+import time
+import uuid
+from types import SimpleNamespace
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from xoa_core.core.executors.executor_state import EOutcome  # noqa: E402
+from xoa_core.core.executors.history import ExecutionHistory  # noqa: E402
+
+EXECUTIONS = 200_000
+SUITES = tuple(f"suite-{idx}" for idx in range(20))
+TESTERS = tuple(str(uuid.uuid4()) for _ in range(50))
+REPEATS = 100
+
+
+def record(history: ExecutionHistory, begin: float) -> None:
+    rnd = random.Random(0)
+    for idx in range(EXECUTIONS):
+        started = begin + idx
+        executor = SimpleNamespace(
+            id=str(uuid.uuid4()),
+            suite_name=rnd.choice(SUITES),
+            tester_ids=frozenset(rnd.sample(TESTERS, 2)),
+            started=started,
+            finished=started + rnd.uniform(1, 600),
+            outcome=rnd.choice(tuple(EOutcome)),
+            error=None,
+        )
+        history.record_started(executor)
+        history.record_transition(executor.id, "RUN", "STOPPED", started)
+        history.record_transition(executor.id, "STOPPED", "RUN", executor.finished)
+        history.record_finished(executor)
+
+
+async def measure(history: ExecutionHistory, **criteria) -> float:
+    begin = time.perf_counter()
+    for _ in range(REPEATS):
+        await history.query(**criteria)
+    return (time.perf_counter() - begin) / REPEATS * 1000
+
+
+async def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        history = ExecutionHistory(os.path.join(directory, "history.db"))
+        begin = time.time() - EXECUTIONS
+        elapsed = time.perf_counter()
+        record(history, begin)
+        await history.transitions("")  # wait for the queued records
+        elapsed = time.perf_counter() - elapsed
+        print(f"recorded {EXECUTIONS:,} executions in {elapsed:.1f} sec")
+
+        middle = begin + EXECUTIONS / 2
+        queries = {
+            "latest": {},
+            "suite": {"suite_name": SUITES[0]},
+            "tester": {"tester_id": TESTERS[0]},
+            "time range": {"since": middle, "until": middle + 3600},
+            "suite + outcome + range": {"suite_name": SUITES[0], "outcome": EOutcome.FAILED, "since": middle, "until": middle + 3600},
+            "tester + range": {"tester_id": TESTERS[0], "since": middle, "until": middle + 3600},
+        }
+        print(f"{'query':>24} | {'ms/query':>9}")
+        for name, criteria in queries.items():
+            print(f"{name:>24} | {await measure(history, **criteria):>9.2f}")
+        history.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,68 @@
+"""
+Construction speed of the messages.
+
+Compares the validated construction of the message models with the construction used by the framework.
+Run from the root of the repository: python tests/benchmarks/bench_message.py
+"""
+from __future__ import annotations
+import sys
+import os
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from xoa_core.core.messenger.misc import (  # noqa: E402
+    EMsgType,
+    Message,
+    Progress,
+    StatePayload,
+)
+
+NUMBER = 100_000
+STATISTICS = {"port": "P-0-0-0", "tx_frames": 1_000_000, "rx_frames": 999_998, "loss": 0.0002}
+
+
+def validated_statistics() -> Message:
+    return Message(pipe_name="BENCH", meta={"suite_name": "BENCH"}, type=EMsgType.STATISTICS, payload=STATISTICS)
+
+
+def constructed_statistics() -> Message:
+    return Message.construct(pipe_name="BENCH", meta={"suite_name": "BENCH"}, type=EMsgType.STATISTICS, payload=STATISTICS)
+
+
+def validated_progress() -> Message:
+    progress = Progress(current=10, total=100, loop=0)
+    return Message(pipe_name="BENCH", meta={"suite_name": "BENCH"}, type=EMsgType.PROGRESS, payload=progress)
+
+
+def constructed_progress() -> Message:
+    progress = Progress.construct(current=10, total=100, loop=0)
+    return Message.construct(pipe_name="BENCH", meta={"suite_name": "BENCH"}, type=EMsgType.PROGRESS, payload=progress)
+
+
+def validated_state() -> Message:
+    state = StatePayload(state="RUN", old_state="STOPPED")
+    return Message(pipe_name="BENCH", meta={}, type=EMsgType.STATE, payload=state)
+
+
+def constructed_state() -> Message:
+    state = StatePayload.construct(state="RUN", old_state="STOPPED")
+    return Message.construct(pipe_name="BENCH", meta={}, type=EMsgType.STATE, payload=state)
+
+
+def main() -> None:
+    assert validated_progress().dict() == constructed_progress().dict()
+    assert validated_state().json() == constructed_state().json()
+    print(f"{'message':>12} | {'validated/sec':>14} | {'constructed/sec':>16}")
+    for name, validated, constructed in (
+        ("STATISTICS", validated_statistics, constructed_statistics),
+        ("PROGRESS", validated_progress, constructed_progress),
+        ("STATE", validated_state, constructed_state),
+    ):
+        slow = NUMBER / timeit.timeit(validated, number=NUMBER)
+        fast = NUMBER / timeit.timeit(constructed, number=NUMBER)
+        print(f"{name:>12} | {slow:>14,.0f} | {fast:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Latency of listing the info of the known testers.
+
+Builds a synthetic fleet of testers with modules and ports, and measures `list_testers_info`
+with the cached info models, after a change of a port on each tester, and the full rebuild of the info models.
+Run from the root of the repository: python tests/benchmarks/bench_testers_info.py
+"""
+from __future__ import annotations
+import asyncio
+import sys
+import os
+import tempfile
+import time
+from dataclasses import asdict
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from xoa_driver import enums  # noqa: E402
+from xoa_core.core.messenger.handler import OutMessagesHandler  # noqa: E402
+from xoa_core.core.resources.controller import ResourcesController  # noqa: E402
+from xoa_core.core.resources.storage import PrecisionStorage  # noqa: E402
+from xoa_core.core.resources.resource.facade import Resource  # noqa: E402
+from xoa_core.core.resources.resource.misc import Credentials  # noqa: E402
+from xoa_core.core.resources.resource.models.module import ModuleModel  # noqa: E402
+from xoa_core.core.resources.resource.models.port import PortModel  # noqa: E402
+from xoa_core.core.resources.resource.models.tester import TesterInfoModel  # noqa: E402
+from xoa_core.core.resources.resource.models.types import EProductType, ModuleID, PortID  # noqa: E402
+
+TESTERS = 100
+MODULES = 12
+PORTS = 8
+REPEATS = 20
+
+
+def populate(resource: Resource) -> None:
+    modules = []
+    for m_idx in range(MODULES):
+        module_id = ModuleID(f"{resource.id}-{m_idx}")
+        ports = tuple(
+            PortModel(
+                id=PortID(f"{module_id}-{p_idx}"),
+                index=p_idx,
+                model="Odin-10G-1S-2P",
+                reserved_by="",
+                sync_status=True,
+                traffic_state=enums.TrafficOnOff.OFF,
+                max_speed=10000,
+            )
+            for p_idx in range(PORTS)
+        )
+        modules.append(ModuleModel(id=module_id, index=m_idx, model="Odin", reserved_by="", ports=ports, serial_number=m_idx))
+    resource.dataset.modules = tuple(modules)
+    resource.dataset.is_connected = True
+
+
+def measure(func) -> float:
+    begin = time.perf_counter()
+    for _ in range(REPEATS):
+        func()
+    return (time.perf_counter() - begin) / REPEATS * 1000
+
+
+async def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        controller = ResourcesController(OutMessagesHandler().get_pipe("BENCH"), PrecisionStorage(os.path.join(directory, "store")))
+        resources = [Resource(Credentials(product=EProductType.VALKYRIE, host=f"10.0.{idx // 256}.{idx % 256}")) for idx in range(TESTERS)]
+        for resource in resources:
+            populate(resource)
+        await controller._pool.add_many(resources)
+
+        async def list_testers_info(repeats: int = REPEATS) -> float:
+            begin = time.perf_counter()
+            for _ in range(repeats):
+                await controller.list_testers_info()
+            return (time.perf_counter() - begin) / repeats * 1000
+
+        def flip_ports() -> None:
+            for resource in resources:
+                port = resource.dataset.modules[0].ports[0]
+                port.traffic_state = enums.TrafficOnOff.ON if port.traffic_state is enums.TrafficOnOff.OFF else enums.TrafficOnOff.OFF
+
+        print(f"{TESTERS} testers x {MODULES} modules x {PORTS} ports")
+        print(f"{'list_testers_info':>32} | {'ms/call':>9}")
+        print(f"{'full rebuild (asdict + parse)':>32} | {measure(lambda: [TesterInfoModel.parse_obj(asdict(r.dataset)) for r in resources]):>9.2f}")
+        print(f"{'cached':>32} | {await list_testers_info():>9.2f}")
+
+        begin = time.perf_counter()
+        for _ in range(REPEATS):
+            flip_ports()
+            await controller.list_testers_info()
+        print(f"{'a port changed on each tester':>32} | {(time.perf_counter() - begin) / REPEATS * 1000:>9.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
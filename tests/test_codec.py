@@ -0,0 +1,44 @@
+from __future__ import annotations
+import sys
+import os
+import asyncio
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xoa_core.core.messenger import codec, misc  # noqa: E402
+
+
+def message() -> misc.Message:
+    return misc.Message.construct(pipe_name="PIPE", seq=1, timestamp=0.0, meta={"suite_name": "S"}, type=misc.EMsgType.DATA, payload={"a": 1})
+
+
+class TestDecodeErrors(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        self.assertEqual(codec.decode(codec.encode(message())).dict(), message().dict())
+
+    def test_invalid_utf8(self) -> None:
+        frame = bytearray(codec.encode(message()))
+        frame[codec.HEADER.size + 1] = 0xFF  # first byte of the pipe name
+        with self.assertRaises(codec.DecodeError):
+            codec.decode(frame)
+
+    def test_zero_length(self) -> None:
+        frame = codec.HEADER.pack(0, 0) + codec.encode(message())
+        with self.assertRaises(codec.DecodeError):
+            list(codec.iter_decode(frame))
+
+    def test_zero_length_stream(self) -> None:
+        async def read() -> None:
+            reader = asyncio.StreamReader()
+            reader.feed_data(codec.HEADER.pack(0, 0))
+            reader.feed_eof()
+            async for _ in codec.read_messages(reader):
+                pass
+
+        with self.assertRaises(codec.DecodeError):
+            asyncio.run(read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+import sys
+import os
+import asyncio
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xoa_core.core.messenger import misc  # noqa: E402
+from xoa_core.core.messenger.handler import OutMessagesHandler  # noqa: E402
+
+
+class TestDrainDeadline(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.handler = OutMessagesHandler()
+        self.pipe = self.handler.get_pipe("PIPE")
+
+    async def subscribe(self, **kwargs) -> asyncio.Task:
+        async def consume() -> list[int]:
+            return [msg.seq async for msg in self.handler.changes("PIPE", **kwargs)]
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        return task
+
+    async def test_all_messages_flushed(self) -> None:
+        task = await self.subscribe()
+        for idx in range(5):
+            self.pipe.transmit(idx)
+        report = await self.handler.disable_pipe("PIPE", timeout=1)
+        assert report is not None
+        self.assertFalse(report.timed_out)
+        self.assertEqual((report.flushed, report.abandoned), (5, 0))
+        self.assertEqual(await task, [1, 2, 3, 4, 5])
+
+    async def test_stuck_subscriber_abandoned(self) -> None:
+        stuck = self.handler.changes("PIPE", maxsize=1, policy=misc.EOverflowPolicy.BLOCK)
+        first = asyncio.ensure_future(stuck.__anext__())
+        await asyncio.sleep(0)
+        for idx in range(5):
+            self.pipe.transmit(idx)
+        await first  # the subscriber never asks for more
+        report = await asyncio.wait_for(self.handler.disable_pipe("PIPE", timeout=0.05), 1)
+        assert report is not None
+        self.assertTrue(report.timed_out)
+        self.assertLessEqual(report.flushed + report.abandoned, 5)
+        self.assertGreater(report.abandoned, 0)
+        self.assertLess(report.duration, 0.5)
+        await stuck.aclose()
+
+    async def test_unknown_pipe(self) -> None:
+        self.assertIsNone(await self.handler.disable_pipe("MISSING", timeout=0.05))
+        await self.handler.disable_pipe("PIPE")
+
+
+if __name__ == "__main__":
+    unittest.main()
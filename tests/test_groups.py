@@ -0,0 +1,90 @@
+from __future__ import annotations
+import sys
+import os
+import asyncio
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xoa_core.core.messenger import misc  # noqa: E402
+from xoa_core.core.messenger.groups import ConsumerGroup  # noqa: E402
+from xoa_core.core.messenger.handler import OutMessagesHandler  # noqa: E402
+from xoa_core.core.messenger.queues import MessagesQueue  # noqa: E402
+
+
+def message(seq: int) -> misc.Message:
+    return misc.Message.construct(pipe_name="PIPE", seq=seq, timestamp=0.0, meta={}, type=misc.EMsgType.DATA, payload={})
+
+
+class TestConsumerGroup(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.group = ConsumerGroup("group", "key", MessagesQueue())
+        for seq in range(1, 5):
+            self.group.queue.put_nowait(message(seq))
+
+    async def test_prefetch_limit(self) -> None:
+        member = self.group.consume(prefetch=2)
+        first = await member.__anext__()
+        await member.__anext__()
+        third = asyncio.ensure_future(member.__anext__())
+        await asyncio.sleep(0.01)
+        self.assertFalse(third.done())
+        first.ack()
+        self.assertEqual((await third).message.seq, 3)
+        await member.aclose()
+
+    async def test_ack_is_idempotent(self) -> None:
+        member = self.group.consume(prefetch=1)
+        delivery = await member.__anext__()
+        delivery.ack()
+        delivery.ack()
+        delivery.nack()  # already settled
+        self.assertEqual((await member.__anext__()).message.seq, 2)
+        self.assertEqual(self.group.queue.requeued, 0)
+        await member.aclose()
+
+    async def test_nack_redelivers_first(self) -> None:
+        member = self.group.consume(prefetch=1)
+        delivery = await member.__anext__()
+        delivery.nack()
+        self.assertEqual((await member.__anext__()).message.seq, 1)
+        await member.aclose()
+
+    async def test_leaving_member_returns_deliveries(self) -> None:
+        leaving = self.group.consume(prefetch=2)
+        await leaving.__anext__()
+        await leaving.__anext__()
+        await leaving.aclose()
+        staying = self.group.consume(prefetch=4)
+        seqs = [(await staying.__anext__()).message.seq for _ in range(4)]
+        self.assertEqual(seqs, [1, 2, 3, 4])
+        self.assertEqual(self.group.members, 1)
+        await staying.aclose()
+        self.assertEqual(self.group.members, 0)
+
+
+class TestGroupChanges(unittest.IsolatedAsyncioTestCase):
+    async def test_each_message_delivered_once(self) -> None:
+        handler = OutMessagesHandler()
+        pipe = handler.get_pipe("PIPE")
+        received: dict[str, list[int]] = {"a": [], "b": []}
+
+        async def member(name: str) -> None:
+            async for delivery in handler.group_changes("group", "PIPE", prefetch=1):
+                received[name].append(delivery.message.seq)
+                delivery.ack()
+                await asyncio.sleep(0)
+
+        tasks = [asyncio.create_task(member(name)) for name in received]
+        await asyncio.sleep(0)
+        for idx in range(10):
+            pipe.transmit(idx)
+        await asyncio.sleep(0.01)
+        await handler.disable_pipe("PIPE")
+        await asyncio.wait_for(asyncio.gather(*tasks), 1)
+        self.assertEqual(sorted(received["a"] + received["b"]), list(range(1, 11)))
+        self.assertTrue(received["a"] and received["b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
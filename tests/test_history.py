@@ -0,0 +1,93 @@
+from __future__ import annotations
+import sys
+import os
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xoa_core.core.executors.executor import SuiteExecutor  # noqa: E402
+from xoa_core.core.executors.executor_state import EOutcome  # noqa: E402
+from xoa_core.core.executors.history import ExecutionHistory  # noqa: E402
+
+
+def executor(name: str, started: float, testers: tuple[str, ...] = ()) -> SuiteExecutor:
+    ex = SuiteExecutor(name)
+    ex.started = started
+    ex.tester_ids = frozenset(testers)
+    return ex
+
+
+def finish(ex: SuiteExecutor, outcome: EOutcome, error: str | None = None) -> SuiteExecutor:
+    ex.finished = (ex.started or 0.0) + 1.0
+    ex.outcome = outcome
+    ex.error = error
+    return ex
+
+
+class TestExecutionHistory(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.history = ExecutionHistory(os.path.join(self.directory.name, "history.db"))
+        self.executors = [
+            executor("RFC-2544", 100.0, ("T1",)),
+            executor("RFC-2544", 200.0, ("T1", "T2")),
+            executor("RFC-2889", 300.0, ("T2",)),
+        ]
+        for ex in self.executors:
+            self.history.record_started(ex)
+        self.history.record_transition(self.executors[0].id, "RUNNING", None, 101.0)
+        self.history.record_transition(self.executors[0].id, "STOPPED", "RUNNING", 102.0)
+        self.history.record_finished(finish(self.executors[0], EOutcome.COMPLETED))
+        self.history.record_finished(finish(self.executors[1], EOutcome.FAILED, "ValueError: boom"))
+
+    async def asyncTearDown(self) -> None:
+        self.history.close()
+        self.directory.cleanup()
+
+    async def ids(self, **criteria) -> list[str]:
+        return [record.id for record in await self.history.query(**criteria)]
+
+    async def test_latest_first(self) -> None:
+        self.assertEqual(await self.ids(), [ex.id for ex in reversed(self.executors)])
+        self.assertEqual(await self.ids(limit=1), [self.executors[2].id])
+
+    async def test_criteria(self) -> None:
+        first, second, third = (ex.id for ex in self.executors)
+        self.assertEqual(await self.ids(suite_name="RFC-2544"), [second, first])
+        self.assertEqual(await self.ids(tester_id="T2"), [third, second])
+        self.assertEqual(await self.ids(outcome=EOutcome.FAILED), [second])
+        self.assertEqual(await self.ids(since=150.0, until=300.0), [second])
+        self.assertEqual(await self.ids(suite_name="RFC-2544", tester_id="T2", outcome=EOutcome.COMPLETED), [])
+
+    async def test_record_fields(self) -> None:
+        record = (await self.history.query(outcome=EOutcome.FAILED))[0]
+        self.assertEqual(sorted(record.tester_ids), ["T1", "T2"])
+        self.assertEqual((record.started, record.finished), (200.0, 201.0))
+        self.assertEqual(record.error, "ValueError: boom")
+        running = (await self.history.query(suite_name="RFC-2889"))[0]
+        self.assertIsNone(running.finished)
+        self.assertIsNone(running.outcome)
+
+    async def test_transitions(self) -> None:
+        transitions = await self.history.transitions(self.executors[0].id)
+        self.assertEqual([(t.state, t.old_state) for t in transitions], [("RUNNING", None), ("STOPPED", "RUNNING")])
+        self.assertEqual((await self.history.query(limit=3))[2].state, "STOPPED")
+
+    async def test_kept_across_reopening(self) -> None:
+        self.history.close()
+        self.history = ExecutionHistory(self.history.path)
+        self.assertEqual(len(await self.history.query()), 3)
+
+    async def test_closed(self) -> None:
+        self.history.close()
+        self.history.close()
+        self.assertTrue(self.history.closed)
+        self.history.record_finished(finish(self.executors[2], EOutcome.STOPPED))
+        self.assertEqual(await self.history.query(), [])
+        self.history = ExecutionHistory(self.history.path)
+        self.assertIsNone((await self.history.query(suite_name="RFC-2889"))[0].outcome)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+import sys
+import os
+import asyncio
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xoa_core.core.messenger.handler import OutMessagesHandler  # noqa: E402
+from xoa_core.core.messenger.journal import (  # noqa: E402
+    JournalReader,
+    JournalWriter,
+    UnknownPipeError,
+)
+
+
+class TestJournal(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.handler = OutMessagesHandler(pipe_replay_size=10)
+        self.journal = JournalWriter(self.handler, self.directory.name, flush_interval=0.01)
+
+    async def asyncTearDown(self) -> None:
+        await self.journal.close()
+        self.directory.cleanup()
+
+    async def test_journal_pipe(self) -> None:
+        pipe = self.handler.get_pipe("PIPE")
+        pipe.transmit("before")
+        self.journal.attach("PIPE")
+        await asyncio.sleep(0)
+        pipe.transmit("after")
+        await self.handler.disable_pipe("PIPE")
+        await asyncio.sleep(0.05)
+        messages = list(JournalReader(self.directory.name, "PIPE").read())
+        self.assertEqual([msg.payload for msg in messages], ["before", "after"])
+
+    async def test_attach_unknown_pipe(self) -> None:
+        self.handler.get_pipe("PIPE")
+        with self.assertRaises(UnknownPipeError):
+            self.journal.attach("PIPE", "MISSING")
+        self.assertEqual(self.journal.attached_pipes, ())
+
+    async def test_attach_disabled_pipe(self) -> None:
+        self.handler.get_pipe("PIPE")
+        await self.handler.disable_pipe("PIPE")
+        await asyncio.sleep(0)  # the pipe is forgotten by the handler on the DISABLED event
+        with self.assertRaises(UnknownPipeError):
+            self.journal.attach("PIPE")
+
+
+if __name__ == "__main__":
+    unittest.main()
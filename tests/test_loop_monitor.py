@@ -0,0 +1,47 @@
+from __future__ import annotations
+import sys
+import os
+import asyncio
+import threading
+import time
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xoa_core.core.utils.loop_monitor import (  # noqa: E402
+    LoopMonitor,
+    LoopStall,
+)
+
+EXECUTION_ID = "12345678-1234-1234-1234-123456789abc"
+
+
+async def blocking(duration: float) -> None:
+    time.sleep(duration)
+
+
+class TestLoopMonitor(unittest.IsolatedAsyncioTestCase):
+    async def test_stall_captured(self) -> None:
+        stalls: list[LoopStall] = []
+        monitor = LoopMonitor(stalls.append, interval=0.05, threshold=0.1)
+        monitor.start()
+        await asyncio.sleep(0.1)
+        await asyncio.create_task(blocking(0.3), name=f"Suite[{EXECUTION_ID}]")
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+        self.assertEqual(len(stalls), 1)
+        self.assertGreaterEqual(stalls[0].duration, 0.1)
+        self.assertEqual(stalls[0].task, f"Suite[{EXECUTION_ID}]")
+        self.assertEqual(stalls[0].execution_id, EXECUTION_ID)
+        self.assertIn("in blocking", stalls[0].location[-1])
+
+    async def test_stop_joins_watchdog(self) -> None:
+        monitor = LoopMonitor(lambda _: None, interval=0.05, threshold=0.1)
+        monitor.start()
+        await asyncio.sleep(0.01)
+        await monitor.stop()
+        self.assertNotIn("LoopMonitorWatchdog", [thread.name for thread in threading.enumerate()])
+
+
+if __name__ == "__main__":
+    unittest.main()
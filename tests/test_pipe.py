@@ -0,0 +1,49 @@
+from __future__ import annotations
+import sys
+import os
+import asyncio
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xoa_core.core.messenger import misc  # noqa: E402
+from xoa_core.core.messenger.handler import OutMessagesHandler  # noqa: E402
+
+
+class TestPipeOverflow(unittest.IsolatedAsyncioTestCase):
+    async def test_full_pipe_never_raises(self) -> None:
+        handler = OutMessagesHandler(pipe_maxsize=2, pipe_policy=misc.EOverflowPolicy.DROP_NEWEST)
+        pipe = handler.get_pipe("PIPE")
+        for idx in range(10):
+            pipe.transmit(idx)
+            pipe.get_facade("suite").send_statistics({"idx": idx})
+        pipe.get_state_facade()("RUNNING", None)
+        self.assertGreater(handler.get_drop_counters("PIPE").pipe, 0)
+        await handler.disable_pipe("PIPE")
+
+    async def test_block_policy_refused(self) -> None:
+        with self.assertRaises(ValueError):
+            OutMessagesHandler(pipe_policy=misc.EOverflowPolicy.BLOCK)
+        handler = OutMessagesHandler()
+        with self.assertRaises(ValueError):
+            handler.get_pipe("PIPE", policy=misc.EOverflowPolicy.BLOCK)
+        self.assertEqual(handler.avaliable_pipes(), ())
+
+
+class TestPipeMetrics(unittest.IsolatedAsyncioTestCase):
+    async def test_latency_ignores_wall_clock(self) -> None:
+        handler = OutMessagesHandler()
+        pipe = handler.get_pipe("PIPE")
+        with mock.patch("time.time", return_value=0.0):  # the wall clock jumped back
+            pipe.transmit("data")
+        await asyncio.sleep(0)
+        metrics = handler.get_metrics("PIPE")
+        assert metrics is not None
+        self.assertEqual(metrics.dispatch_latency.count, 1)
+        self.assertLess(metrics.dispatch_latency.max, 1.0)
+        await handler.disable_pipe("PIPE")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+from __future__ import annotations
+import sys
+import os
+import asyncio
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xoa_core.core.messenger import misc  # noqa: E402
+from xoa_core.core.messenger.queues import MessagesQueue  # noqa: E402
+
+
+def message(seq: int, msg_type: misc.EMsgType = misc.EMsgType.DATA, **meta) -> misc.Message:
+    return misc.Message.construct(pipe_name="PIPE", seq=seq, timestamp=0.0, meta=meta, type=msg_type, payload={})
+
+
+def drain(queue: MessagesQueue) -> list[int]:
+    seqs = []
+    while not queue.empty():
+        seqs.append(queue.get_nowait().seq)
+        queue.task_done()
+    return seqs
+
+
+class TestOverflowPolicies(unittest.TestCase):
+    def test_block(self) -> None:
+        queue = MessagesQueue(2, misc.EOverflowPolicy.BLOCK)
+        queue.put_nowait(message(1))
+        queue.put_nowait(message(2))
+        with self.assertRaises(asyncio.QueueFull):
+            queue.put_nowait(message(3))
+        self.assertEqual(queue.dropped, 0)
+        self.assertEqual(drain(queue), [1, 2])
+
+    def test_drop_newest(self) -> None:
+        queue = MessagesQueue(2, misc.EOverflowPolicy.DROP_NEWEST)
+        for seq in range(1, 5):
+            queue.put_nowait(message(seq))
+        self.assertEqual(queue.dropped, 2)
+        self.assertEqual(drain(queue), [1, 2])
+
+    def test_drop_oldest(self) -> None:
+        queue = MessagesQueue(2, misc.EOverflowPolicy.DROP_OLDEST)
+        for seq in range(1, 5):
+            queue.put_nowait(message(seq))
+        self.assertEqual(queue.dropped, 2)
+        self.assertEqual(drain(queue), [3, 4])
+
+    def test_coalesce_policy(self) -> None:
+        queue = MessagesQueue(2, misc.EOverflowPolicy.COALESCE)
+        queue.put_nowait(message(1, misc.EMsgType.STATE))
+        queue.put_nowait(message(2))
+        queue.put_nowait(message(3))
+        self.assertEqual(queue.dropped, 1)
+        self.assertEqual(drain(queue), [1, 3])
+
+    def test_put_forced_ignores_capacity(self) -> None:
+        queue = MessagesQueue(1, misc.EOverflowPolicy.DROP_NEWEST)
+        queue.put_nowait(message(1))
+        queue.put_forced(message(2))
+        self.assertEqual(queue.dropped, 0)
+        self.assertEqual(drain(queue), [1, 2])
+
+
+class TestCoalescing(unittest.TestCase):
+    def test_latest_value_at_first_place(self) -> None:
+        queue = MessagesQueue(coalesce=True)
+        queue.put_nowait(message(1, misc.EMsgType.STATISTICS, suite_name="S"))
+        queue.put_nowait(message(2, misc.EMsgType.STATE, suite_name="S"))
+        queue.put_nowait(message(3, misc.EMsgType.STATISTICS, suite_name="S"))
+        self.assertEqual(queue.coalesced, 1)
+        self.assertEqual(drain(queue), [3, 2])
+
+    def test_keys_kept_apart(self) -> None:
+        queue = MessagesQueue(coalesce=True)
+        queue.put_nowait(message(1, misc.EMsgType.PROGRESS, suite_name="S", key="a"))
+        queue.put_nowait(message(2, misc.EMsgType.PROGRESS, suite_name="S", key="b"))
+        queue.put_nowait(message(3, misc.EMsgType.PROGRESS, suite_name="T", key="a"))
+        self.assertEqual(queue.coalesced, 0)
+        self.assertEqual(drain(queue), [1, 2, 3])
+
+    def test_other_types_never_coalesced(self) -> None:
+        queue = MessagesQueue(coalesce=True)
+        for seq in range(1, 4):
+            queue.put_nowait(message(seq, misc.EMsgType.WARNING, suite_name="S"))
+        self.assertEqual(drain(queue), [1, 2, 3])
+
+    def test_taken_value_not_coalesced(self) -> None:
+        queue = MessagesQueue(coalesce=True)
+        queue.put_nowait(message(1, misc.EMsgType.STATISTICS, suite_name="S"))
+        self.assertEqual(drain(queue), [1])
+        queue.put_nowait(message(2, misc.EMsgType.STATISTICS, suite_name="S"))
+        self.assertEqual(drain(queue), [2])
+        self.assertEqual(queue.coalesced, 0)
+
+
+class TestPriorityLanes(unittest.TestCase):
+    def test_state_and_error_overtake(self) -> None:
+        queue = MessagesQueue(priority=True)
+        queue.put_nowait(message(1, misc.EMsgType.STATISTICS))
+        queue.put_nowait(message(2, misc.EMsgType.WARNING))
+        queue.put_nowait(message(3, misc.EMsgType.STATE))
+        queue.put_nowait(message(4, misc.EMsgType.DATA))
+        queue.put_nowait(message(5, misc.EMsgType.ERROR))
+        self.assertEqual(drain(queue), [3, 5, 2, 1, 4])
+
+    def test_eviction_from_lowest_lane(self) -> None:
+        queue = MessagesQueue(2, misc.EOverflowPolicy.DROP_OLDEST, priority=True)
+        queue.put_nowait(message(1, misc.EMsgType.STATE))
+        queue.put_nowait(message(2, misc.EMsgType.STATISTICS))
+        queue.put_nowait(message(3, misc.EMsgType.STATE))
+        self.assertEqual(queue.dropped, 1)
+        self.assertEqual(drain(queue), [1, 3])
+
+    def test_end_of_stream_last(self) -> None:
+        queue = MessagesQueue(priority=True)
+        queue.put_nowait(message(1))
+        queue.put_forced(None)
+        queue.put_nowait(message(2, misc.EMsgType.STATE))
+        self.assertEqual(queue.get_nowait().seq, 2)
+        self.assertEqual(queue.get_nowait().seq, 1)
+        self.assertIsNone(queue.get_nowait())
+
+    def test_requeue_to_lane_head(self) -> None:
+        queue = MessagesQueue(priority=True)
+        queue.put_nowait(message(1, misc.EMsgType.WARNING))
+        queue.put_nowait(message(2, misc.EMsgType.WARNING))
+        first = queue.get_nowait()
+        queue.task_done()
+        queue.requeue(first)
+        self.assertEqual(queue.requeued, 1)
+        self.assertEqual(drain(queue), [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
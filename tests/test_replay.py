@@ -0,0 +1,60 @@
+from __future__ import annotations
+import sys
+import os
+import asyncio
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xoa_core.core.messenger import misc  # noqa: E402
+from xoa_core.core.messenger.handler import OutMessagesHandler  # noqa: E402
+
+
+async def collect(stream, amount: int) -> list[int]:
+    seqs = []
+    async for msg in stream:
+        seqs.append(msg.seq)
+        if len(seqs) == amount:
+            break
+    return seqs
+
+
+class TestReplay(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.handler = OutMessagesHandler(pipe_replay_size=3)
+        self.pipe = self.handler.get_pipe("PIPE")
+        for idx in range(5):
+            self.pipe.transmit(idx)
+        await asyncio.sleep(0)  # let the worker dispatch them
+
+    async def asyncTearDown(self) -> None:
+        await self.handler.disable_pipe("PIPE")
+
+    async def test_replay_from(self) -> None:
+        stream = self.handler.changes("PIPE", replay_from=4)
+        self.assertEqual(await collect(stream, 2), [4, 5])
+
+    async def test_replay_last(self) -> None:
+        stream = self.handler.changes("PIPE", replay_last=2)
+        self.assertEqual(await collect(stream, 2), [4, 5])
+
+    async def test_history_bounded(self) -> None:
+        stream = self.handler.changes("PIPE", replay_from=0)
+        self.assertEqual(await collect(stream, 3), [3, 4, 5])
+
+    async def test_replay_then_live(self) -> None:
+        stream = self.handler.changes("PIPE", replay_last=1)
+        task = asyncio.create_task(collect(stream, 2))
+        await asyncio.sleep(0)
+        self.pipe.transmit(5)
+        self.assertEqual(await task, [5, 6])
+
+    async def test_replay_filtered(self) -> None:
+        self.pipe.transmit("warn", msg_type=misc.EMsgType.WARNING)
+        await asyncio.sleep(0)
+        stream = self.handler.changes("PIPE", _filter={misc.EMsgType.WARNING}, replay_from=0)
+        self.assertEqual(await collect(stream, 1), [6])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+from __future__ import annotations
+import sys
+import os
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xoa_core.core.messenger import misc  # noqa: E402
+from xoa_core.core.messenger.routing import SubscriptionFilter  # noqa: E402
+
+
+def message(**meta) -> misc.Message:
+    return misc.Message.construct(pipe_name="PIPE", seq=1, timestamp=0.0, meta=meta, type=misc.EMsgType.DATA, payload={})
+
+
+class TestSubscriptionFilter(unittest.TestCase):
+    def test_meta_value(self) -> None:
+        flt = SubscriptionFilter.build(meta={"port": {"0/0", "0/1"}})
+        assert flt is not None
+        self.assertTrue(flt.matches(message(port="0/1")))
+        self.assertFalse(flt.matches(message(port="0/2")))
+        self.assertFalse(flt.matches(message()))
+
+    def test_unhashable_meta_value(self) -> None:
+        flt = SubscriptionFilter.build(meta={"port": {"0/0", "0/1"}})
+        assert flt is not None
+        self.assertFalse(flt.matches(message(port=["0/0"])))
+        self.assertFalse(flt.matches(message(port={"module": 0})))
+
+
+if __name__ == "__main__":
+    unittest.main()
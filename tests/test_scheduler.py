@@ -0,0 +1,76 @@
+from __future__ import annotations
+import sys
+import os
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xoa_core.core.executors.executor import SuiteExecutor  # noqa: E402
+from xoa_core.core.executors.scheduler import ExecutionScheduler  # noqa: E402
+
+
+def executor(name: str, ports: tuple[str, ...] = (), testers: tuple[str, ...] = ()) -> SuiteExecutor:
+    ex = SuiteExecutor(name)
+    ex.port_identities = frozenset(ports)
+    ex.tester_ids = frozenset(testers)
+    return ex
+
+
+def names(executors: list[SuiteExecutor]) -> list[str]:
+    return [ex.suite_name for ex in executors]
+
+
+class TestExecutionScheduler(unittest.TestCase):
+    def test_priority_then_submission_order(self) -> None:
+        scheduler = ExecutionScheduler()
+        scheduler.submit(executor("A"))
+        scheduler.submit(executor("B"), priority=1)
+        scheduler.submit(executor("C"))
+        self.assertEqual([info.suite_name for info in scheduler.get_info()], ["B", "A", "C"])
+        self.assertEqual(names(scheduler.pop_ready(())), ["B", "A", "C"])
+        self.assertEqual(len(scheduler), 0)
+
+    def test_max_running(self) -> None:
+        scheduler = ExecutionScheduler(max_running=2)
+        running = [executor("R")]
+        for name in "ABC":
+            scheduler.submit(executor(name))
+        self.assertEqual(names(scheduler.pop_ready(running)), ["A"])
+        self.assertEqual(len(scheduler), 2)
+
+    def test_max_per_tester(self) -> None:
+        scheduler = ExecutionScheduler(max_per_tester=1)
+        running = [executor("R", testers=("T1",))]
+        scheduler.submit(executor("A", testers=("T1",)))
+        scheduler.submit(executor("B", testers=("T2",)))
+        scheduler.submit(executor("C", testers=("T2",)))
+        self.assertEqual(names(scheduler.pop_ready(running)), ["B"])
+        self.assertEqual(names(scheduler.pop_ready(())), ["A", "C"])
+
+    def test_busy_ports(self) -> None:
+        scheduler = ExecutionScheduler()
+        running = [executor("R", ports=("P-0-0-0",))]
+        scheduler.submit(executor("A", ports=("P-0-0-0", "P-0-0-1")))
+        scheduler.submit(executor("B", ports=("P-0-0-2",)))
+        self.assertEqual(names(scheduler.pop_ready(running)), ["B"])
+        self.assertEqual(names(scheduler.pop_ready(())), ["A"])
+
+    def test_blocked_execution_keeps_its_ports(self) -> None:
+        scheduler = ExecutionScheduler()
+        running = [executor("R", ports=("P-0-0-0",))]
+        scheduler.submit(executor("A", ports=("P-0-0-0", "P-0-0-1")), priority=1)
+        scheduler.submit(executor("B", ports=("P-0-0-1",)))
+        self.assertEqual(names(scheduler.pop_ready(running)), [])
+
+    def test_cancel(self) -> None:
+        scheduler = ExecutionScheduler()
+        ex = executor("A")
+        scheduler.submit(ex)
+        self.assertIn(ex.id, scheduler)
+        self.assertIs(scheduler.cancel(ex.id), ex)
+        self.assertIsNone(scheduler.cancel(ex.id))
+        self.assertEqual(scheduler.pop_ready(()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
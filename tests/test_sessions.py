@@ -0,0 +1,216 @@
+from __future__ import annotations
+import sys
+import os
+import asyncio
+import unittest
+from typing import Any
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xoa_core.core.executors._events import Event  # noqa: E402
+from xoa_core.core.executors.executor import SuiteExecutor  # noqa: E402
+from xoa_core.core.executors.executor_state import EOutcome  # noqa: E402
+from xoa_core.core.messenger.handler import OutMessagesHandler  # noqa: E402
+from xoa_core.core.resources.sessions import SessionPool  # noqa: E402
+
+
+class Reservable:
+    def __init__(self, name: str, log: list[str], reserved: bool = False) -> None:
+        self.name = name
+        self.log = log
+        self.reserved = reserved
+        self.reservation = self
+
+    def is_reserved_by_me(self) -> bool:
+        return self.reserved
+
+    async def set_release(self) -> None:
+        self.reserved = False
+        self.log.append(self.name)
+
+
+class Session:
+    def __init__(self) -> None:
+        self.is_online = False
+        self.logoffs = 0
+
+    async def logoff(self) -> None:
+        self.is_online = False
+        self.logoffs += 1
+
+
+class Module(Reservable):
+    def __init__(self, log: list[str]) -> None:
+        super().__init__("module", log)
+        self.ports = (Reservable("port-0", log), Reservable("port-1", log))
+
+
+class Tester(Reservable):
+    def __init__(self) -> None:
+        super().__init__("tester", [])
+        self.session = Session()
+        self.modules = (Module(self.log),)
+
+    def login(self) -> Tester:
+        self.session.is_online = True
+        return self
+
+
+class Resource:
+    def __init__(self, id: str) -> None:
+        self.id = id
+        self.sessions: list[Tester] = []
+
+    def prepare_session(self, username: str, debug: bool = False) -> Tester:
+        tester = Tester()
+        self.sessions.append(tester)
+        return tester
+
+
+class TestSessionPool(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.pool = SessionPool(max_size=4, idle_timeout=60)
+        self.resource = Resource("T1")
+
+    async def asyncTearDown(self) -> None:
+        await self.pool.close()
+
+    async def release(self, owner: str) -> None:
+        self.pool.release(owner)
+        await asyncio.sleep(0.01)  # the sessions are reset in the background
+
+    async def test_lease_gives_the_real_testers(self) -> None:
+        testers = self.pool.lease("A", (self.resource,), "user")
+        self.assertEqual(list(testers), ["T1"])
+        self.assertIs(testers["T1"], self.resource.sessions[0])
+        self.assertIsInstance(testers["T1"], Tester)
+        self.assertEqual(len(self.pool), 1)
+
+    async def test_healthy_session_is_reused(self) -> None:
+        tester = self.pool.lease("A", (self.resource,), "user")["T1"].login()
+        await self.release("A")
+        self.assertEqual(self.pool.idle, 1)
+        self.assertIs(self.pool.lease("B", (self.resource,), "user")["T1"], tester)
+        self.assertIsNot(self.pool.lease("C", (self.resource,), "other")["T1"], tester)
+        self.assertEqual(len(self.resource.sessions), 2)
+
+    async def test_release_resets_reservations(self) -> None:
+        tester = self.pool.lease("A", (self.resource,), "user")["T1"].login()
+        tester.reserved = True
+        tester.modules[0].reserved = True
+        tester.modules[0].ports[1].reserved = True
+        await self.release("A")
+        self.assertEqual(tester.log, ["port-1", "module", "tester"])
+        self.assertEqual(self.pool.idle, 1)
+
+    async def test_failed_reset_closes_session(self) -> None:
+        tester = self.pool.lease("A", (self.resource,), "user")["T1"].login()
+        tester.modules[0].ports[0].reserved = True
+
+        async def broken() -> None:
+            raise ConnectionError()
+
+        tester.modules[0].ports[0].set_release = broken  # type: ignore[method-assign]
+        await self.release("A")
+        self.assertEqual(self.pool.idle, 0)
+        self.assertEqual(tester.session.logoffs, 1)
+
+    async def test_broken_session_is_dropped(self) -> None:
+        unused = self.pool.lease("A", (self.resource,), "user")["T1"]
+        await self.release("A")  # never logged in
+        self.assertEqual(self.pool.idle, 0)
+        tester = self.pool.lease("B", (self.resource,), "user")["T1"].login()
+        self.assertIsNot(tester, unused)
+        await self.release("B")
+        tester.session.is_online = False  # the connection is lost while idle
+        self.assertIsNot(self.pool.lease("C", (self.resource,), "user")["T1"], tester)
+        self.assertEqual(len(self.resource.sessions), 3)
+
+    async def test_max_size_and_close(self) -> None:
+        resources = [Resource(f"T{idx}") for idx in range(6)]
+        for owner, resource in enumerate(resources):
+            self.pool.lease(str(owner), (resource,), "user")[resource.id].login()
+        for owner in range(6):
+            await self.release(str(owner))
+        self.assertEqual(self.pool.idle, 4)
+        self.assertEqual([r.sessions[0].session.logoffs for r in resources[:2]], [1, 1])
+        await self.pool.close()
+        self.assertEqual(self.pool.idle, 0)
+        self.assertTrue(all(r.sessions[0].session.logoffs == 1 for r in resources))
+
+
+class Suite:
+    def __init__(self, testers: dict[str, Any]) -> None:
+        self.testers = testers
+
+    async def start(self) -> None:
+        return None
+
+
+class Params:
+    port_identities: list[Any] = []
+    get_testers_ids = {"T1"}
+
+
+class Plugin:
+    params = Params()
+
+    def __init__(self) -> None:
+        self.testers: dict[str, Any] = {}
+        self.suites: list[Suite] = []
+
+    def create_test_suite(self, state_conditions: Any, xoa_out: Any) -> Suite:
+        if self.testers is None:
+            raise ValueError("no testers")
+        self.suites.append(Suite(self.testers))
+        return self.suites[-1]
+
+
+class Observer:
+    def __init__(self) -> None:
+        self.stopped = asyncio.Event()
+
+    def emit(self, event: Event, *args: Any) -> None:
+        if event is Event.STOPPED:
+            self.stopped.set()
+
+
+class TestLeasedExecution(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.pool = SessionPool()
+        self.resource = Resource("T1")
+        self.handler = OutMessagesHandler()
+        self.plugin = Plugin()
+        self.executor = SuiteExecutor("suite")
+        self.executor.assign_pipe(self.handler.get_pipe(self.executor.id))
+
+    def lease(self) -> None:
+        self.plugin.testers = self.pool.lease(self.executor.id, (self.resource,), "user")
+
+    async def run_executor(self) -> None:
+        observer = Observer()
+        self.executor.run(observer)  # type: ignore[arg-type]
+        await observer.stopped.wait()
+
+    async def test_suite_created_with_leased_testers(self) -> None:
+        self.executor.assign_plugin(self.plugin, lease=self.lease, release=lambda: self.pool.release(self.executor.id))  # type: ignore[arg-type]
+        self.assertEqual(self.plugin.suites, [])
+        await self.run_executor()
+        self.assertIs(self.plugin.suites[0].testers["T1"], self.resource.sessions[0])
+        self.assertEqual(len(self.pool), 0)
+        self.assertEqual(self.executor.outcome, EOutcome.COMPLETED)
+
+    async def test_failed_creation_fails_execution(self) -> None:
+        released: list[bool] = []
+
+        def lease() -> None:
+            self.plugin.testers = None  # type: ignore[assignment]
+
+        self.executor.assign_plugin(self.plugin, lease=lease, release=lambda: released.append(True))  # type: ignore[arg-type]
+        await self.run_executor()
+        self.assertEqual(self.executor.outcome, EOutcome.FAILED)
+        self.assertEqual(released, [True])
+
+
+if __name__ == "__main__":
+    unittest.main()
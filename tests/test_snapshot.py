@@ -0,0 +1,88 @@
+from __future__ import annotations
+import sys
+import os
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import SecretStr  # noqa: E402
+
+from xoa_core.core.resources.resource.models.module import ModuleModel  # noqa: E402
+from xoa_core.core.resources.resource.models.port import PortModel  # noqa: E402
+from xoa_core.core.resources.resource.models.tester import TesterModel  # noqa: E402
+from xoa_core.core.resources.resource.models.types import (  # noqa: E402
+    EProductType,
+    ModuleID,
+    PortID,
+    TesterID,
+)
+
+
+def port(module_id: str, index: int) -> PortModel:
+    return PortModel(id=PortID(f"{module_id}-{index}"), index=index, model="P", reserved_by="")
+
+
+def module(tester_id: str, index: int, ports: int = 2) -> ModuleModel:
+    module_id = f"{tester_id}-{index}"
+    return ModuleModel(
+        id=ModuleID(module_id),
+        index=index,
+        model="M",
+        reserved_by="",
+        ports=tuple(port(module_id, p) for p in range(ports)),
+        serial_number=index,
+    )
+
+
+def tester(modules: int = 2) -> TesterModel:
+    inst = TesterModel(id=TesterID("t"), product=EProductType.VALKYRIE, host="h", port=22606, password=SecretStr("xena"))
+    inst.modules = tuple(module("t", m) for m in range(modules))
+    return inst
+
+
+class TestSnapshot(unittest.TestCase):
+    def test_info_is_cached(self) -> None:
+        model = tester()
+        self.assertIs(model.info(), model.info())
+        self.assertIs(model.info().modules[0], model.modules[0].info())
+
+    def test_change_invalidates_parents_only(self) -> None:
+        model = tester()
+        tester_info = model.info()
+        changed, sibling = model.modules[0].ports
+        module_info, other_module_info = model.modules[0].info(), model.modules[1].info()
+        port_info, sibling_info = changed.info(), sibling.info()
+
+        changed.reserved_by = "user"
+
+        self.assertIsNot(model.info(), tester_info)
+        self.assertIsNot(model.modules[0].info(), module_info)
+        self.assertIsNot(changed.info(), port_info)
+        self.assertEqual(model.info().modules[0].ports[0].reserved_by, "user")
+        self.assertIs(sibling.info(), sibling_info)
+        self.assertIs(model.modules[1].info(), other_module_info)
+
+    def test_equal_value_keeps_cache(self) -> None:
+        model = tester()
+        tester_info = model.info()
+        model.modules[0].ports[0].reserved_by = ""
+        model.name = " - "
+        self.assertIs(model.info(), tester_info)
+
+    def test_info_is_validated(self) -> None:
+        model = tester()
+        model.modules[0].ports[0].sync_status = 1  # type: ignore[assignment]
+        self.assertIs(model.info().modules[0].ports[0].sync_status, True)
+
+    def test_info_is_frozen(self) -> None:
+        model = tester()
+        info = model.info()
+        with self.assertRaises(TypeError):
+            info.reserved_by = "user"
+        with self.assertRaises(TypeError):
+            info.modules[0].ports[0].reserved_by = "user"
+        self.assertEqual(model.info().reserved_by, "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+import sys
+import os
+import asyncio
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xoa_core.core.messenger import misc  # noqa: E402
+from xoa_core.core.messenger.handler import OutMessagesHandler  # noqa: E402
+
+
+class TestPatternWatchers(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.handler = OutMessagesHandler()
+        self.received: list[misc.Message] = []
+
+    async def watch(self, *patterns: str, **kwargs) -> asyncio.Task:
+        async def consume() -> None:
+            async for msg in self.handler.changes_matching(*patterns, **kwargs):
+                self.received.append(msg)
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        return task
+
+    async def stop(self, task: asyncio.Task) -> None:
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+    async def test_existing_and_later_pipes(self) -> None:
+        self.handler.get_pipe("exec-1")
+        self.handler.get_pipe("other")
+        task = await self.watch("exec-*")
+        self.handler.get_pipe("exec-2").transmit("late")
+        await asyncio.sleep(0.01)
+        await self.handler.disable_pipe("exec-2")
+        await asyncio.sleep(0.01)
+        events = [(msg.pipe_name, msg.payload.event) for msg in self.received if msg.type is misc.EMsgType.PIPE]
+        self.assertEqual(events, [
+            ("exec-1", misc.EPipeEvent.CREATED),
+            ("exec-2", misc.EPipeEvent.CREATED),
+            ("exec-2", misc.EPipeEvent.DISABLED),
+        ])
+        self.assertEqual([msg.payload for msg in self.received if msg.type is misc.EMsgType.DATA], ["late"])
+        await self.stop(task)
+
+    async def test_type_filter_skips_pipe_events(self) -> None:
+        task = await self.watch("*", _filter={misc.EMsgType.DATA})
+        self.handler.get_pipe("exec-1").transmit("data")
+        await asyncio.sleep(0.01)
+        self.assertEqual([msg.type for msg in self.received], [misc.EMsgType.DATA])
+        await self.stop(task)
+
+    async def test_shared_queue_drops_counted_once(self) -> None:
+        pipes = [self.handler.get_pipe(f"exec-{idx}") for idx in range(3)]
+        watched = self.handler.changes_matching("exec-*", _filter={misc.EMsgType.DATA}, maxsize=1, policy=misc.EOverflowPolicy.DROP_NEWEST)
+        task = asyncio.create_task(watched.__anext__())
+        await asyncio.sleep(0)
+        for pipe in pipes:
+            pipe.transmit("a")
+            pipe.transmit("b")
+        await asyncio.sleep(0.01)
+        await task
+        await asyncio.sleep(0.01)
+        counters = [self.handler.get_drop_counters(pipe.name).subscribers for pipe in pipes]
+        await watched.aclose()
+        total = sum(self.handler.get_drop_counters(pipe.name).subscribers for pipe in pipes)
+        self.assertGreater(sum(counters), 0)
+        self.assertLessEqual(sum(counters), 5)  # 6 messages, at least one received
+        self.assertEqual(total, sum(counters))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,20 +1,33 @@
 from __future__ import annotations
 
+import functools
 import typing
 from pathlib import Path
 
 from typing_extensions import Self
 
 from .core import const
-from .core.executors.executor import SuiteExecutor
+from .core.exceptions import BulkStartError
+from .core.executors.executor import DRAIN_TIMEOUT, SuiteExecutor
 from .core.executors.manager import ExecutorsManager
-from .core.executors.executor_info import ExecutorInfo
+from .core.executors.executor_info import ActionResult, ExecutorInfo
+from .core.executors.executor_state import EOutcome
+from .core.executors.history import ExecutionHistory, ExecutionRecord, StateTransition
+from .core.executors.isolated import IsolatedPlugin
+from .core.executors.scheduler import ScheduledExecutionInfo
+from .core.messenger.groups import Delivery
 from .core.messenger.handler import OutMessagesHandler
-from .core.messenger.misc import Message
+from .core.messenger.journal import JournalWriter
+from .core.messenger.metrics import PipeMetrics
+from .core.messenger.misc import DropCounters, EOverflowPolicy, Message
+from .core.messenger.server import MessagesServer
+from .core.utils.histogram import HistogramSnapshot
+from .core.utils.loop_monitor import LoopMonitor, LoopStall
 from .core.resources.controller import ResourcesController
 from .core.resources.storage import PrecisionStorage
 from .core.resources.types import Credentials, TesterInfoModel
 from .core.test_suites.controller import PluginController
+from .core.test_suites.datasets import Plugin
 from .types import TesterID
 
 if typing.TYPE_CHECKING:
@@ -24,35 +37,361 @@ if typing.TYPE_CHECKING:
 class MainController:
     """MainController - A main class of XOA-Core framework."""
 
-    __slots__ = ("__is_started", "__publisher", "__resources", "suites_library", "__execution_manager")
-
-    def __init__(self, *, storage_path: Path | str | None = None, mono: bool = False) -> None:
+    __slots__ = ("__is_started", "__publisher", "__resources", "suites_library", "__execution_manager", "__drain_timeout", "__loop_monitor", "__history")
+
+    def __init__(
+        self,
+        *,
+        storage_path: Path | str | None = None,
+        mono: bool = False,
+        pipe_maxsize: int = 0,
+        pipe_policy: EOverflowPolicy = EOverflowPolicy.DROP_OLDEST,
+        pipe_coalesce: bool = False,
+        pipe_priority: bool = False,
+        pipe_replay_size: int = 0,
+        measure_message_bytes: bool = False,
+        execution_drain_timeout: float | None = DRAIN_TIMEOUT,
+        max_running_executions: int | None = None,
+        max_executions_per_tester: int | None = None,
+        loop_stall_threshold: float | None = None,
+        history_path: Path | str | None = None,
+        tester_connect_concurrency: int | None = 32,
+        tester_connect_timeout: float | None = 30.0,
+        tester_delta_events: bool = False,
+        tester_change_window: float = 0.0,
+        session_pool_size: int = 0,
+        session_idle_timeout: float = 300.0,
+    ) -> None:
         self.__is_started = False
+        self.__drain_timeout = execution_drain_timeout
         __storage_path = Path.cwd() / "store" if not storage_path else Path(storage_path)
 
-        self.__publisher = OutMessagesHandler()
+        self.__publisher = OutMessagesHandler(
+            pipe_maxsize=pipe_maxsize,
+            pipe_policy=pipe_policy,
+            pipe_coalesce=pipe_coalesce,
+            pipe_priority=pipe_priority,
+            pipe_replay_size=pipe_replay_size,
+            measure_bytes=measure_message_bytes,
+        )
         resources_pipe = self.__publisher.get_pipe(const.PIPE_RESOURCES)
         storage = PrecisionStorage(str(__storage_path))
-        self.__resources = ResourcesController(resources_pipe, storage)
+        self.__resources = ResourcesController(
+            resources_pipe,
+            storage,
+            connect_concurrency=tester_connect_concurrency,
+            connect_timeout=tester_connect_timeout,
+            delta_events=tester_delta_events,
+            change_window=tester_change_window,
+            session_pool_size=session_pool_size,
+            session_idle_timeout=session_idle_timeout,
+        )
 
         executor_pipe = self.__publisher.get_pipe(const.PIPE_EXECUTOR)
-        self.__execution_manager = ExecutorsManager(executor_pipe, mono)
+        self.__history = ExecutionHistory(history_path) if history_path else None
+        self.__execution_manager = ExecutorsManager(
+            executor_pipe,
+            mono,
+            max_running=max_running_executions,
+            max_per_tester=max_executions_per_tester,
+            history=self.__history,
+        )
 
         self.suites_library = PluginController()
+        self.__loop_monitor = LoopMonitor(self.__on_loop_stall, threshold=loop_stall_threshold) if loop_stall_threshold else None
+
+    def listen_changes(
+        self,
+        *names: str,
+        _filter: set["EMsgType"] | None = None,
+        meta: typing.Mapping[str, typing.Any] | None = None,
+        payload_keys: typing.Iterable[str] | None = None,
+        maxsize: int = 0,
+        policy: EOverflowPolicy = EOverflowPolicy.BLOCK,
+        coalesce: bool = False,
+        priority: bool = False,
+        replay_from: int | None = None,
+        replay_last: int | None = None
+    ) -> typing.AsyncGenerator[Message, None]:
+        """Subscribe to the messages from different subsystems and test-suites.
+
+        :param meta: accepted value, or a collection of values, per message meta field, e.g. ``{"suite_name": "RFC-2544"}``
+        :type meta: Mapping[str, Any] | None
+        :param payload_keys: keys the message payload must contain
+        :type payload_keys: Iterable[str] | None
+        :param maxsize: capacity of the subscriber queue, 0 is unbounded
+        :type maxsize: int
+        :param policy: behaviour of the subscriber queue when the capacity is reached
+        :type policy: EOverflowPolicy
+        :param coalesce: keep only the latest pending STATISTICS and PROGRESS message per suite and key
+        :type coalesce: bool
+        :param priority: deliver STATE and ERROR messages first, then WARNING and then the rest of the messages
+        :type priority: bool
+        :param replay_from: replay the recent messages starting from this sequence number
+        :type replay_from: int | None
+        :param replay_last: replay up to this amount of the recent messages
+        :type replay_last: int | None
+        """
+        return self.__publisher.changes(
+            *names,
+            _filter=_filter,
+            meta=meta,
+            payload_keys=payload_keys,
+            maxsize=maxsize,
+            policy=policy,
+            coalesce=coalesce,
+            priority=priority,
+            replay_from=replay_from,
+            replay_last=replay_last
+        )
+
+    def listen_changes_batched(
+        self,
+        *names: str,
+        _filter: set["EMsgType"] | None = None,
+        meta: typing.Mapping[str, typing.Any] | None = None,
+        payload_keys: typing.Iterable[str] | None = None,
+        max_batch: int = 100,
+        max_wait: float = 0.05,
+        maxsize: int = 0,
+        policy: EOverflowPolicy = EOverflowPolicy.BLOCK,
+        coalesce: bool = False,
+        priority: bool = False,
+        replay_from: int | None = None,
+        replay_last: int | None = None
+    ) -> typing.AsyncGenerator[list[Message], None]:
+        """Subscribe to the messages from different subsystems and test-suites, receiving them in batches.
+
+        :param meta: accepted value, or a collection of values, per message meta field, e.g. ``{"suite_name": "RFC-2544"}``
+        :type meta: Mapping[str, Any] | None
+        :param payload_keys: keys the message payload must contain
+        :type payload_keys: Iterable[str] | None
+        :param max_batch: maximum amount of messages in one batch
+        :type max_batch: int
+        :param max_wait: maximum time in seconds to wait for filling of a batch after its first message is received
+        :type max_wait: float
+        :param maxsize: capacity of the subscriber queue, 0 is unbounded
+        :type maxsize: int
+        :param policy: behaviour of the subscriber queue when the capacity is reached
+        :type policy: EOverflowPolicy
+        :param coalesce: keep only the latest pending STATISTICS and PROGRESS message per suite and key
+        :type coalesce: bool
+        :param priority: deliver STATE and ERROR messages first, then WARNING and then the rest of the messages
+        :type priority: bool
+        :param replay_from: replay the recent messages starting from this sequence number
+        :type replay_from: int | None
+        :param replay_last: replay up to this amount of the recent messages
+        :type replay_last: int | None
+        """
+        return self.__publisher.changes_batched(
+            *names,
+            _filter=_filter,
+            meta=meta,
+            payload_keys=payload_keys,
+            max_batch=max_batch,
+            max_wait=max_wait,
+            maxsize=maxsize,
+            policy=policy,
+            coalesce=coalesce,
+            priority=priority,
+            replay_from=replay_from,
+            replay_last=replay_last
+        )
+
+    def listen_matching(
+        self,
+        *patterns: str,
+        _filter: set["EMsgType"] | None = None,
+        meta: typing.Mapping[str, typing.Any] | None = None,
+        payload_keys: typing.Iterable[str] | None = None,
+        maxsize: int = 0,
+        policy: EOverflowPolicy = EOverflowPolicy.BLOCK,
+        coalesce: bool = False,
+        priority: bool = False,
+        replay_from: int | None = None,
+        replay_last: int | None = None
+    ) -> typing.AsyncGenerator[Message, None]:
+        """Subscribe to the messages of all subsystems and test-suites with the names matching the shell-style patterns,
+        including those started after the subscription. Start and end of each of them is delivered as a PIPE message.
+
+        :param patterns: patterns of the names, `const.EXECUTIONS_PATTERN` matches all test-suite executions
+        :type patterns: str
+        :param meta: accepted value, or a collection of values, per message meta field, e.g. ``{"suite_name": "RFC-2544"}``
+        :type meta: Mapping[str, Any] | None
+        :param payload_keys: keys the message payload must contain
+        :type payload_keys: Iterable[str] | None
+        :param maxsize: capacity of the subscriber queue, 0 is unbounded
+        :type maxsize: int
+        :param policy: behaviour of the subscriber queue when the capacity is reached
+        :type policy: EOverflowPolicy
+        :param coalesce: keep only the latest pending STATISTICS and PROGRESS message per suite and key
+        :type coalesce: bool
+        :param priority: deliver STATE and ERROR messages first, then WARNING and then the rest of the messages
+        :type priority: bool
+        :param replay_from: replay the recent messages of the existing pipes starting from this sequence number
+        :type replay_from: int | None
+        :param replay_last: replay up to this amount of the recent messages of each existing pipe
+        :type replay_last: int | None
+        """
+        return self.__publisher.changes_matching(
+            *patterns,
+            _filter=_filter,
+            meta=meta,
+            payload_keys=payload_keys,
+            maxsize=maxsize,
+            policy=policy,
+            coalesce=coalesce,
+            priority=priority,
+            replay_from=replay_from,
+            replay_last=replay_last
+        )
+
+    def listen_group(
+        self,
+        group: str,
+        *names: str,
+        _filter: set["EMsgType"] | None = None,
+        meta: typing.Mapping[str, typing.Any] | None = None,
+        payload_keys: typing.Iterable[str] | None = None,
+        prefetch: int = 10,
+        maxsize: int = 0,
+        policy: EOverflowPolicy = EOverflowPolicy.BLOCK,
+        coalesce: bool = False,
+        priority: bool = False
+    ) -> typing.AsyncGenerator[Delivery, None]:
+        """Join a consumer group, the messages are load-balanced between the members of the group.
+        Each delivery must be acknowledged with `ack()`, or rejected with `nack()` for being delivered again.
+
+        :param group: name of the group, members listening to the same names share the group
+        :type group: str
+        :param prefetch: maximum amount of unacknowledged deliveries of the member
+        :type prefetch: int
+        :param maxsize: capacity of the group queue, 0 is unbounded, defined by the first member
+        :type maxsize: int
+        :param policy: behaviour of the group queue when the capacity is reached, defined by the first member
+        :type policy: EOverflowPolicy
+        """
+        return self.__publisher.group_changes(
+            group,
+            *names,
+            _filter=_filter,
+            meta=meta,
+            payload_keys=payload_keys,
+            prefetch=prefetch,
+            maxsize=maxsize,
+            policy=policy,
+            coalesce=coalesce,
+            priority=priority
+        )
+
+    def dropped_messages(self, name: str) -> DropCounters | None:
+        """Counters of messages discarded by the overflow policies of a pipe and its subscribers.
+
+        :param name: name of the subsystem or test execution id
+        :type name: str
+        :return: drop counters or None if the pipe is not exists
+        :rtype: DropCounters | None
+        """
+        return self.__publisher.get_drop_counters(name)
+
+    def messenger_metrics(self, name: str | None = None) -> dict[str, PipeMetrics]:
+        """Snapshot of the message pipes metrics: dispatch latency, queue depths, throughput and lag of the subscribers.
 
-    def listen_changes(self, *names: str, _filter: set["EMsgType"] | None = None) -> typing.AsyncGenerator[Message, None]:
-        """Subscribe to the messages from different subsystems and test-suites."""
-        return self.__publisher.changes(*names, _filter=_filter)
+        :param name: name of the pipe, if not provided all pipes are included
+        :type name: str | None
+        :return: metrics per pipe name
+        :rtype: dict[str, PipeMetrics]
+        """
+        if name is None:
+            return self.__publisher.metrics_snapshot()
+        metrics = self.__publisher.get_metrics(name)
+        return {name: metrics} if metrics else {}
+
+    async def serve_messages(
+        self,
+        path: Path | str,
+        *,
+        client_buffer: int = 1000,
+        policy: EOverflowPolicy = EOverflowPolicy.DROP_OLDEST
+    ) -> MessagesServer:
+        """Expose the message pipes to other processes over a local Unix domain socket.
+
+        :param path: path of the socket file
+        :type path: Path | str
+        :param client_buffer: capacity of the subscriber queue of each client
+        :type client_buffer: int
+        :param policy: behaviour of the client queue when the capacity is reached
+        :type policy: EOverflowPolicy
+        :return: started server, must be closed by the user
+        :rtype: MessagesServer
+        """
+        server = MessagesServer(self.__publisher, path, client_buffer=client_buffer, policy=policy)
+        await server.start()
+        return server
+
+    def create_journal(
+        self,
+        path: Path | str,
+        *,
+        segment_size: int = 64 * 1024 * 1024,
+        flush_interval: float = 0.5
+    ) -> JournalWriter:
+        """Create an append-only on-disk journal of the message pipes.
+
+        Pipes are journaled after they are attached with ``journal.attach(<pipe_name>, ...)``,
+        journaled messages can be read with ``JournalReader(path, <pipe_name>)``.
+
+        :param path: directory of the journal
+        :type path: Path | str
+        :param segment_size: size in bytes after which a new segment file is started
+        :type segment_size: int
+        :param flush_interval: maximum time in seconds the messages are waiting for being written
+        :type flush_interval: float
+        :return: journal writer, must be closed by the user
+        :rtype: JournalWriter
+        """
+        return JournalWriter(self.__publisher, path, segment_size=segment_size, flush_interval=flush_interval)
 
     def __await__(self) -> typing.Generator[typing.Any, None, Self]:
         return self.__setup().__await__()
 
     async def __setup(self) -> Self:
         if not self.__is_started:
+            if self.__loop_monitor:
+                self.__loop_monitor.start()
             await self.__resources.start()
             self.__is_started = True
         return self
 
+    async def close(self) -> None:
+        """
+        Stop the event loop monitoring and the test suite executions, the scheduled ones are discarded,
+        wait till the messages of the executions are delivered, close the idle tester sessions and the execution history.
+
+        The stopping of the executions and the delivery of their messages are bounded by the `execution_drain_timeout`.
+        """
+        if self.__loop_monitor:
+            await self.__loop_monitor.stop()
+        await self.__execution_manager.close(self.__drain_timeout)
+        await self.__resources.close()
+        if self.__history:
+            self.__history.close()
+        self.__is_started = False
+
+    def __on_loop_stall(self, stall: LoopStall) -> None:
+        blocker = f" by the task {stall.task}" if stall.task else ""
+        meta = stall.dict(exclude_none=True)
+        self.__publisher.get_pipe(const.PIPE_EXECUTOR).transmit_warn(f"Event loop was blocked for {stall.duration:.3f} sec{blocker}", **meta)
+
+    def loop_lag(self) -> HistogramSnapshot | None:
+        """Distribution of the event loop lag in seconds, stalls longer than `loop_stall_threshold`
+        are reported as warnings on the PIPE_EXECUTOR, the blocking task and the execution it is belong to are in the message meta.
+
+        :return: histogram of the lag, None if the monitoring is disabled
+        :rtype: HistogramSnapshot | None
+        """
+        return self.__loop_monitor.lag if self.__loop_monitor else None
+
     def register_lib(self, path: str | Path) -> None:
         """Register lookup path of custom test suites library.
 
@@ -96,6 +435,15 @@ class MainController:
         """
         return await self.__resources.get_tester_info(tester_id)
 
+    async def publish_testers_snapshot(self, *tester_ids: TesterID) -> None:
+        """Publish the whole info of the testers on the PIPE_RESOURCES as SNAPSHOT messages, by default of all known testers.
+        Used to resynchronize the state of the testers when the CHANGED messages carry only the changed fields (``tester_delta_events``).
+
+        :param tester_ids: ids of the testers
+        :type tester_ids: TesterID
+        """
+        await self.__resources.publish_snapshot(tester_ids or None)
+
     async def add_tester(self, credentials: Credentials) -> TesterID:
         """Add a tester.
 
@@ -114,6 +462,12 @@ class MainController:
         """
         await self.__resources.remove_tester(tester_id)
 
+    async def wait_testers_connected(self) -> None:
+        """Wait till the known testers are connected on startup, the controller is usable before that,
+        the progress of connecting is reported on the PIPE_RESOURCES as PROGRESS messages with the ``startup`` key.
+        """
+        await self.__resources.wait_started()
+
     async def connect_tester(self, tester_id: TesterID) -> None:
         """Establis connection to a disconnected tester.
 
@@ -130,25 +484,149 @@ class MainController:
         """
         await self.__resources.disconnect(tester_id)
 
-    def start_test_suite(self, test_suite_name: str, config: dict[str, typing.Any], *, debug_connection: bool = False) -> str:
+    def start_test_suite(
+        self,
+        test_suite_name: str,
+        config: dict[str, typing.Any],
+        *,
+        debug_connection: bool = False,
+        isolated: bool = False
+    ) -> str:
         """Start test suite execution
 
         :param test_suite_name: test suite name
         :type test_suite_name: str
         :param config: test configuration data
         :type config: dict[str, typing.Any]
+        :param isolated: run the test suite in a separate process with its own tester sessions
+        :type isolated: bool
         :return: test execution id
         :rtype: str
         """
+        return self.__execution_manager.run(
+            self.__create_executor(test_suite_name, config, debug_connection, isolated)
+        )
+
+    def schedule_test_suite(
+        self,
+        test_suite_name: str,
+        config: dict[str, typing.Any],
+        *,
+        priority: int = 0,
+        debug_connection: bool = False,
+        isolated: bool = False
+    ) -> str:
+        """Queue test suite execution, it's started when none of its ports is used by a running execution
+        and the limits of the concurrent executions allow it.
+
+        :param test_suite_name: test suite name
+        :type test_suite_name: str
+        :param config: test configuration data
+        :type config: dict[str, typing.Any]
+        :param priority: executions with higher priority are started first
+        :type priority: int
+        :param isolated: run the test suite in a separate process with its own tester sessions
+        :type isolated: bool
+        :return: test execution id, it can be listened before the execution is started
+        :rtype: str
+        """
+        return self.__execution_manager.schedule(
+            self.__create_executor(test_suite_name, config, debug_connection, isolated),
+            priority
+        )
+
+    def start_test_suites(
+        self,
+        test_suites: typing.Iterable[tuple[str, dict[str, typing.Any]]],
+        *,
+        debug_connection: bool = False,
+        isolated: bool = False
+    ) -> list[str]:
+        """Start multiple test suite executions, all of the configurations and test resources are validated first,
+        if any of them is invalid none of the test suites is started.
+
+        :param test_suites: pairs of the test suite name and the test configuration data
+        :type test_suites: Iterable[tuple[str, dict[str, typing.Any]]]
+        :param isolated: run the test suites in separate processes with their own tester sessions
+        :type isolated: bool
+        :raises MultiModeError: in the mono mode, if more than one test suite would be running, nothing is validated then
+        :raises BulkStartError: with the errors per position of the invalid test suites
+        :return: test execution ids, in the order of the test suites
+        :rtype: list[str]
+        """
+        test_suites = tuple(test_suites)
+        self.__execution_manager.check_mono(len(test_suites))
+        plugins: dict[int, Plugin] = {}
+        errors: dict[int, Exception] = {}
+        for idx, (test_suite_name, config) in enumerate(test_suites):
+            try:
+                plugins[idx] = plugin = self.__load_plugin(test_suite_name, config, debug_connection)
+                self.__resources.check_testers(plugin.params.get_testers_ids)
+            except Exception as e:
+                errors[idx] = e
+        if errors:
+            raise BulkStartError(errors)
+        executors: list[SuiteExecutor] = []
+        try:
+            for idx, (test_suite_name, config) in enumerate(test_suites):
+                executors.append(self.__build_executor(test_suite_name, plugins[idx], config, isolated))
+        except Exception:
+            self.__execution_manager.discard(*executors)
+            raise
+        return self.__execution_manager.run_many(executors)
+
+    def scheduled_executions(self) -> list[ScheduledExecutionInfo]:
+        """
+        Get list of the executions waiting for being started, in the order of starting
+
+        :return: list of scheduled executions
+        :rtype: list[ScheduledExecutionInfo]
+        """
+        return self.__execution_manager.get_scheduled_info()
+
+    def __load_plugin(self, test_suite_name: str, config: dict[str, typing.Any], debug_connection: bool) -> Plugin:
         plugin = self.suites_library.get_plugin(test_suite_name, debug_connection)
         plugin.parse_config(config)
-        plugin.assign_testers(self.__resources.get_testers_by_id)
-        executor = SuiteExecutor(test_suite_name)
+        return plugin
+
+    def __create_executor(self, test_suite_name: str, config: dict[str, typing.Any], debug_connection: bool, isolated: bool) -> SuiteExecutor:
+        return self.__build_executor(test_suite_name, self.__load_plugin(test_suite_name, config, debug_connection), config, isolated)
+
+    def __build_executor(self, test_suite_name: str, plugin: Plugin, config: dict[str, typing.Any], isolated: bool) -> SuiteExecutor:
+        executor = SuiteExecutor(test_suite_name, drain_timeout=self.__drain_timeout)
         executor.assign_pipe(
             self.__publisher.get_pipe(executor.id)
         )
-        executor.assign_plugin(plugin)
-        return self.__execution_manager.run(executor)
+        try:
+            self.__assign_plugin(executor, plugin, config, isolated)
+        except Exception:
+            self.__execution_manager.discard(executor)
+            raise
+        return executor
+
+    def __assign_plugin(self, executor: SuiteExecutor, plugin: Plugin, config: dict[str, typing.Any], isolated: bool) -> None:
+        if isolated:
+            executor.assign_plugin(
+                IsolatedPlugin(
+                    plugin,
+                    config,
+                    self.suites_library.paths,
+                    self.__resources.get_credentials_by_id(plugin.params.get_testers_ids),
+                )
+            )
+        elif plugin.debug or not self.__resources.pools_sessions:
+            plugin.assign_testers(self.__resources.get_testers_by_id)
+            executor.assign_plugin(plugin)
+        else:
+            # the test suite is created with the testers of the pooled sessions when its execution starts
+            executor.assign_plugin(
+                plugin,
+                lease=functools.partial(self.__lease_testers, executor.id, plugin),
+                release=functools.partial(self.__resources.release_testers, executor.id),
+            )
+
+    def __lease_testers(self, owner: str, plugin: Plugin) -> None:
+        plugin.testers = self.__resources.lease_testers(owner, plugin.params.get_testers_ids, plugin.params.username)
 
     def executions_info(self) -> list[ExecutorInfo]:
         """
@@ -170,7 +648,7 @@ class MainController:
         return self.__execution_manager.get_state(execution_id)
 
     async def running_test_stop(self, execution_id: str) -> None:
-        """Stop a test suite execution
+        """Stop a test suite execution, or remove it from the queue if it is scheduled and not started yet
 
         :param execution_id: test execution id
         :type execution_id: str
@@ -188,3 +666,89 @@ class MainController:
         :rtype: None
         """
         return await self.__execution_manager.toggle_pause(execution_id)
+
+    async def running_tests_stop(self, execution_ids: typing.Iterable[str], *, timeout: float | None = None) -> list[ActionResult]:
+        """Stop multiple test suite executions in parallel, the scheduled ones are removed from the queue
+
+        :param execution_ids: test execution ids
+        :type execution_ids: Iterable[str]
+        :param timeout: overall deadline in seconds, the executions not stopped in time are stopped in the background
+        :type timeout: float | None
+        :return: outcome per execution, in the order of the ids
+        :rtype: list[ActionResult]
+        """
+        return await self.__execution_manager.stop_many(execution_ids, timeout)
+
+    async def running_tests_pause(self, execution_ids: typing.Iterable[str], *, timeout: float | None = None) -> list[ActionResult]:
+        """Pause multiple running test suite executions in parallel, the executions which are not running are skipped
+
+        :param execution_ids: test execution ids
+        :type execution_ids: Iterable[str]
+        :param timeout: overall deadline in seconds
+        :type timeout: float | None
+        :return: outcome per execution, in the order of the ids
+        :rtype: list[ActionResult]
+        """
+        return await self.__execution_manager.pause_many(execution_ids, timeout)
+
+    async def running_tests_continue(self, execution_ids: typing.Iterable[str], *, timeout: float | None = None) -> list[ActionResult]:
+        """Continue multiple paused test suite executions in parallel, the executions which are not paused are skipped
+
+        :param execution_ids: test execution ids
+        :type execution_ids: Iterable[str]
+        :param timeout: overall deadline in seconds
+        :type timeout: float | None
+        :return: outcome per execution, in the order of the ids
+        :rtype: list[ActionResult]
+        """
+        return await self.__execution_manager.resume_many(execution_ids, timeout)
+
+    async def execution_history(
+        self,
+        *,
+        suite_name: str | None = None,
+        tester_id: TesterID | None = None,
+        outcome: EOutcome | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        limit: int = 100
+    ) -> list[ExecutionRecord]:
+        """Query the recorded executions, the latest first. Requires the ``history_path`` of the controller.
+
+        :param suite_name: name of the test suite
+        :type suite_name: str | None
+        :param tester_id: id of a tester used by the executions
+        :type tester_id: TesterID | None
+        :param outcome: how the executions are terminated
+        :type outcome: EOutcome | None
+        :param since: the executions started at or after this unix time
+        :type since: float | None
+        :param until: the executions started before this unix time
+        :type until: float | None
+        :param limit: maximum amount of the returned executions
+        :type limit: int
+        :return: recorded executions, empty if the history is disabled
+        :rtype: list[ExecutionRecord]
+        """
+        if self.__history is None:
+            return []
+        return await self.__history.query(
+            suite_name=suite_name,
+            tester_id=tester_id,
+            outcome=outcome,
+            since=since,
+            until=until,
+            limit=limit,
+        )
+
+    async def execution_transitions(self, execution_id: str) -> list[StateTransition]:
+        """Get the recorded state transitions of an execution, in the order of occurrence.
+
+        :param execution_id: test execution id
+        :type execution_id: str
+        :return: state transitions, empty if the history is disabled
+        :rtype: list[StateTransition]
+        """
+        if self.__history is None:
+            return []
+        return await self.__history.transitions(execution_id)
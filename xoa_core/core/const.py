@@ -7,5 +7,10 @@ PIPE_EXECUTOR = "EXECUTOR"
 Identifier of Test-Suite Execution Subservice  for messages IO
 """
 
+EXECUTIONS_PATTERN = "????????-????-????-????-????????????"
+"""
+Pattern of the pipes names of all Test-Suite executions, for the pattern subscriptions
+"""
+
 
 TESTER_ID_PATTERN = r"^[a-fA-F\d]{32}$"
@@ -1,3 +1,4 @@
+import typing
 from xoa_core import __version__
 
 
@@ -28,3 +29,12 @@ class InvalidPluginError(ValueError):
         self.expected = expected
         self.msg = f"Invalid plugin. Plugin Entry Class {self.value} must be a subclass of {self.expected}."
         super().__init__(self.msg)
+
+
+class BulkStartError(Exception):
+    """Raises when any of the test suites of a bulk start is invalid, none of them is started then."""
+    def __init__(self, errors: typing.Dict[int, Exception]) -> None:
+        self.errors = errors
+        details = ", ".join(f"#{idx}: {error}" for idx, error in errors.items())
+        self.msg = f"None of the test suites is started, invalid test suites: {details}"
+        super().__init__(self.msg)
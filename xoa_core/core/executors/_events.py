@@ -7,3 +7,5 @@ from enum import (
 class Event(IntEnum):
     STOPPED = auto()
     ERROR = auto()
+    DRAINED = auto()
+    STATE_CHANGED = auto()
@@ -13,3 +13,11 @@ class ExecutionError(ExecutorError):
         self.plugin_name = plugin_name
         self.msg = f"During of the execution Plugin: <{plugin_name}> raised the error."
         super().__init__(self.msg)
+
+
+class IsolatedExecutionError(ExecutorError):
+    def __init__(self, plugin_name: str, reason: str) -> None:
+        self.plugin_name = plugin_name
+        self.reason = reason
+        self.msg = f"Isolated execution of the Plugin: <{plugin_name}> failed: {reason}"
+        super().__init__(self.msg)
@@ -1,5 +1,6 @@
 import asyncio
 import contextlib
+import time
 import uuid
 import typing
 from xoa_core.core.generic_types import (
@@ -8,6 +9,7 @@ from xoa_core.core.generic_types import (
 )
 if typing.TYPE_CHECKING:
     from xoa_core.types import PluginAbstract
+    from xoa_core.core.test_suites.datasets import TestParameters
     from xoa_core.core.plugin_abstract import (
         PStateConditionsFacade,
         PPipeFacade
@@ -16,20 +18,65 @@ if typing.TYPE_CHECKING:
 from .executor_info import ExecutorInfo
 from . import exceptions
 from ._events import Event
-from .executor_state import ExecutorState
+from .executor_state import (
+    EOutcome,
+    ExecutorState,
+)
 from .executor_state_conditions import StateConditions
 
 
 class PPlugin(typing.Protocol):
+    params: "TestParameters"
+
     def create_test_suite(self, state_conditions: "PStateConditionsFacade", xoa_out: "PPipeFacade") -> "PluginAbstract": ...  # noqa: E704
 
 
+DRAIN_TIMEOUT = 5.0
+"""Default deadline in seconds of delivering the messages of a terminated execution."""
+
+
 class SuiteExecutor:
-    __slots__ = ("suite_name", "state", "__id", "__observer", "__msg_pipe", "__test_suite", "__task", "state_conditions",)
+    __slots__ = (
+        "suite_name",
+        "state",
+        "__id",
+        "__observer",
+        "__msg_pipe",
+        "__plugin",
+        "__test_suite",
+        "__task",
+        "__teardown",
+        "__drain_timeout",
+        "state_conditions",
+        "port_identities",
+        "tester_ids",
+        "started",
+        "finished",
+        "outcome",
+        "error",
+        "__state_sender",
+        "__lease",
+        "__release",
+    )
 
-    def __init__(self, suite_name: str) -> None:
+    def __init__(self, suite_name: str, *, drain_timeout: float | None = DRAIN_TIMEOUT) -> None:
         self.__id = str(uuid.uuid4())
+        self.__teardown: asyncio.Task | None = None
+        self.__drain_timeout = drain_timeout
         self.suite_name = suite_name
+        self.port_identities: typing.FrozenSet[str] = frozenset()
+        """Names of the ports used by the test suite."""
+        self.tester_ids: typing.FrozenSet[str] = frozenset()
+        self.started: float | None = None
+        """Unix time of the execution start."""
+        self.finished: float | None = None
+        self.outcome: EOutcome | None = None
+        self.error: str | None = None
+        """Error the execution is terminated with."""
+        self.__observer: TObserver | None = None
+        self.__lease: typing.Callable[[], None] | None = None
+        self.__release: typing.Callable[[], None] | None = None
+        self.__test_suite: typing.Optional["PluginAbstract"] = None
         self.state = ExecutorState()
         self.state_conditions = StateConditions()
 
@@ -37,17 +84,45 @@ class SuiteExecutor:
     def id(self) -> str:
         return self.__id
 
+    @property
+    def teardown(self) -> asyncio.Task | None:
+        """Task closing the messages pipe of the terminated execution."""
+        return self.__teardown
+
+    async def __close_pipe(self) -> None:
+        report = await self.__msg_pipe.disable(self.__drain_timeout)
+        self.__observer.emit(Event.DRAINED, report)
+
+    def __send_state(self, state: str | None, old_state: str | None) -> None:
+        self.__state_sender(state, old_state)
+        if self.__observer is not None:
+            self.__observer.emit(Event.STATE_CHANGED, self.id, state, old_state, time.time())
+
+    def __release_resources(self) -> None:
+        if self.__release is not None:
+            release, self.__release = self.__release, None
+            release()
+
     def __on_execution_terminated(self, task: "asyncio.Task") -> None:
+        self.finished = time.time()
+        self.__release_resources()
         if not self.state.is_stoped:
             self.state.set_stop()
         err = None
         with contextlib.suppress(asyncio.CancelledError, exceptions.StopPlugin):
             err = task.exception()
-            if err is not None:
-                self.__msg_pipe.transmit_err(err)
-                self.__observer.emit(Event.ERROR, task.get_name(), err)  # only notify of the Execution manager.
+        if task.cancelled() or isinstance(err, exceptions.StopPlugin):
+            self.outcome = EOutcome.STOPPED
+        elif err is not None:
+            self.outcome = EOutcome.FAILED
+            self.error = f"{type(err).__name__}: {err}"
+        else:
+            self.outcome = EOutcome.COMPLETED
+        if err is not None:
+            self.__msg_pipe.transmit_err(err)
+            self.__observer.emit(Event.ERROR, task.get_name(), err)  # only notify of the Execution manager.
         self.__observer.emit(Event.STOPPED, self.id)
-        asyncio.create_task(self.__msg_pipe.disable())  # In rare case raise error but it's not break anything.
+        self.__teardown = asyncio.create_task(self.__close_pipe(), name=f"Teardown[{self.id}]")
         if err:
             raise exceptions.ExecutionError(task.get_name()) from err
 
@@ -60,39 +135,94 @@ class SuiteExecutor:
 
     def assign_pipe(self, pipe: "TMesagesPipe") -> None:
         self.__msg_pipe = pipe
-        self.state.assign_senders(pipe.get_state_facade())
+        self.__state_sender = pipe.get_state_facade()
+        self.state.assign_senders(self.__send_state)
 
-    def assign_plugin(self, plugin: PPlugin) -> None:
-        self.__test_suite = plugin.create_test_suite(
+    def assign_plugin(
+        self,
+        plugin: PPlugin,
+        *,
+        lease: typing.Callable[[], None] | None = None,
+        release: typing.Callable[[], None] | None = None
+    ) -> None:
+        """
+        :param lease: takes the tester sessions of the test suite when the execution starts,
+            the test suite is created after it, so it gets the leased testers
+        :param release: returns the sessions once the execution is terminated or discarded
+        """
+        self.port_identities = frozenset(port.name for port in plugin.params.port_identities)
+        self.tester_ids = frozenset(plugin.params.get_testers_ids)
+        self.__plugin = plugin
+        self.__lease = lease
+        self.__release = release
+        if lease is None:
+            self.__test_suite = self.__create_test_suite()
+
+    def __create_test_suite(self) -> "PluginAbstract":
+        return self.__plugin.create_test_suite(
             state_conditions=self.state_conditions.get_facade(),
             xoa_out=self.__msg_pipe.get_facade(self.suite_name)
         )
 
+    @staticmethod
+    async def __failed_start(error: Exception) -> None:
+        raise error
+
     def run(self, observer: TObserver) -> None:
         self.__observer = observer
+        self.started = time.time()
         self.state.set_run()
+        try:
+            if self.__test_suite is None:
+                if self.__lease is not None:
+                    self.__lease()
+                self.__test_suite = self.__create_test_suite()
+            start = self.__test_suite.start()
+        except Exception as error:
+            # the execution fails as if the test suite failed, so its sessions and the pipe are released as usual
+            start = self.__failed_start(error)
         self.__task = asyncio.create_task(
-            self.__test_suite.start(),
+            start,
             name=f"{self.suite_name}[{self.id}]"
         )
         self.__task.add_done_callback(self.__on_execution_terminated)
 
-    async def toggle_pause(self) -> None:
-        """User interface toggle pause."""
-        if self.state.is_running:
-            self.state.set_pause()
-            self.state_conditions.pause()
+    async def discard(self) -> None:
+        """Close the messages pipe of the execution which is never started."""
+        self.__release_resources()
+        await self.__msg_pipe.disable(self.__drain_timeout)
+
+    async def pause(self) -> bool:
+        """Pause the running test suite, returns False if it isn't running."""
+        if not self.state.is_running:
+            return False
+        self.state.set_pause()
+        self.state_conditions.pause()
+        if self.__test_suite is not None:
             await self.__test_suite.on_pause()
-        elif self.state.is_paused:
-            self.state.set_run()
-            self.state_conditions.resume()
+        return True
+
+    async def resume(self) -> bool:
+        """Continue the paused test suite, returns False if it isn't paused."""
+        if not self.state.is_paused:
+            return False
+        self.state.set_run()
+        self.state_conditions.resume()
+        if self.__test_suite is not None:
             await self.__test_suite.on_continue()
+        return True
+
+    async def toggle_pause(self) -> None:
+        """User interface toggle pause."""
+        if not await self.pause():
+            await self.resume()
 
     async def stop(self) -> None:
         """User interface stop the test suite."""
         self.state.set_stop()
         self.state_conditions.stop()
-        await self.__test_suite.on_stop()
+        if self.__test_suite is not None:
+            await self.__test_suite.on_stop()
         self.__task.cancel()
         with contextlib.suppress(asyncio.CancelledError, exceptions.StopPlugin):
             await self.__task
@@ -1,3 +1,5 @@
+from enum import Enum
+from typing import Optional
 from pydantic import BaseModel
 
 
@@ -5,3 +7,21 @@ class ExecutorInfo(BaseModel):
     id: str
     suite_name: str
     state: str
+
+
+class EActionOutcome(Enum):
+    DONE = "DONE"
+    SKIPPED = "SKIPPED"
+    """The execution is not in the state the action is applicable to."""
+    NOT_FOUND = "NOT_FOUND"
+    TIMED_OUT = "TIMED_OUT"
+    """The action didn't finish before the deadline, it is completed in the background."""
+    FAILED = "FAILED"
+
+
+class ActionResult(BaseModel):
+    """Outcome of a bulk action for one of the executions."""
+
+    id: str
+    outcome: EActionOutcome
+    error: Optional[str] = None
@@ -9,6 +9,12 @@ class EState(Enum):
     RUN = "RUN"
 
 
+class EOutcome(Enum):
+    COMPLETED = "COMPLETED"
+    STOPPED = "STOPPED"
+    FAILED = "FAILED"
+
+
 SenderType = Callable[[Optional[str], Optional[str]], None]
 
 
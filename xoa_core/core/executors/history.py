@@ -0,0 +1,282 @@
+"""
+Persistent history of the test suite executions.
+
+Executions are stored in a SQLite database, with a row per execution, per state transition
+and per tester used by the execution. All statements are executed by a single background thread
+which owns the connection, writes are queued from the event loop without waiting for them
+and the queued writes are committed together, in a single transaction.
+"""
+from __future__ import annotations
+import asyncio
+import sqlite3
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+)
+from pydantic import BaseModel
+
+from .executor_state import EOutcome
+if TYPE_CHECKING:
+    from .executor import SuiteExecutor
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS executions (
+    id TEXT PRIMARY KEY,
+    suite_name TEXT NOT NULL,
+    started REAL NOT NULL,
+    finished REAL,
+    state TEXT,
+    outcome TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS executions_suite ON executions (suite_name, started);
+CREATE INDEX IF NOT EXISTS executions_started ON executions (started);
+CREATE TABLE IF NOT EXISTS transitions (
+    execution_id TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    state TEXT,
+    old_state TEXT
+);
+CREATE INDEX IF NOT EXISTS transitions_execution ON transitions (execution_id, timestamp);
+CREATE TABLE IF NOT EXISTS execution_testers (
+    tester_id TEXT NOT NULL,
+    started REAL NOT NULL,
+    execution_id TEXT NOT NULL,
+    PRIMARY KEY (tester_id, started, execution_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS execution_testers_execution ON execution_testers (execution_id);
+"""
+
+_Write = Tuple[Callable[..., None], Tuple[Any, ...]]
+_COLUMNS = "e.id, e.suite_name, e.started, e.finished, e.state, e.outcome, e.error"
+
+
+class ExecutionRecord(BaseModel):
+    id: str
+    suite_name: str
+    tester_ids: List[str]
+    started: float
+    """Unix time of the execution start."""
+    finished: Optional[float]
+    """Unix time of the execution termination, None while it is running."""
+    state: Optional[str]
+    """The last known state of the execution."""
+    outcome: Optional[EOutcome]
+    error: Optional[str]
+
+
+class StateTransition(BaseModel):
+    timestamp: float
+    state: Optional[str]
+    old_state: Optional[str]
+
+
+class _Database:
+    """Synchronous part of the history, all of its methods are called from the history thread."""
+
+    __slots__ = ("__connection",)
+
+    def __init__(self, path: str) -> None:
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        self.__connection.executescript(_SCHEMA)
+
+    def write(self, pending: Deque[_Write]) -> None:
+        with self.__connection:
+            while pending:
+                method, args = pending.popleft()
+                method(self, *args)
+
+    def started(self, execution_id: str, suite_name: str, started: float, tester_ids: Sequence[str]) -> None:
+        self.__connection.execute(
+            "INSERT OR REPLACE INTO executions (id, suite_name, started) VALUES (?, ?, ?)",
+            (execution_id, suite_name, started)
+        )
+        self.__connection.executemany(
+            "INSERT OR IGNORE INTO execution_testers (tester_id, started, execution_id) VALUES (?, ?, ?)",
+            [(tester_id, started, execution_id) for tester_id in tester_ids]
+        )
+
+    def transition(self, execution_id: str, state: str | None, old_state: str | None, timestamp: float) -> None:
+        self.__connection.execute(
+            "INSERT INTO transitions (execution_id, timestamp, state, old_state) VALUES (?, ?, ?, ?)",
+            (execution_id, timestamp, state, old_state)
+        )
+        self.__connection.execute("UPDATE executions SET state = ? WHERE id = ?", (state, execution_id))
+
+    def finished(self, execution_id: str, finished: float | None, outcome: str | None, error: str | None) -> None:
+        self.__connection.execute(
+            "UPDATE executions SET finished = ?, outcome = ?, error = ? WHERE id = ?",
+            (finished, outcome, error, execution_id)
+        )
+
+    def query(
+        self,
+        suite_name: str | None,
+        tester_id: str | None,
+        outcome: str | None,
+        since: float | None,
+        until: float | None,
+        limit: int
+    ) -> List[ExecutionRecord]:
+        conditions: List[str] = []
+        params: List[Any] = []
+        if tester_id is not None:
+            # the tester index is ordered by the start time, it drives the lookup
+            started = "t.started"
+            source = "execution_testers t JOIN executions e ON e.id = t.execution_id"
+            conditions.append("t.tester_id = ?")
+            params.append(tester_id)
+        else:
+            started = "e.started"
+            source = "executions e"
+        if suite_name is not None:
+            conditions.append("e.suite_name = ?")
+            params.append(suite_name)
+        if outcome is not None:
+            conditions.append("e.outcome = ?")
+            params.append(outcome)
+        if since is not None:
+            conditions.append(f"{started} >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append(f"{started} < ?")
+            params.append(until)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self.__connection.execute(
+            f"SELECT {_COLUMNS} FROM {source} {where} ORDER BY {started} DESC LIMIT ?",
+            (*params, limit)
+        ).fetchall()
+        testers = self.__testers(tuple(row[0] for row in rows))
+        return [
+            ExecutionRecord.construct(
+                id=row[0],
+                suite_name=row[1],
+                tester_ids=testers.get(row[0], []),
+                started=row[2],
+                finished=row[3],
+                state=row[4],
+                outcome=row[5] and EOutcome(row[5]),
+                error=row[6],
+            )
+            for row in rows
+        ]
+
+    def __testers(self, execution_ids: Tuple[str, ...]) -> dict[str, List[str]]:
+        testers: dict[str, List[str]] = {}
+        if not execution_ids:
+            return testers
+        rows = self.__connection.execute(
+            f"SELECT execution_id, tester_id FROM execution_testers WHERE execution_id IN ({', '.join('?' * len(execution_ids))})",
+            execution_ids
+        )
+        for execution_id, tester_id in rows:
+            testers.setdefault(execution_id, []).append(tester_id)
+        return testers
+
+    def transitions(self, execution_id: str) -> List[StateTransition]:
+        rows = self.__connection.execute(
+            "SELECT timestamp, state, old_state FROM transitions WHERE execution_id = ? ORDER BY timestamp",
+            (execution_id,)
+        )
+        return [
+            StateTransition.construct(timestamp=timestamp, state=state, old_state=old_state)
+            for timestamp, state, old_state in rows
+        ]
+
+    def close(self) -> None:
+        self.__connection.close()
+
+
+class ExecutionHistory:
+    """
+    Records the executions with their state transitions and terminal errors.
+
+    The records are indexed by the suite name, the start time and the testers,
+    so the queries stay fast with hundreds of thousands of recorded executions.
+    Once the history is closed, the records are ignored and the queries return nothing.
+    """
+
+    __slots__ = ("path", "__db", "__thread", "__pending", "__write_scheduled", "__closed")
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.__thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ExecutionHistory")
+        self.__db: _Database = self.__thread.submit(_Database, str(self.path)).result()
+        self.__pending: Deque[_Write] = deque()
+        self.__write_scheduled = False
+        self.__closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self.__closed
+
+    def __write(self) -> None:
+        self.__write_scheduled = False  # records queued from now on are written by the next call
+        self.__db.write(self.__pending)
+
+    def __queue(self, method: Callable[..., None], *args: Any) -> None:
+        if self.__closed:
+            return None
+        self.__pending.append((method, args))
+        if not self.__write_scheduled:
+            self.__write_scheduled = True
+            self.__thread.submit(self.__write)
+
+    def record_started(self, executor: "SuiteExecutor") -> None:
+        self.__queue(_Database.started, executor.id, executor.suite_name, executor.started, tuple(executor.tester_ids))
+
+    def record_transition(self, execution_id: str, state: str | None, old_state: str | None, timestamp: float) -> None:
+        self.__queue(_Database.transition, execution_id, state, old_state, timestamp)
+
+    def record_finished(self, executor: "SuiteExecutor") -> None:
+        outcome = executor.outcome.value if executor.outcome else None
+        self.__queue(_Database.finished, executor.id, executor.finished, outcome, executor.error)
+
+    async def query(
+        self,
+        *,
+        suite_name: str | None = None,
+        tester_id: str | None = None,
+        outcome: EOutcome | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        limit: int = 100
+    ) -> List[ExecutionRecord]:
+        """The latest executions matching all of the given criteria, `since` and `until` bound the start time."""
+        if self.__closed:
+            return []
+        return await asyncio.get_running_loop().run_in_executor(
+            self.__thread,
+            self.__db.query,
+            suite_name,
+            tester_id,
+            outcome.value if outcome else None,
+            since,
+            until,
+            limit,
+        )
+
+    async def transitions(self, execution_id: str) -> List[StateTransition]:
+        if self.__closed:
+            return []
+        return await asyncio.get_running_loop().run_in_executor(self.__thread, self.__db.transitions, execution_id)
+
+    def close(self) -> None:
+        """Write the pending records and close the database, repeated calls have no effect."""
+        if self.__closed:
+            return None
+        self.__closed = True
+        self.__thread.submit(self.__db.close)
+        self.__thread.shutdown(wait=True)
@@ -0,0 +1,310 @@
+"""
+Execution of a test suite in a worker process.
+
+The worker process loads the plugin from the registered paths, creates its own tester sessions
+and runs the test suite on its own event loop. Both sides communicate over a multiprocessing pipe:
+
+    * worker -> controller: messages of the test suite encoded by the messenger codec and the outcome of the execution,
+    * controller -> worker: pause, continue and stop commands.
+
+Each side reads the pipe on a dedicated thread, so neither of the event loops is blocked by the IPC.
+"""
+from __future__ import annotations
+import asyncio
+import contextlib
+import multiprocessing
+import threading
+import typing
+from multiprocessing.connection import Connection
+
+from xoa_core.core.messenger import (
+    codec,
+    misc,
+)
+from . import exceptions
+from .executor_state_conditions import StateConditions
+
+if typing.TYPE_CHECKING:
+    from xoa_core.core.plugin_abstract import (
+        PluginAbstract,
+        PPipeFacade,
+        PStateConditionsFacade,
+    )
+    from xoa_core.core.resources.resource.misc import Credentials
+    from xoa_core.core.test_suites.datasets import (
+        Plugin,
+        TestParameters,
+    )
+
+STOP_TIMEOUT = 10.0
+"""Seconds the worker process is given for stopping before it's terminated."""
+
+# region Frames kinds
+
+_MESSAGE = "message"
+_DONE = "done"
+_FAILED = "failed"
+_PAUSE = "pause"
+_CONTINUE = "continue"
+_STOP = "stop"
+
+# endregion
+
+
+class IsolationSpec(typing.NamedTuple):
+    """Everything the worker process needs for creating the test suite, it's sent to the worker as is."""
+
+    suite_name: str
+    plugins_paths: typing.Tuple[str, ...]
+    config: typing.Dict[str, typing.Any]
+    username: str
+    credentials: typing.Dict[str, typing.Dict[str, typing.Any]]
+    debug: bool
+
+
+def _plain_credentials(credentials: "Credentials") -> typing.Dict[str, typing.Any]:
+    return {
+        "product": credentials.product.value,
+        "host": credentials.host,
+        "port": credentials.port,
+        "password": credentials.password.get_secret_value(),
+    }
+
+
+def _read_frames(conn: Connection, loop: asyncio.AbstractEventLoop, on_frame: typing.Callable[[str, typing.Any], None]) -> None:
+    """Body of the reading thread, frames are handled on the event loop, EOF is reported as None kind."""
+    while True:
+        try:
+            kind, data = conn.recv()
+        except (EOFError, OSError):
+            with contextlib.suppress(RuntimeError):  # loop is closed
+                loop.call_soon_threadsafe(on_frame, None, None)
+            return None
+        loop.call_soon_threadsafe(on_frame, kind, data)
+
+
+# region Worker process
+
+class _Transmitter:
+    """Transmit function of the worker side `PipeFacade`, messages are encoded and sent to the controller."""
+
+    __slots__ = ("__conn",)
+
+    def __init__(self, conn: Connection) -> None:
+        self.__conn = conn
+
+    def __call__(self, msg: typing.Any, *, msg_type: misc.EMsgType = misc.EMsgType.DATA, **meta: typing.Any) -> None:
+        message = misc.Message.construct(pipe_name="", meta=meta, type=msg_type, payload=msg)
+        self.__conn.send((_MESSAGE, codec.encode(message)))
+
+
+class _WorkerSession:
+    __slots__ = ("__conn", "__spec", "__conditions", "__suite", "__task")
+
+    def __init__(self, conn: Connection, spec: IsolationSpec) -> None:
+        self.__conn = conn
+        self.__spec = spec
+        self.__conditions = StateConditions()
+        self.__suite: typing.Optional["PluginAbstract"] = None
+        self.__task: typing.Optional[asyncio.Task] = None
+
+    def __create_test_suite(self) -> "PluginAbstract":
+        from xoa_core.core.resources.resource.misc import Credentials, get_tester_inst
+        from xoa_core.core.test_suites.controller import PluginController
+
+        plugins = PluginController()
+        for path in self.__spec.plugins_paths:
+            plugins.register_path(path)
+        plugin = plugins.get_plugin(self.__spec.suite_name, self.__spec.debug)
+        plugin.parse_config(self.__spec.config)
+        plugin.testers = {
+            tester_id: get_tester_inst(Credentials.parse_obj(credentials), self.__spec.username, self.__spec.debug)
+            for tester_id, credentials in self.__spec.credentials.items()
+        }
+        return plugin.create_test_suite(
+            state_conditions=self.__conditions.get_facade(),
+            xoa_out=misc.PipeFacade(_Transmitter(self.__conn), self.__spec.suite_name),
+        )
+
+    def __report(self, kind: str, data: typing.Any) -> None:
+        with contextlib.suppress(OSError):  # controller is gone
+            self.__conn.send((kind, data))
+
+    async def __control(self, command: typing.Optional[str]) -> None:
+        if self.__suite is None or self.__task is None or self.__task.done():
+            return None
+        if command == _PAUSE:
+            self.__conditions.pause()
+            await self.__suite.on_pause()
+        elif command == _CONTINUE:
+            self.__conditions.resume()
+            await self.__suite.on_continue()
+        elif command == _STOP or command is None:  # controller is gone
+            self.__conditions.stop()
+            await self.__suite.on_stop()
+            self.__task.cancel()
+
+    def __on_frame(self, kind: typing.Optional[str], _: typing.Any) -> None:
+        asyncio.ensure_future(self.__control(kind))
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        threading.Thread(target=_read_frames, args=(self.__conn, loop, self.__on_frame), daemon=True).start()
+        try:
+            self.__suite = self.__create_test_suite()
+            self.__task = asyncio.current_task()
+            await self.__suite.start()
+        except (exceptions.StopPlugin, asyncio.CancelledError):
+            self.__report(_FAILED, (str(exceptions.StopPlugin()), True))
+        except Exception as e:
+            self.__report(_FAILED, (f"{type(e).__name__}: {e}", False))
+        else:
+            self.__report(_DONE, None)
+        finally:
+            self.__conn.close()
+
+
+async def _run_session(conn: Connection, spec: IsolationSpec) -> None:
+    # the session is created on the running loop, on Python < 3.10 the events of its state conditions are bound to it
+    await _WorkerSession(conn, spec).run()
+
+
+def run_worker(conn: Connection, spec: IsolationSpec) -> None:
+    """Entry point of the worker process."""
+    asyncio.run(_run_session(conn, spec))
+
+# endregion
+
+
+# region Controller process
+
+class IsolatedTestSuite:
+    """Controller side stand-in of the test suite running in a worker process."""
+
+    __slots__ = ("__spec", "__xoa_out", "__conn", "__process", "__done")
+
+    def __init__(self, spec: IsolationSpec, xoa_out: "PPipeFacade") -> None:
+        self.__spec = spec
+        self.__xoa_out = xoa_out
+        self.__conn: typing.Optional[Connection] = None
+        self.__process: typing.Optional[multiprocessing.process.BaseProcess] = None
+        self.__done: typing.Optional[asyncio.Future] = None
+
+    def __send(self, kind: str) -> None:
+        if self.__conn is not None and not self.__conn.closed:
+            with contextlib.suppress(OSError):
+                self.__conn.send((kind, None))
+
+    def __forward(self, frame: bytes) -> None:
+        """
+        Send the message of the worker to the pipe of the execution.
+        Statistics are delivered as dictionaries, the models of the plugin are not rebuilt in the controller process.
+        Frames which can't be forwarded are reported by a warning instead.
+        """
+        try:
+            msg = codec.decode(frame)
+        except codec.DecodeError as e:
+            self.__xoa_out.send_warning(Warning(f"Message of the isolated test suite is lost: {e.msg}"))
+            return None
+        key = msg.meta.get("key")
+        if msg.type is misc.EMsgType.STATISTICS:
+            self.__xoa_out.send_statistics(msg.payload, key=key)
+        elif msg.type is misc.EMsgType.PROGRESS:
+            self.__xoa_out.send_progress(msg.payload.current, msg.payload.total, msg.payload.loop, key=key)
+        elif msg.type is misc.EMsgType.WARNING:
+            self.__xoa_out.send_warning(Warning(msg.payload))
+        elif msg.type is misc.EMsgType.ERROR:
+            self.__xoa_out.send_error(Exception(msg.payload))
+        else:
+            self.__xoa_out.send_warning(Warning(f"Message of the isolated test suite is lost: unsupported type {msg.type.value}"))
+
+    def __on_frame(self, kind: typing.Optional[str], data: typing.Any) -> None:
+        assert self.__done is not None
+        if kind == _MESSAGE:
+            self.__forward(data)
+        elif self.__done.done():
+            return None
+        elif kind == _DONE:
+            self.__done.set_result(None)
+        elif kind == _FAILED:
+            reason, stopped = data
+            self.__done.set_exception(exceptions.StopPlugin() if stopped else exceptions.IsolatedExecutionError(self.__spec.suite_name, reason))
+        elif kind is None:
+            exitcode = self.__process.exitcode if self.__process else None
+            self.__done.set_exception(exceptions.IsolatedExecutionError(self.__spec.suite_name, f"worker process is gone, exit code {exitcode}"))
+
+    async def __shutdown(self) -> None:
+        assert self.__process is not None
+        self.__send(_STOP)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.__process.join, STOP_TIMEOUT)
+        if self.__process.is_alive():
+            self.__process.terminate()
+            await loop.run_in_executor(None, self.__process.join)
+
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        context = multiprocessing.get_context("spawn")
+        self.__conn, worker_conn = context.Pipe()
+        self.__done = loop.create_future()
+        self.__process = context.Process(
+            target=run_worker,
+            args=(worker_conn, self.__spec),
+            name=f"IsolatedSuite[{self.__spec.suite_name}]",
+            daemon=True,
+        )
+        self.__process.start()
+        worker_conn.close()
+        threading.Thread(target=_read_frames, args=(self.__conn, loop, self.__on_frame), daemon=True).start()
+        try:
+            await asyncio.shield(self.__done)
+        except asyncio.CancelledError:
+            await self.__shutdown()
+            raise
+        finally:
+            await loop.run_in_executor(None, self.__process.join)
+            self.__conn.close()
+            if self.__done.done():
+                self.__done.exception()  # outcome of a stopped execution is not awaited by anyone
+
+    async def on_pause(self) -> None:
+        self.__send(_PAUSE)
+
+    async def on_continue(self) -> None:
+        self.__send(_CONTINUE)
+
+    async def on_stop(self) -> None:
+        self.__send(_STOP)
+
+
+class IsolatedPlugin:
+    """
+    Plugin which test suite runs in a worker process.
+
+    Parameters are validated in the controller process, the worker receives the raw config
+    and the credentials of the testers and creates its own sessions.
+    """
+
+    __slots__ = ("params", "__spec")
+
+    def __init__(
+        self,
+        plugin: "Plugin",
+        config: typing.Dict[str, typing.Any],
+        plugins_paths: typing.Iterable[str],
+        credentials: typing.Dict[str, "Credentials"]
+    ) -> None:
+        self.params: "TestParameters" = plugin.params
+        self.__spec = IsolationSpec(
+            suite_name=plugin.plugin_data.meta.name,
+            plugins_paths=tuple(str(path) for path in plugins_paths),
+            config=config,
+            username=plugin.params.username,
+            credentials={tester_id: _plain_credentials(cred) for tester_id, cred in credentials.items()},
+            debug=plugin.debug,
+        )
+
+    def create_test_suite(self, state_conditions: "PStateConditionsFacade", xoa_out: "PPipeFacade") -> IsolatedTestSuite:
+        return IsolatedTestSuite(self.__spec, xoa_out)
+
+# endregion
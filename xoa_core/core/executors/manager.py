@@ -1,48 +1,163 @@
 from __future__ import annotations
+import asyncio
+import contextlib
 import typing
 from xoa_core.core.utils import observer
 from xoa_core.core import exceptions
-from .executor_info import ExecutorInfo
+from .executor_info import (
+    ActionResult,
+    EActionOutcome,
+    ExecutorInfo,
+)
 from .executor import SuiteExecutor
+from .history import ExecutionHistory
+from .scheduler import (
+    ExecutionScheduler,
+    ScheduledExecutionInfo,
+)
 from ._events import Event
 
 from xoa_core.core.generic_types import TMesagesPipe
+if typing.TYPE_CHECKING:
+    from xoa_core.core.messenger.misc import DrainReport
+
+
+def _consume_result(task: asyncio.Task) -> None:
+    if not task.cancelled():
+        task.exception()
 
 
 class ExecutorsManager:
 
-    __slots__ = ("__msg_pipe", "__executors", "__observer", "__mono")
+    __slots__ = ("__msg_pipe", "__executors", "__teardowns", "__observer", "__mono", "__scheduler", "__history", "__all_stopped")
 
-    def __init__(self, pipe: "TMesagesPipe", mono: bool = False) -> None:
+    def __init__(
+        self,
+        pipe: "TMesagesPipe",
+        mono: bool = False,
+        *,
+        max_running: int | None = None,
+        max_per_tester: int | None = None,
+        history: ExecutionHistory | None = None
+    ) -> None:
         self.__mono = mono
+        self.__history = history
+        self.__scheduler = ExecutionScheduler(
+            max_running=1 if mono else max_running,
+            max_per_tester=max_per_tester,
+        )
         self.__executors: typing.Dict[str, "SuiteExecutor"] = dict()
+        self.__teardowns: typing.Set[asyncio.Task] = set()
+        self.__all_stopped: asyncio.Future | None = None
         self.__msg_pipe = pipe
 
         self.__observer = observer.SimpleObserver()
         self.__observer.subscribe(Event.STOPPED, self.__on_execution_stopped)
         self.__observer.subscribe(Event.ERROR, self.__on_execution_error)
+        self.__observer.subscribe(Event.DRAINED, self.__on_execution_drained)
+        if history is not None:
+            self.__observer.subscribe(Event.STATE_CHANGED, self.__on_execution_state_changed)
 
     async def __on_execution_stopped(self, exec_id: str) -> None:
-        del self.__executors[exec_id]
+        executor = self.__executors.pop(exec_id)
+        if self.__history is not None:
+            self.__history.record_finished(executor)
+        if (teardown := executor.teardown) and not teardown.done():
+            self.__teardowns.add(teardown)
+            teardown.add_done_callback(self.__teardowns.discard)
+        self.__run_scheduled()
         self.__msg_pipe.transmit(f"Test Suite stopped: {exec_id}")
+        if not self.__executors and self.__all_stopped is not None and not self.__all_stopped.done():
+            self.__all_stopped.set_result(None)
 
     async def __on_execution_error(self, suite_name: str, error: Exception) -> None:
         self.__msg_pipe.transmit(f"Test Suite Error: {suite_name}, {error}")
 
+    async def __on_execution_state_changed(self, exec_id: str, state: str | None, old_state: str | None, timestamp: float) -> None:
+        self.__history.record_transition(exec_id, state, old_state, timestamp)
+
+    async def __on_execution_drained(self, report: "DrainReport") -> None:
+        self.__msg_pipe.transmit(report)
+        if report.timed_out:
+            self.__msg_pipe.transmit_warn(f"Test Suite messages abandoned: {report.name}, {report.abandoned}")
+
+    async def wait_teardowns(self, timeout: float | None = None) -> None:
+        """
+        Wait till the messages of all terminated executions are delivered or abandoned,
+        the teardowns which are not done within the timeout are cancelled.
+        """
+        if not self.__teardowns:
+            return
+        _, pending = await asyncio.wait(tuple(self.__teardowns), timeout=timeout)
+        for teardown in pending:
+            teardown.cancel()
+        if pending:
+            await asyncio.wait(pending)
+
+    async def close(self, timeout: float | None = None) -> None:
+        """
+        Discard the scheduled executions and stop the running ones, wait till they are terminated
+        and their messages are delivered, each of the steps is bounded by the timeout.
+        """
+        await self.stop_many([info.id for info in self.__scheduler.get_info()], timeout)
+        if self.__executors:
+            self.__all_stopped = asyncio.get_running_loop().create_future()
+            await self.stop_many(tuple(self.__executors), timeout)
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(asyncio.shield(self.__all_stopped), timeout)
+            self.__all_stopped = None
+        await self.wait_teardowns(timeout)
+
+    def check_mono(self, amount: int = 1) -> None:
+        """Raise `MultiModeError` if the amount of executions can't be started along with the running ones in the mono mode."""
+        if self.__mono and len(self.__executors) + amount > 1:
+            raise exceptions.MultiModeError()
+
+    def discard(self, *executors: "SuiteExecutor") -> None:
+        """Close the messages pipes of the executions which are never started, it's awaited by `close`."""
+        for executor in executors:
+            task = asyncio.create_task(executor.discard(), name=f"Teardown[{executor.id}]")
+            self.__teardowns.add(task)
+            task.add_done_callback(self.__teardowns.discard)
+
     def run(self, executor: "SuiteExecutor") -> str:
         if self.__mono and len(self.__executors) > 1:
             raise exceptions.MultiModeError()
         self.__executors[executor.id] = executor
         executor.run(self.__observer)
+        if self.__history is not None:
+            self.__history.record_started(executor)
         self.__msg_pipe.transmit(f"Test Suite Started: {executor.id}")
         return executor.id
 
+    def run_many(self, executors: typing.Sequence["SuiteExecutor"]) -> list[str]:
+        self.check_mono(len(executors))
+        return [self.run(executor) for executor in executors]
+
+    def __run_scheduled(self) -> None:
+        for executor in self.__scheduler.pop_ready(tuple(self.__executors.values())):
+            self.run(executor)
+
+    def schedule(self, executor: "SuiteExecutor", priority: int = 0) -> str:
+        """Queue the execution, it's started when the concurrency limits allow it and its ports are free."""
+        self.__scheduler.submit(executor, priority)
+        self.__msg_pipe.transmit(f"Test Suite Scheduled: {executor.id}")
+        self.__run_scheduled()
+        return executor.id
+
+    def get_scheduled_info(self) -> list[ScheduledExecutionInfo]:
+        return self.__scheduler.get_info()
+
     def get_executors_info(self) -> list[ExecutorInfo]:
         return [
             ex.get_info()
             for ex in self.__executors.values()
         ]
 
+    @property
+    def history(self) -> ExecutionHistory | None:
+        return self.__history
+
     def get_state(self, exec_id: str) -> str | None:
         if ex := self.__executors.get(exec_id):
             return ex.state.current_state
@@ -50,7 +165,57 @@ class ExecutorsManager:
     async def stop(self, exec_id: str) -> None:
         if ex := self.__executors.get(exec_id):
             await ex.stop()
+        elif ex := self.__scheduler.cancel(exec_id):
+            await ex.discard()
+            self.__msg_pipe.transmit(f"Test Suite unscheduled: {exec_id}")
 
     async def toggle_pause(self, exec_id: str) -> None:
         if ex := self.__executors.get(exec_id):
             await ex.toggle_pause()
+
+    async def __stop(self, exec_id: str) -> bool:
+        await self.stop(exec_id)
+        return True
+
+    async def __pause(self, exec_id: str) -> bool:
+        return (ex := self.__executors.get(exec_id)) is not None and await ex.pause()
+
+    async def __resume(self, exec_id: str) -> bool:
+        return (ex := self.__executors.get(exec_id)) is not None and await ex.resume()
+
+    async def __apply_many(
+        self,
+        exec_ids: typing.Iterable[str],
+        action: typing.Callable[[str], typing.Awaitable[bool]],
+        timeout: float | None
+    ) -> list[ActionResult]:
+        exec_ids = tuple(dict.fromkeys(exec_ids))
+        tasks = {
+            exec_id: asyncio.create_task(action(exec_id))
+            for exec_id in exec_ids
+            if exec_id in self.__executors or exec_id in self.__scheduler
+        }
+        if tasks:
+            await asyncio.wait(tasks.values(), timeout=timeout)
+        results = []
+        for exec_id in exec_ids:
+            if (task := tasks.get(exec_id)) is None:
+                results.append(ActionResult(id=exec_id, outcome=EActionOutcome.NOT_FOUND))
+            elif not task.done():
+                task.add_done_callback(_consume_result)
+                results.append(ActionResult(id=exec_id, outcome=EActionOutcome.TIMED_OUT))
+            elif (err := task.exception()) is not None:
+                results.append(ActionResult(id=exec_id, outcome=EActionOutcome.FAILED, error=f"{type(err).__name__}: {err}"))
+            else:
+                results.append(ActionResult(id=exec_id, outcome=EActionOutcome.DONE if task.result() else EActionOutcome.SKIPPED))
+        return results
+
+    async def stop_many(self, exec_ids: typing.Iterable[str], timeout: float | None = None) -> list[ActionResult]:
+        """Stop the executions in parallel, the scheduled ones are removed from the queue."""
+        return await self.__apply_many(exec_ids, self.__stop, timeout)
+
+    async def pause_many(self, exec_ids: typing.Iterable[str], timeout: float | None = None) -> list[ActionResult]:
+        return await self.__apply_many(exec_ids, self.__pause, timeout)
+
+    async def resume_many(self, exec_ids: typing.Iterable[str], timeout: float | None = None) -> list[ActionResult]:
+        return await self.__apply_many(exec_ids, self.__resume, timeout)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+import bisect
+import time
+from typing import (
+    Collection,
+    Counter,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+from pydantic import BaseModel
+
+from .executor import SuiteExecutor
+
+
+class ScheduledExecutionInfo(BaseModel):
+    id: str
+    suite_name: str
+    priority: int
+    position: int
+    """Place in the queue, starting from 0."""
+    submitted: float
+    """Unix time of the submission."""
+
+
+class ExecutionScheduler:
+    """
+    Queue of the executions waiting for being started.
+
+    Executions are ordered by priority, higher first, and by submission time.
+    An execution is ready when the global and the per tester limits of the running executions allow it
+    and none of its ports is used by a running execution. A ready execution may overtake the blocked ones,
+    but never to take the ports of a blocked execution of a higher priority, so it can't be starved.
+    """
+
+    __slots__ = ("max_running", "max_per_tester", "__order", "__executors", "__submitted", "__counter")
+
+    def __init__(self, *, max_running: Optional[int] = None, max_per_tester: Optional[int] = None) -> None:
+        self.max_running = max_running
+        self.max_per_tester = max_per_tester
+        self.__order: List[Tuple[int, int, str]] = []
+        self.__executors: Dict[str, Tuple[SuiteExecutor, int, float]] = {}
+        self.__counter = 0
+
+    def __len__(self) -> int:
+        return len(self.__order)
+
+    def __contains__(self, exec_id: str) -> bool:
+        return exec_id in self.__executors
+
+    def submit(self, executor: SuiteExecutor, priority: int = 0) -> None:
+        self.__counter += 1
+        bisect.insort(self.__order, (-priority, self.__counter, executor.id))
+        self.__executors[executor.id] = (executor, priority, time.time())
+
+    def cancel(self, exec_id: str) -> Optional[SuiteExecutor]:
+        if (scheduled := self.__executors.pop(exec_id, None)) is None:
+            return None
+        self.__order = [item for item in self.__order if item[2] != exec_id]
+        return scheduled[0]
+
+    def get_info(self) -> List[ScheduledExecutionInfo]:
+        infos = []
+        for position, (_, _, exec_id) in enumerate(self.__order):
+            executor, priority, submitted = self.__executors[exec_id]
+            infos.append(
+                ScheduledExecutionInfo(
+                    id=exec_id,
+                    suite_name=executor.suite_name,
+                    priority=priority,
+                    position=position,
+                    submitted=submitted,
+                )
+            )
+        return infos
+
+    def __fits_testers(self, tester_ids: FrozenSet[str], per_tester: Counter[str]) -> bool:
+        if self.max_per_tester is None:
+            return True
+        return all(per_tester[tester_id] < self.max_per_tester for tester_id in tester_ids)
+
+    def pop_ready(self, running: Collection[SuiteExecutor]) -> List[SuiteExecutor]:
+        """Remove from the queue the executions which can be started along with the running ones."""
+        running_count = len(running)
+        busy_ports: Set[str] = set()
+        per_tester: Counter[str] = Counter()
+        for executor in running:
+            busy_ports |= executor.port_identities
+            per_tester.update(executor.tester_ids)
+        reserved_ports: Set[str] = set()
+        ready = []
+        for item in tuple(self.__order):
+            if self.max_running is not None and running_count >= self.max_running:
+                break
+            executor = self.__executors[item[2]][0]
+            if busy_ports.isdisjoint(executor.port_identities) and reserved_ports.isdisjoint(executor.port_identities) \
+                    and self.__fits_testers(executor.tester_ids, per_tester):
+                self.__order.remove(item)
+                del self.__executors[executor.id]
+                ready.append(executor)
+                running_count += 1
+                busy_ports |= executor.port_identities
+                per_tester.update(executor.tester_ids)
+            else:
+                reserved_ports |= executor.port_identities
+        return ready
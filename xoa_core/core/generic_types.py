@@ -3,7 +3,7 @@ from typing import (
     Protocol,
     Any,
     Callable,
-    # Optional,
+    Optional,
     Coroutine,
     Tuple,
     AsyncGenerator,
@@ -41,9 +41,10 @@ class TObserver(Protocol):
 
 
 class TMesagesPipe(Protocol):
-    async def _add_stream(self, key: str, queue: "asyncio.Queue") -> None: ...  # noqa: E704
+    async def _add_stream(self, key: str, queue: "asyncio.Queue", *, replay_from: Optional[int] = None, replay_last: Optional[int] = None, _filter: Any = None) -> None: ...  # noqa: E704,E501
+    def _attach_stream(self, key: str, queue: "asyncio.Queue", *, replay_from: Optional[int] = None, replay_last: Optional[int] = None, closing: bool = True, _filter: Any = None) -> None: ...  # noqa: E704,E501
     async def _free_stream(self, key: str) -> None: ...  # noqa: E704
-    async def disable(self) -> None: ...  # noqa: E704
+    async def disable(self, timeout: Optional[float] = None) -> Any: ...  # noqa: E704
     def transmit(self, msg: Any, *, msg_type: EMsgType = EMsgType.DATA) -> None: ...  # noqa: E704
     def get_facade(self, suite_name: str) -> PipeFacade: ...  # noqa: E704
     def get_state_facade(self) -> PipeStateFacade: ...  # noqa: E704
@@ -0,0 +1,388 @@
+"""
+Compact binary encoding of the messages.
+
+Every message is written as a length prefixed frame::
+
+    +----------+-----+-----------+--------+-----------+------+---------+
+    |  length  | tag | pipe_name |  seq   | timestamp | meta | payload |
+    |  uint32  | u8  |    str    | varint |  float64  | map  |         |
+    +----------+-----+-----------+--------+-----------+------+---------+
+
+`length` is the amount of bytes following it (big-endian).
+The low 7 bits of `tag` identify the `EMsgType` and with it the schema of the payload:
+STATE payload is two optional strings, PROGRESS payload is three integers.
+When the high bit of the `tag` is set, the payload is encoded as a generic value.
+
+Generic values are written as a marker byte followed by the data,
+integers and sizes are written as (zigzag) varints. Pydantic models and dataclasses are written as maps,
+enums as their values and secrets are always masked.
+Models are walked directly, without building intermediate dicts.
+"""
+from __future__ import annotations
+import asyncio
+import dataclasses
+import struct
+from enum import Enum
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    Callable,
+    Dict,
+    Iterator,
+    Tuple,
+)
+
+from pydantic import (
+    BaseModel,
+    SecretBytes,
+    SecretStr,
+)
+
+from . import misc
+
+HEADER = struct.Struct(">IB")
+_LENGTH = struct.Struct(">I")
+_DOUBLE = struct.Struct(">d")
+
+GENERIC_PAYLOAD = 0x80
+
+TAGS: Dict[misc.EMsgType, int] = {
+    misc.EMsgType.STATE: 1,
+    misc.EMsgType.DATA: 2,
+    misc.EMsgType.STATISTICS: 3,
+    misc.EMsgType.PROGRESS: 4,
+    misc.EMsgType.WARNING: 5,
+    misc.EMsgType.ERROR: 6,
+    misc.EMsgType.PIPE: 7,
+}
+TYPES: Dict[int, misc.EMsgType] = {tag: msg_type for msg_type, tag in TAGS.items()}
+
+# region Values markers
+
+_NONE = 0x00
+_FALSE = 0x01
+_TRUE = 0x02
+_INT = 0x03
+_FLOAT = 0x04
+_STR = 0x05
+_BYTES = 0x06
+_LIST = 0x07
+_MAP = 0x08
+
+# endregion
+
+_MASKED = "**********"
+
+
+class DecodeError(ValueError):
+    def __init__(self, reason: str) -> None:
+        self.reason = reason
+        self.msg = f"Can't decode the message frame: {reason}"
+        super().__init__(self.msg)
+
+
+# region Encoding
+
+def _write_uvarint(buf: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def _write_int(buf: bytearray, value: int) -> None:
+    _write_uvarint(buf, (value << 1) if value >= 0 else ((-value << 1) - 1))
+
+
+def _write_str(buf: bytearray, value: str) -> None:
+    data = value.encode("utf-8")
+    _write_uvarint(buf, len(data))
+    buf += data
+
+
+def _write_optional_str(buf: bytearray, value: str | None) -> None:
+    if value is None:
+        buf.append(_NONE)
+    else:
+        buf.append(_STR)
+        _write_str(buf, value)
+
+
+def _write_value(buf: bytearray, value: Any) -> None:
+    if value is None:
+        buf.append(_NONE)
+    elif value is True:
+        buf.append(_TRUE)
+    elif value is False:
+        buf.append(_FALSE)
+    elif isinstance(value, Enum):
+        _write_value(buf, value.value)
+    elif isinstance(value, int):
+        buf.append(_INT)
+        _write_int(buf, value)
+    elif isinstance(value, float):
+        buf.append(_FLOAT)
+        buf += _DOUBLE.pack(value)
+    elif isinstance(value, str):
+        buf.append(_STR)
+        _write_str(buf, value)
+    elif isinstance(value, (bytes, bytearray)):
+        buf.append(_BYTES)
+        _write_uvarint(buf, len(value))
+        buf += value
+    elif isinstance(value, dict):
+        buf.append(_MAP)
+        _write_uvarint(buf, len(value))
+        for key, item in value.items():
+            _write_value(buf, key)
+            _write_value(buf, item)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        buf.append(_LIST)
+        _write_uvarint(buf, len(value))
+        for item in value:
+            _write_value(buf, item)
+    elif isinstance(value, BaseModel):
+        _write_fields(buf, value, tuple(value.__fields__))
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        _write_fields(buf, value, tuple(field.name for field in dataclasses.fields(value)))
+    elif isinstance(value, (SecretStr, SecretBytes)):
+        buf.append(_STR)
+        _write_str(buf, _MASKED)
+    else:
+        buf.append(_STR)
+        _write_str(buf, str(value))
+
+
+def _write_fields(buf: bytearray, obj: Any, names: Tuple[str, ...]) -> None:
+    buf.append(_MAP)
+    _write_uvarint(buf, len(names))
+    for name in names:
+        buf.append(_STR)
+        _write_str(buf, name)
+        _write_value(buf, getattr(obj, name))
+
+
+def _write_state(buf: bytearray, payload: misc.StatePayload) -> None:
+    _write_optional_str(buf, payload.state)
+    _write_optional_str(buf, payload.old_state)
+
+
+def _write_progress(buf: bytearray, payload: misc.Progress) -> None:
+    _write_int(buf, payload.current)
+    _write_int(buf, payload.total)
+    _write_int(buf, payload.loop)
+
+
+_SCHEMA_WRITERS: Dict[misc.EMsgType, Tuple[type, Callable[[bytearray, Any], None]]] = {
+    misc.EMsgType.STATE: (misc.StatePayload, _write_state),
+    misc.EMsgType.PROGRESS: (misc.Progress, _write_progress),
+}
+
+
+def encode_into(buf: bytearray, msg: misc.Message) -> None:
+    """Append the frame of the message to the buffer."""
+    start = len(buf)
+    buf += HEADER.pack(0, 0)
+    _write_str(buf, msg.pipe_name)
+    _write_uvarint(buf, msg.seq)
+    buf += _DOUBLE.pack(msg.timestamp)
+    _write_value(buf, msg.meta)
+    tag = TAGS[msg.type]
+    schema = _SCHEMA_WRITERS.get(msg.type)
+    if schema and isinstance(msg.payload, schema[0]):
+        schema[1](buf, msg.payload)
+    else:
+        tag |= GENERIC_PAYLOAD
+        _write_value(buf, msg.payload)
+    HEADER.pack_into(buf, start, len(buf) - start - _LENGTH.size, tag)
+
+
+def encode(msg: misc.Message) -> bytes:
+    """Encode the message into a frame."""
+    buf = bytearray()
+    encode_into(buf, msg)
+    return bytes(buf)
+
+# endregion
+
+
+# region Decoding
+
+class _Reader:
+    __slots__ = ("data", "pos")
+
+    def __init__(self, data: memoryview) -> None:
+        self.data = data
+        self.pos = 0
+
+    def byte(self) -> int:
+        value = self.data[self.pos]
+        self.pos += 1
+        return value
+
+    def uvarint(self) -> int:
+        shift = result = 0
+        while True:
+            byte = self.byte()
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def read_int(self) -> int:
+        value = self.uvarint()
+        return (value >> 1) if not value & 1 else -((value + 1) >> 1)
+
+    def raw(self, size: int) -> memoryview:
+        end = self.pos + size
+        if end > len(self.data):
+            raise DecodeError("truncated data")
+        chunk = self.data[self.pos:end]
+        self.pos = end
+        return chunk
+
+    def read_str(self) -> str:
+        try:
+            return str(self.raw(self.uvarint()), "utf-8")
+        except UnicodeDecodeError:
+            raise DecodeError("invalid utf-8 string") from None
+
+    def optional_str(self) -> str | None:
+        marker = self.byte()
+        if marker == _NONE:
+            return None
+        if marker != _STR:
+            raise DecodeError(f"unexpected marker {marker:#x}")
+        return self.read_str()
+
+    def value(self) -> Any:
+        marker = self.byte()
+        if marker == _NONE:
+            return None
+        elif marker == _TRUE:
+            return True
+        elif marker == _FALSE:
+            return False
+        elif marker == _INT:
+            return self.read_int()
+        elif marker == _FLOAT:
+            return _DOUBLE.unpack(self.raw(_DOUBLE.size))[0]
+        elif marker == _STR:
+            return self.read_str()
+        elif marker == _BYTES:
+            return bytes(self.raw(self.uvarint()))
+        elif marker == _LIST:
+            return [self.value() for _ in range(self.uvarint())]
+        elif marker == _MAP:
+            try:
+                return {self.value(): self.value() for _ in range(self.uvarint())}
+            except TypeError:
+                raise DecodeError("unhashable map key") from None
+        raise DecodeError(f"unknown marker {marker:#x}")
+
+
+def _read_state(reader: _Reader) -> misc.StatePayload:
+    return misc.StatePayload.construct(state=reader.optional_str(), old_state=reader.optional_str())
+
+
+def _read_progress(reader: _Reader) -> misc.Progress:
+    return misc.Progress.construct(current=reader.read_int(), total=reader.read_int(), loop=reader.read_int())
+
+
+_SCHEMA_READERS: Dict[misc.EMsgType, Callable[[_Reader], Any]] = {
+    misc.EMsgType.STATE: _read_state,
+    misc.EMsgType.PROGRESS: _read_progress,
+}
+
+
+def decode_body(tag: int, body: bytes | bytearray | memoryview) -> misc.Message:
+    """Decode the part of a frame which is following the header."""
+    msg_type = TYPES.get(tag & ~GENERIC_PAYLOAD)
+    if msg_type is None:
+        raise DecodeError(f"unknown tag {tag:#x}")
+    reader = _Reader(memoryview(body))
+    try:
+        pipe_name = reader.read_str()
+        seq = reader.uvarint()
+        timestamp = _DOUBLE.unpack(reader.raw(_DOUBLE.size))[0]
+        meta = reader.value()
+        if tag & GENERIC_PAYLOAD:
+            payload = reader.value()
+        else:
+            payload = _SCHEMA_READERS[msg_type](reader)
+    except IndexError:
+        raise DecodeError("truncated data") from None
+    return misc.Message.construct(
+        pipe_name=pipe_name,
+        seq=seq,
+        timestamp=timestamp,
+        meta=meta,
+        type=msg_type,
+        payload=payload
+    )
+
+
+def _check_length(length: int) -> None:
+    # the length is covering at least the tag
+    if length < HEADER.size - _LENGTH.size:
+        raise DecodeError(f"invalid frame length {length}")
+
+
+def decode(frame: bytes | bytearray | memoryview) -> misc.Message:
+    """Decode a single frame, including its length prefix."""
+    length, tag = HEADER.unpack_from(frame)
+    _check_length(length)
+    if length + _LENGTH.size != len(frame):
+        raise DecodeError("length mismatch")
+    return decode_body(tag, memoryview(frame)[HEADER.size:])
+
+
+def iter_decode(data: bytes | bytearray | memoryview) -> Iterator[misc.Message]:
+    """Decode consecutive frames from the buffer."""
+    view = memoryview(data)
+    pos = 0
+    while pos < len(view):
+        if len(view) - pos < HEADER.size:
+            raise DecodeError("truncated header")
+        length, tag = HEADER.unpack_from(view, pos)
+        _check_length(length)
+        end = pos + _LENGTH.size + length
+        if end > len(view):
+            raise DecodeError("truncated data")
+        yield decode_body(tag, view[pos + HEADER.size:end])
+        pos = end
+
+# endregion
+
+
+# region Streaming
+
+async def write_messages(writer: asyncio.StreamWriter, messages: AsyncIterable[misc.Message] | AsyncIterable[list[misc.Message]]) -> None:
+    """Encode messages, or batches of messages, into the stream respecting its flow control."""
+    async for item in messages:
+        buf = bytearray()
+        for msg in (item if isinstance(item, list) else (item,)):
+            encode_into(buf, msg)
+        writer.write(buf)
+        await writer.drain()
+
+
+async def read_messages(reader: asyncio.StreamReader) -> AsyncGenerator[misc.Message, None]:
+    """Decode messages from the stream till it is closed."""
+    while True:
+        try:
+            header = await reader.readexactly(HEADER.size)
+        except asyncio.IncompleteReadError as e:
+            if e.partial:
+                raise DecodeError("truncated header") from None
+            return
+        length, tag = HEADER.unpack(header)
+        _check_length(length)
+        try:
+            body = await reader.readexactly(length - 1)
+        except asyncio.IncompleteReadError:
+            raise DecodeError("truncated data") from None
+        yield decode_body(tag, body)
+
+# endregion
@@ -0,0 +1,116 @@
+from __future__ import annotations
+import asyncio
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from . import misc
+from .queues import MessagesQueue
+from .routing import SubscriptionFilter
+
+_Route = Tuple[Optional[SubscriptionFilter], Tuple[Tuple[str, MessagesQueue], ...]]
+
+
+class FanOut:
+    """
+    Delivers messages of the pipe to all of its subscribers.
+
+    Subscribers are kept in a tuple which is replaced on each subscribe/unsubscribe (copy-on-write),
+    so the dispatching never takes a lock and iterates over a consistent snapshot.
+    Messages are pushed with `put_nowait`, only a full subscriber with the BLOCK policy makes the dispatch wait.
+
+    Subscribers are routed by an index of the message types, rebuilt on each subscribe/unsubscribe as well.
+    Subscribers with the same content predicates are grouped, so each predicate is evaluated once per message
+    and unwanted messages are never queued to the subscribers.
+
+    Messages discarded by the overflow policy of a subscriber are counted per subscriber at the dispatching,
+    so a queue shared by multiple pipes reports to each pipe only the messages discarded because of it.
+    """
+
+    __slots__ = ("__streams", "__not_closing", "__filters", "__index", "__dropped")
+
+    def __init__(self) -> None:
+        self.__streams: Tuple[Tuple[str, MessagesQueue], ...] = tuple()
+        self.__not_closing: Set[str] = set()
+        self.__filters: Dict[str, SubscriptionFilter] = {}
+        self.__index: Dict[misc.EMsgType, Tuple[_Route, ...]] = {}
+        self.__dropped: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.__streams)
+
+    @property
+    def streams(self) -> Tuple[Tuple[str, MessagesQueue], ...]:
+        return self.__streams
+
+    def __rebuild_index(self) -> None:
+        index: Dict[misc.EMsgType, Tuple[_Route, ...]] = {}
+        for msg_type in misc.EMsgType:
+            groups: Dict[Optional[SubscriptionFilter], List[Tuple[str, MessagesQueue]]] = {}
+            for key, stm in self.__streams:
+                flt = self.__filters.get(key)
+                if flt is None:
+                    groups.setdefault(None, []).append((key, stm))
+                elif flt.accepts_type(msg_type):
+                    groups.setdefault(flt.predicates, []).append((key, stm))
+            if groups:
+                index[msg_type] = tuple((predicates, tuple(queues)) for predicates, queues in groups.items())
+        self.__index = index
+
+    def subscribe(self, key: str, queue: MessagesQueue, *, closing: bool = True, _filter: SubscriptionFilter | None = None) -> None:
+        """
+        Add the subscriber queue.
+
+        :param closing: put the end of stream marker into the queue when the fan-out is closed,
+            it's disabled for the queues which are shared by multiple pipes and outlive them
+        :param _filter: only the messages matching the filter are delivered to the subscriber
+        """
+        if not closing:
+            self.__not_closing.add(key)
+        if _filter is not None:
+            self.__filters[key] = _filter
+        self.__streams = (*self.__streams, (key, queue))
+        self.__rebuild_index()
+
+    def unsubscribe(self, key: str) -> Optional[MessagesQueue]:
+        detached = None
+        streams = []
+        for stm_key, stm in self.__streams:
+            if stm_key == key:
+                detached = stm
+            else:
+                streams.append((stm_key, stm))
+        self.__streams = tuple(streams)
+        self.__not_closing.discard(key)
+        self.__filters.pop(key, None)
+        self.__dropped.pop(key, None)
+        self.__rebuild_index()
+        if detached is not None:
+            detached.discard_pending()  # release the dispatch if it is waiting for this subscriber
+        return detached
+
+    def dropped(self, key: str) -> int:
+        """Amount of the messages of this fan-out discarded by the subscriber."""
+        return self.__dropped.get(key, 0)
+
+    async def dispatch(self, msg: misc.Message) -> None:
+        for predicates, queues in self.__index.get(msg.type, ()):
+            if predicates is not None and not predicates.matches(msg):
+                continue
+            for key, stm in queues:
+                dropped = stm.dropped
+                try:
+                    stm.put_nowait(msg)
+                except asyncio.QueueFull:
+                    await stm.put(msg)
+                if stm.dropped != dropped:
+                    self.__dropped[key] = self.__dropped.get(key, 0) + stm.dropped - dropped
+
+    def close(self) -> None:
+        for key, stm in self.__streams:
+            if key not in self.__not_closing:
+                stm.close()
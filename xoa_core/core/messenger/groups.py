@@ -0,0 +1,75 @@
+from __future__ import annotations
+import asyncio
+from typing import (
+    AsyncGenerator,
+    Set,
+)
+
+from . import misc
+from .queues import MessagesQueue
+
+
+class Delivery:
+    """Message delivered to a member of a consumer group, it stays in-flight till it's acknowledged."""
+
+    __slots__ = ("message", "__in_flight", "__credits", "__queue")
+
+    def __init__(self, message: misc.Message, in_flight: Set[Delivery], credits: asyncio.Semaphore, queue: MessagesQueue) -> None:
+        self.message = message
+        self.__in_flight = in_flight
+        self.__credits = credits
+        self.__queue = queue
+
+    def __settle(self) -> bool:
+        if self not in self.__in_flight:
+            return False
+        self.__in_flight.discard(self)
+        self.__credits.release()
+        return True
+
+    def ack(self) -> None:
+        """Confirm the processing of the message, repeated calls have no effect."""
+        self.__settle()
+
+    def nack(self) -> None:
+        """Reject the message, it is delivered again to any member of the group."""
+        if self.__settle():
+            self.__queue.requeue(self.message)
+
+
+class ConsumerGroup:
+    """
+    Subscription shared by competing members, each message is delivered to exactly one of them.
+
+    Each member holds at most `prefetch` unacknowledged deliveries,
+    deliveries which are not acknowledged when their member leaves the group are delivered to the rest of the members.
+    """
+
+    __slots__ = ("name", "key", "queue", "members")
+
+    def __init__(self, name: str, key: str, queue: MessagesQueue) -> None:
+        self.name = name
+        self.key = key
+        """Key of the group subscription in the pipes."""
+        self.queue = queue
+        self.members = 0
+
+    async def consume(self, prefetch: int) -> AsyncGenerator[Delivery, None]:
+        in_flight: Set[Delivery] = set()
+        credits = asyncio.Semaphore(prefetch)
+        self.members += 1
+        try:
+            while True:
+                await credits.acquire()
+                msg = await self.queue.get()
+                self.queue.task_done()
+                if msg is None:
+                    self.queue.close()  # pass the end of stream marker to the rest of the members
+                    break
+                delivery = Delivery(msg, in_flight, credits, self.queue)
+                in_flight.add(delivery)
+                yield delivery
+        finally:
+            self.members -= 1
+            for delivery in sorted(in_flight, key=lambda d: d.message.seq, reverse=True):
+                delivery.nack()
@@ -1,17 +1,37 @@
 from __future__ import annotations
 import asyncio
+import fnmatch
+import time
 import uuid
 import contextlib
 from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
     Set,
+    Tuple,
     AsyncGenerator
 )
 from xoa_core.core.utils import observer
-from .pipe import MesagesPipe
+from .groups import (
+    ConsumerGroup,
+    Delivery,
+)
+from .metrics import PipeMetrics
+from .pipe import (
+    MesagesPipe,
+    non_blocking_policy,
+)
+from .queues import MessagesQueue
+from .routing import SubscriptionFilter
 from . import misc
 
 
-async def _get_from_queue(queue: asyncio.Queue[misc.Message | None]) -> AsyncGenerator[misc.Message | None, None]:
+async def _get_from_queue(queue: MessagesQueue) -> AsyncGenerator[misc.Message | None, None]:
     while True:
         msg = await queue.get()
         try:
@@ -20,52 +40,293 @@ async def _get_from_queue(queue: asyncio.Queue[misc.Message | None]) -> AsyncGen
             queue.task_done()
 
 
+async def _get_batches_from_queue(queue: MessagesQueue, max_batch: int, max_wait: float) -> AsyncGenerator[List[misc.Message | None], None]:
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + max_wait
+        while len(batch) < max_batch and batch[-1] is not None:
+            if not queue.empty():
+                batch.append(queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        try:
+            yield batch
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+class _Watcher(NamedTuple):
+    patterns: Tuple[str, ...]
+    queue: MessagesQueue
+    filter: Optional[SubscriptionFilter]
+
+    def matches(self, name: str) -> bool:
+        return any(fnmatch.fnmatchcase(name, pattern) for pattern in self.patterns)
+
+    def notify(self, event: misc.Message) -> None:
+        if self.filter is None or self.filter.accepts_type(misc.EMsgType.PIPE):
+            self.queue.put_forced(event)
+
+
+def _pipe_event(name: str, seq: int, event: misc.EPipeEvent) -> misc.Message:
+    return misc.Message.construct(
+        pipe_name=name,
+        seq=seq,
+        timestamp=time.time(),
+        meta={},
+        type=misc.EMsgType.PIPE,
+        payload=misc.PipeEvent.construct(name=name, event=event),
+    )
+
+
 class OutMessagesHandler:
-    __slots__ = ("__pipes", "__senders", "__observer",)
+    __slots__ = (
+        "__pipes",
+        "__watchers",
+        "__groups",
+        "__senders",
+        "__observer",
+        "__pipe_maxsize",
+        "__pipe_policy",
+        "__pipe_coalesce",
+        "__pipe_priority",
+        "__pipe_replay_size",
+        "__measure_bytes",
+    )
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        pipe_maxsize: int = 0,
+        pipe_policy: misc.EOverflowPolicy = misc.EOverflowPolicy.DROP_OLDEST,
+        pipe_coalesce: bool = False,
+        pipe_priority: bool = False,
+        pipe_replay_size: int = 0,
+        measure_bytes: bool = False
+    ) -> None:
         self.__pipes: dict[str, MesagesPipe] = dict()
+        self.__watchers: Dict[str, _Watcher] = dict()
+        self.__groups: Dict[Tuple[str, Tuple[str, ...]], ConsumerGroup] = dict()
+        self.__pipe_maxsize = pipe_maxsize
+        self.__pipe_policy = non_blocking_policy(pipe_policy)
+        self.__pipe_coalesce = pipe_coalesce
+        self.__pipe_priority = pipe_priority
+        self.__pipe_replay_size = pipe_replay_size
+        self.__measure_bytes = measure_bytes
         self.__observer = observer.SimpleObserver()
         self.__observer.subscribe(misc.DISABLED, self.__on_pipe_disabled)
 
-    def get_pipe(self, name: str) -> "MesagesPipe":
+    def get_pipe(
+        self,
+        name: str,
+        *,
+        maxsize: int | None = None,
+        policy: misc.EOverflowPolicy | None = None,
+        coalesce: bool | None = None,
+        priority: bool | None = None,
+        replay_size: int | None = None
+    ) -> "MesagesPipe":
         if name in self.__pipes:
             return self.__pipes[name]
         self.__pipes[name] = pipe = MesagesPipe(
             name,
             self.__observer,
+            maxsize=self.__pipe_maxsize if maxsize is None else maxsize,
+            policy=policy or self.__pipe_policy,
+            coalesce=self.__pipe_coalesce if coalesce is None else coalesce,
+            priority=self.__pipe_priority if priority is None else priority,
+            replay_size=self.__pipe_replay_size if replay_size is None else replay_size,
+            measure_bytes=self.__measure_bytes,
         )
+        for key, watcher in self.__watchers.items():
+            if watcher.matches(name):
+                watcher.notify(_pipe_event(name, 0, misc.EPipeEvent.CREATED))
+                pipe._attach_stream(key, watcher.queue, closing=False, _filter=watcher.filter)
         return pipe
 
-    async def disable_pipe(self, name: str) -> None:
+    async def disable_pipe(self, name: str, timeout: float | None = None) -> misc.DrainReport | None:
         if name not in self.__pipes:
             return None
-        await self.__pipes[name].disable()
+        return await self.__pipes[name].disable(timeout)
 
     def avaliable_pipes(self) -> tuple[str, ...]:
         return tuple(self.__pipes.keys())
 
+    def get_drop_counters(self, name: str) -> misc.DropCounters | None:
+        if pipe := self.__pipes.get(name):
+            return pipe.get_drop_counters()
+        return None
+
+    def get_metrics(self, name: str) -> PipeMetrics | None:
+        if pipe := self.__pipes.get(name):
+            return pipe.get_metrics()
+        return None
+
+    def metrics_snapshot(self) -> dict[str, PipeMetrics]:
+        return {name: pipe.get_metrics() for name, pipe in self.__pipes.items()}
+
     async def __on_pipe_disabled(self, name: str) -> None:
-        del self.__pipes[name]
+        pipe = self.__pipes.pop(name)
+        for watcher in self.__watchers.values():
+            if watcher.matches(name):
+                watcher.notify(_pipe_event(name, pipe.last_seq, misc.EPipeEvent.DISABLED))
 
     @contextlib.asynccontextmanager
-    async def __user_stream(self, queue: asyncio.Queue[misc.Message | None], *names: str) -> AsyncGenerator[None, None]:
+    async def __user_stream(
+        self,
+        queue: MessagesQueue,
+        *names: str,
+        _filter: SubscriptionFilter | None = None,
+        replay_from: int | None = None,
+        replay_last: int | None = None
+    ) -> AsyncGenerator[None, None]:
         key = str(uuid.uuid4())
-        pipes = (self.__pipes[name] for name in names)
-        await asyncio.gather(*[pipe._add_stream(key, queue) for pipe in pipes])
+        pipes = tuple(self.__pipes[name] for name in names)
+        await asyncio.gather(*[pipe._add_stream(key, queue, replay_from=replay_from, replay_last=replay_last, _filter=_filter) for pipe in pipes])
         try:
             yield
         finally:
             await asyncio.gather(*[pipe._free_stream(key) for pipe in pipes])
 
-    async def changes(self, *names: str, _filter: Set["misc.EMsgType"] | None = None) -> AsyncGenerator[misc.Message, None]:
+    async def changes(
+        self,
+        *names: str,
+        _filter: Set["misc.EMsgType"] | None = None,
+        meta: Mapping[str, Any] | None = None,
+        payload_keys: Iterable[str] | None = None,
+        maxsize: int = 0,
+        policy: misc.EOverflowPolicy = misc.EOverflowPolicy.BLOCK,
+        coalesce: bool = False,
+        priority: bool = False,
+        replay_from: int | None = None,
+        replay_last: int | None = None
+    ) -> AsyncGenerator[misc.Message, None]:
+        """
+        Subscribe to the pipes, the stream ends when any of them is disabled.
+
+        Messages are filtered by the pipe before being queued to the subscriber:
+        `_filter` is the accepted message types, `meta` is the accepted value (or a collection of values)
+        per `Message.meta` field and `payload_keys` are the keys the payload must contain.
+        """
         if not all((self.__pipes.get(name) for name in names)):
             return
-        msg_queue: asyncio.Queue["misc.Message" | None] = asyncio.Queue()
-        async with self.__user_stream(msg_queue, *names):
+        msg_queue = MessagesQueue(maxsize, policy, coalesce=coalesce, priority=priority)
+        subscription_filter = SubscriptionFilter.build(_filter, meta, payload_keys)
+        async with self.__user_stream(msg_queue, *names, _filter=subscription_filter, replay_from=replay_from, replay_last=replay_last):
             async for msg in _get_from_queue(msg_queue):
                 if msg is None:
                     break
-                if _filter and msg.type not in _filter:
-                    continue
                 yield msg
+
+    async def changes_batched(
+        self,
+        *names: str,
+        _filter: Set["misc.EMsgType"] | None = None,
+        meta: Mapping[str, Any] | None = None,
+        payload_keys: Iterable[str] | None = None,
+        max_batch: int = 100,
+        max_wait: float = 0.05,
+        maxsize: int = 0,
+        policy: misc.EOverflowPolicy = misc.EOverflowPolicy.BLOCK,
+        coalesce: bool = False,
+        priority: bool = False,
+        replay_from: int | None = None,
+        replay_last: int | None = None
+    ) -> AsyncGenerator[List[misc.Message], None]:
+        """Same as `changes` but yields lists of up to `max_batch` messages, collected during at most `max_wait` seconds."""
+        if not all((self.__pipes.get(name) for name in names)):
+            return
+        msg_queue = MessagesQueue(maxsize, policy, coalesce=coalesce, priority=priority)
+        subscription_filter = SubscriptionFilter.build(_filter, meta, payload_keys)
+        async with self.__user_stream(msg_queue, *names, _filter=subscription_filter, replay_from=replay_from, replay_last=replay_last):
+            async for batch in _get_batches_from_queue(msg_queue, max_batch, max_wait):
+                messages = [msg for msg in batch if msg is not None]
+                if messages:
+                    yield messages
+                if batch[-1] is None:
+                    break
+
+    async def changes_matching(
+        self,
+        *patterns: str,
+        _filter: Set["misc.EMsgType"] | None = None,
+        meta: Mapping[str, Any] | None = None,
+        payload_keys: Iterable[str] | None = None,
+        maxsize: int = 0,
+        policy: misc.EOverflowPolicy = misc.EOverflowPolicy.BLOCK,
+        coalesce: bool = False,
+        priority: bool = False,
+        replay_from: int | None = None,
+        replay_last: int | None = None
+    ) -> AsyncGenerator[misc.Message, None]:
+        """
+        Subscribe to all pipes with the names matching any of the shell-style patterns,
+        including the pipes created after the subscription.
+
+        Creation and disabling of the matching pipes is delivered as PIPE messages with the `PipeEvent` payload,
+        the pipes existing at the moment of the subscription are reported as created.
+        The stream is never ending by itself.
+        """
+        key = str(uuid.uuid4())
+        watcher = _Watcher(
+            patterns,
+            MessagesQueue(maxsize, policy, coalesce=coalesce, priority=priority),
+            SubscriptionFilter.build(_filter, meta, payload_keys),
+        )
+        for name, pipe in self.__pipes.items():
+            if watcher.matches(name):
+                watcher.notify(_pipe_event(name, pipe.last_seq, misc.EPipeEvent.CREATED))
+                pipe._attach_stream(key, watcher.queue, replay_from=replay_from, replay_last=replay_last, closing=False, _filter=watcher.filter)
+        self.__watchers[key] = watcher
+        try:
+            async for msg in _get_from_queue(watcher.queue):
+                if msg is not None:
+                    yield msg
+        finally:
+            del self.__watchers[key]
+            await asyncio.gather(*[pipe._free_stream(key) for name, pipe in tuple(self.__pipes.items()) if watcher.matches(name)])
+
+    async def group_changes(
+        self,
+        group: str,
+        *names: str,
+        _filter: Set["misc.EMsgType"] | None = None,
+        meta: Mapping[str, Any] | None = None,
+        payload_keys: Iterable[str] | None = None,
+        prefetch: int = 10,
+        maxsize: int = 0,
+        policy: misc.EOverflowPolicy = misc.EOverflowPolicy.BLOCK,
+        coalesce: bool = False,
+        priority: bool = False
+    ) -> AsyncGenerator[Delivery, None]:
+        """
+        Join the consumer group of the pipes, each message is delivered to exactly one member of the group.
+
+        The group is identified by its name and the names of the pipes, the subscription options
+        of the group are defined by its first member. The group subscription ends when the last member leaves.
+        Each delivery must be acknowledged, a member holds at most `prefetch` unacknowledged deliveries.
+        """
+        if not all((self.__pipes.get(name) for name in names)):
+            return
+        group_key = (group, names)
+        if (consumer_group := self.__groups.get(group_key)) is None:
+            consumer_group = ConsumerGroup(group, str(uuid.uuid4()), MessagesQueue(maxsize, policy, coalesce=coalesce, priority=priority))
+            subscription_filter = SubscriptionFilter.build(_filter, meta, payload_keys)
+            for name in names:
+                self.__pipes[name]._attach_stream(consumer_group.key, consumer_group.queue, _filter=subscription_filter)
+            self.__groups[group_key] = consumer_group
+        try:
+            async for delivery in consumer_group.consume(prefetch):
+                yield delivery
+        finally:
+            if not consumer_group.members:
+                del self.__groups[group_key]
+                await asyncio.gather(*[pipe._free_stream(consumer_group.key) for name in names if (pipe := self.__pipes.get(name))])
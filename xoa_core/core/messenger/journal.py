@@ -0,0 +1,231 @@
+"""
+Append-only journal of the message pipes.
+
+Messages of each pipe are written into its own directory as a sequence of segment files,
+segment file name is the start time of the journaling run (in nanoseconds) followed by the sequence number
+of its first message. Sequence numbers restart with every process, so segments of different runs are never mixed.
+A segment is a sequence of records::
+
+    +----------+-----------+---------------------+
+    |   seq    | timestamp |    codec frame      |
+    |  uint64  |  float64  | (length prefixed)   |
+    +----------+-----------+---------------------+
+
+Record header duplicates the `seq` and `timestamp` of the message,
+so the reader can seek through a segment without decoding of the messages.
+"""
+from __future__ import annotations
+import asyncio
+import contextlib
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import (
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from . import (
+    codec,
+    misc,
+)
+from .handler import OutMessagesHandler
+
+RECORD_HEADER = struct.Struct(">Qd")
+SEGMENT_SUFFIX = ".seg"
+
+
+class UnknownPipeError(LookupError):
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.msg = f"Can't journal the pipe {name!r}, it doesn't exist or it's already disabled"
+        super().__init__(self.msg)
+
+
+def _pipe_directory(root: Path, pipe_name: str) -> Path:
+    return root / pipe_name.replace("/", "_").replace("\\", "_")
+
+
+def _segment_name(run: int, first_seq: int) -> str:
+    return f"{run:020d}-{first_seq:020d}{SEGMENT_SUFFIX}"
+
+
+def _parse_segment_name(segment: Path) -> Tuple[str, int]:
+    run, _, first_seq = segment.stem.rpartition("-")
+    return run, int(first_seq)
+
+
+class _SegmentsWriter:
+    """Synchronous part of the writer, all of its methods are called from the journal thread."""
+
+    __slots__ = ("directory", "segment_size", "run", "__file")
+
+    def __init__(self, directory: Path, segment_size: int) -> None:
+        self.directory = directory
+        self.segment_size = segment_size
+        self.run = time.time_ns()
+        self.__file: Optional[BinaryIO] = None
+
+    def write(self, first_seq: int, data: bytes) -> None:
+        if self.__file is None or self.__file.tell() >= self.segment_size:
+            self.close()
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # segments are never reopened, the sequence numbers of a segment always increase
+            self.__file = open(self.directory / _segment_name(self.run, first_seq), "xb")
+        self.__file.write(data)
+        self.__file.flush()
+
+    def close(self) -> None:
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+
+class JournalWriter:
+    """
+    Persists the messages of the pipes for the post-mortem analysis.
+
+    Each attached pipe is consumed by a lossless subscriber, messages are encoded in batches
+    and written to the segment files by a background thread, out of the event loop.
+    When the pipes keep a replay buffer, messages transmitted before the attachment are journaled too.
+    """
+
+    __slots__ = ("directory", "__handler", "__segment_size", "__flush_interval", "__buffer", "__thread", "__tasks")
+
+    def __init__(
+        self,
+        handler: OutMessagesHandler,
+        directory: str | Path,
+        *,
+        segment_size: int = 64 * 1024 * 1024,
+        flush_interval: float = 0.5,
+        buffer: int = 10_000
+    ) -> None:
+        self.directory = Path(directory)
+        self.__handler = handler
+        self.__segment_size = segment_size
+        self.__flush_interval = flush_interval
+        self.__buffer = buffer
+        self.__thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="MessagesJournal")
+        self.__tasks: Dict[str, asyncio.Task] = {}
+
+    @property
+    def attached_pipes(self) -> tuple[str, ...]:
+        return tuple(self.__tasks.keys())
+
+    def attach(self, *names: str) -> None:
+        """
+        Start journaling of the pipes, till they are disabled or detached.
+
+        `UnknownPipeError` is raised when any of the pipes doesn't exist, none of the pipes is attached then.
+        """
+        available = self.__handler.avaliable_pipes()
+        for name in names:
+            if name not in available:
+                raise UnknownPipeError(name)
+        for name in names:
+            if name in self.__tasks:
+                continue
+            task = asyncio.create_task(self.__journal(name), name=f"MessagesJournal[{name}]")
+            task.add_done_callback(lambda _, name=name: self.__tasks.pop(name, None))
+            self.__tasks[name] = task
+
+    async def detach(self, name: str) -> None:
+        if task := self.__tasks.get(name):
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def close(self) -> None:
+        for name in self.attached_pipes:
+            await self.detach(name)
+        self.__thread.shutdown(wait=True)
+
+    async def __journal(self, name: str) -> None:
+        loop = asyncio.get_running_loop()
+        segments = _SegmentsWriter(_pipe_directory(self.directory, name), self.__segment_size)
+        stream = self.__handler.changes_batched(
+            name,
+            max_batch=self.__buffer,
+            max_wait=self.__flush_interval,
+            maxsize=self.__buffer,
+            policy=misc.EOverflowPolicy.BLOCK,
+            replay_from=0,
+        )
+        try:
+            async for batch in stream:
+                buf = bytearray()
+                for msg in batch:
+                    buf += RECORD_HEADER.pack(msg.seq, msg.timestamp)
+                    codec.encode_into(buf, msg)
+                await loop.run_in_executor(self.__thread, segments.write, batch[0].seq, bytes(buf))
+        finally:
+            await stream.aclose()
+            await loop.run_in_executor(self.__thread, segments.close)
+
+
+class JournalReader:
+    """Reads journaled messages of a pipe."""
+
+    __slots__ = ("directory",)
+
+    def __init__(self, directory: str | Path, pipe_name: str) -> None:
+        self.directory = _pipe_directory(Path(directory), pipe_name)
+
+    def segments(self) -> List[Path]:
+        if not self.directory.is_dir():
+            return []
+        return sorted(self.directory.glob(f"*{SEGMENT_SUFFIX}"))
+
+    @staticmethod
+    def __first_timestamp(segment: Path) -> Optional[float]:
+        with open(segment, "rb") as f:
+            header = f.read(RECORD_HEADER.size)
+        if len(header) < RECORD_HEADER.size:
+            return None
+        return RECORD_HEADER.unpack(header)[1]
+
+    def __select_segments(self, from_seq: Optional[int], from_time: Optional[float]) -> List[Path]:
+        segments = self.segments()
+        if from_seq is None and from_time is None:
+            return segments
+        runs: Dict[str, List[Path]] = {}
+        for segment in segments:
+            runs.setdefault(_parse_segment_name(segment)[0], []).append(segment)
+        selected: List[Path] = []
+        for run_segments in runs.values():
+            start = 0
+            for idx, segment in enumerate(run_segments):
+                if from_seq is not None and _parse_segment_name(segment)[1] > from_seq:
+                    break
+                if from_time is not None and (self.__first_timestamp(segment) or float("inf")) > from_time:
+                    break
+                start = idx
+            selected += run_segments[start:]
+        return selected
+
+    def read(self, *, from_seq: Optional[int] = None, from_time: Optional[float] = None) -> Iterator[misc.Message]:
+        """
+        Stream the journaled messages in the order they were written, run after run.
+
+        :param from_seq: skip messages with a lower sequence number, sequence numbers are compared within each run
+        :param from_time: skip messages created before this Unix time
+        """
+        frame_header_size = codec.HEADER.size
+        for segment in self.__select_segments(from_seq, from_time):
+            with open(segment, "rb") as f:
+                while header := f.read(RECORD_HEADER.size + frame_header_size):
+                    if len(header) < RECORD_HEADER.size + frame_header_size:
+                        raise codec.DecodeError("truncated record")
+                    seq, timestamp = RECORD_HEADER.unpack_from(header)
+                    length, tag = codec.HEADER.unpack_from(header, RECORD_HEADER.size)
+                    if (from_seq is not None and seq < from_seq) or (from_time is not None and timestamp < from_time):
+                        f.seek(length - 1, 1)
+                        continue
+                    body = f.read(length - 1)
+                    yield codec.decode_body(tag, body)
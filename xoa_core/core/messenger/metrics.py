@@ -0,0 +1,86 @@
+from __future__ import annotations
+import collections
+import time
+from typing import (
+    Dict,
+    Iterable,
+    Tuple,
+)
+
+from pydantic import BaseModel
+
+from xoa_core.core.utils.histogram import (
+    Histogram,
+    HistogramSnapshot,
+)
+from . import (
+    codec,
+    misc,
+)
+from .queues import MessagesQueue
+
+
+class SubscriberMetrics(BaseModel):
+    pending: int
+    """Messages waiting for being consumed, the lag of the subscriber."""
+    high_water: int
+    """The highest amount of pending messages."""
+    dropped: int
+    coalesced: int
+
+
+class PipeMetrics(BaseModel):
+    name: str
+    last_seq: int
+    queue_depth: int
+    queue_high_water: int
+    dropped: int
+    coalesced: int
+    dispatch_latency: HistogramSnapshot
+    """Time in seconds from the message transmission till its dispatching to the subscribers."""
+    messages: Dict[str, int]
+    """Dispatched messages per EMsgType."""
+    bytes: Dict[str, int]
+    """Encoded size of the dispatched messages per EMsgType, collected only if the pipe measures bytes."""
+    subscribers: Dict[str, SubscriberMetrics]
+
+
+def _subscriber_metrics(queue: MessagesQueue) -> SubscriberMetrics:
+    return SubscriberMetrics(
+        pending=queue.qsize(),
+        high_water=queue.high_water,
+        dropped=queue.dropped,
+        coalesced=queue.coalesced,
+    )
+
+
+class PipeMetricsRecorder:
+    """Collects the metrics of the pipe dispatching, it's called by the pipe worker for each message."""
+
+    __slots__ = ("__latency", "__messages", "__bytes", "__measure_bytes")
+
+    def __init__(self, measure_bytes: bool = False) -> None:
+        self.__measure_bytes = measure_bytes
+        self.__latency = Histogram()
+        self.__messages: Dict[misc.EMsgType, int] = collections.defaultdict(int)
+        self.__bytes: Dict[misc.EMsgType, int] = collections.defaultdict(int)
+
+    def on_dispatch(self, msg: misc.Message) -> None:
+        self.__latency.observe(time.monotonic() - msg._enqueued)
+        self.__messages[msg.type] += 1
+        if self.__measure_bytes:
+            self.__bytes[msg.type] += len(codec.encode(msg))
+
+    def snapshot(self, name: str, last_seq: int, queue: MessagesQueue, streams: Iterable[Tuple[str, MessagesQueue]]) -> PipeMetrics:
+        return PipeMetrics(
+            name=name,
+            last_seq=last_seq,
+            queue_depth=queue.qsize(),
+            queue_high_water=queue.high_water,
+            dropped=queue.dropped,
+            coalesced=queue.coalesced,
+            dispatch_latency=self.__latency.snapshot(),
+            messages={t.value: count for t, count in self.__messages.items()},
+            bytes={t.value: count for t, count in self.__bytes.items()},
+            subscribers={key: _subscriber_metrics(stm) for key, stm in streams},
+        )
@@ -6,7 +6,7 @@ from typing import (
     Any,
 )
 from enum import Enum
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 DISABLED = 1
 
@@ -18,13 +18,71 @@ class EMsgType(Enum):
     PROGRESS = "PROGRESS"
     WARNING = "WARNING"
     ERROR = "ERROR"
+    PIPE = "PIPE"
+    """Lifecycle event of a pipe, delivered to the pattern subscriptions only."""
+
+
+class EPipeEvent(Enum):
+    CREATED = "CREATED"
+    DISABLED = "DISABLED"
+
+
+class EOverflowPolicy(Enum):
+    """Behaviour of a bounded messages queue when it reached its capacity."""
+
+    BLOCK = "BLOCK"
+    """Producer waits till consumer free a space in the queue."""
+    DROP_OLDEST = "DROP_OLDEST"
+    """The oldest pending message is discarded in favor of the new one."""
+    DROP_NEWEST = "DROP_NEWEST"
+    """The new message is discarded."""
+    COALESCE = "COALESCE"
+    """The latest pending message of the same type is replaced by the new one."""
 
 
 class Message(BaseModel):
+    """
+    Message delivered to the subscribers.
+
+    Messages produced by the framework are built with `construct()`, their content is trusted
+    and the validation is skipped, the result is the same for `.dict()` and `.json()`.
+    """
+
     pipe_name: str
+    seq: int = 0
+    """Number of the message in its pipe, monotonically increasing, gaps are the result of dropped or coalesced messages."""
+    timestamp: float = 0.0
+    """Unix time of the message creation, it's for the display only, the wall clock can jump."""
     meta: Dict[str, Any] = {}
     type: EMsgType = EMsgType.DATA
     payload: Any
+    _enqueued: float = PrivateAttr(default=0.0)
+    """Monotonic time the message was put in its pipe, it's not serialized."""
+
+
+class DropCounters(BaseModel):
+    pipe: int
+    """Messages discarded by the pipe queue itself."""
+    subscribers: int
+    """Messages discarded by all subscribers queues, including the detached ones."""
+    per_subscriber: Dict[str, int]
+    """Messages discarded by each currently attached subscriber."""
+
+
+class PipeEvent(BaseModel):
+    name: str
+    event: EPipeEvent
+
+
+class DrainReport(BaseModel):
+    name: str
+    flushed: int
+    """Messages dispatched to the subscribers after the pipe was disabled."""
+    abandoned: int
+    """Messages discarded because the deadline was reached."""
+    timed_out: bool
+    duration: float
+    """Seconds spent on the draining."""
 
 
 class StatePayload(BaseModel):
@@ -50,7 +108,7 @@ class PipeStateFacade:
         self.__transmit = transmit
 
     def __call__(self, state: str | None, old_state: str | None) -> None:
-        data = StatePayload(
+        data = StatePayload.construct(
             state=state,
             old_state=old_state
         )
@@ -64,16 +122,21 @@ class PipeFacade:
         self.__transmit = transmit
         self.__suite_name = suite_name
 
-    def send_statistics(self, data: dict[str, Any] | "BaseModel") -> None:
-        self.__transmit(data, msg_type=EMsgType.STATISTICS, suite_name=self.__suite_name)
+    def __meta(self, key: str | None) -> dict[str, Any]:
+        if key is None:
+            return {"suite_name": self.__suite_name}
+        return {"suite_name": self.__suite_name, "key": key}
+
+    def send_statistics(self, data: dict[str, Any] | "BaseModel", key: str | None = None) -> None:
+        self.__transmit(data, msg_type=EMsgType.STATISTICS, **self.__meta(key))
 
-    def send_progress(self, current: int, total: int = 100, loop: int = 0) -> None:
-        progress = Progress(
+    def send_progress(self, current: int, total: int = 100, loop: int = 0, key: str | None = None) -> None:
+        progress = Progress.construct(
             current=current,
             total=total,
             loop=loop,
         )
-        self.__transmit(progress, msg_type=EMsgType.PROGRESS, suite_name=self.__suite_name)
+        self.__transmit(progress, msg_type=EMsgType.PROGRESS, **self.__meta(key))
 
     def send_warning(self, warning: Exception) -> None:
         self.__transmit(str(warning), msg_type=EMsgType.WARNING, suite_name=self.__suite_name)
@@ -1,71 +1,191 @@
 from __future__ import annotations
 import asyncio
+import collections
 import contextlib
+import time
 from functools import partialmethod
 from typing import (
     Any,
+    Deque,
     Final,
+    List,
 )
 
 from xoa_core.core.generic_types import TObserver
 from . import misc
+from .fanout import FanOut
+from .metrics import (
+    PipeMetrics,
+    PipeMetricsRecorder,
+)
+from .queues import MessagesQueue
+from .routing import SubscriptionFilter
+
+
+def non_blocking_policy(policy: misc.EOverflowPolicy) -> misc.EOverflowPolicy:
+    """The senders of the pipe are never waiting, the pipe can't use the BLOCK overflow policy."""
+    if policy is misc.EOverflowPolicy.BLOCK:
+        raise ValueError("The BLOCK overflow policy is not supported by the messages pipes, the senders can't wait")
+    return policy
 
 
 class MesagesPipe:
-    __slots__ = ("name", "__evt", "__queue", "__observer", "__push_streams", "__lock", "__procesor")
+    __slots__ = ("name", "__evt", "__queue", "__observer", "__fanout", "__procesor", "__detached_dropped", "__seq", "__history", "__metrics", "__dispatching")
 
-    def __init__(self, name: str, observer: "TObserver") -> None:
+    def __init__(
+        self,
+        name: str,
+        observer: "TObserver",
+        *,
+        maxsize: int = 0,
+        policy: misc.EOverflowPolicy = misc.EOverflowPolicy.DROP_OLDEST,
+        coalesce: bool = False,
+        priority: bool = False,
+        replay_size: int = 0,
+        measure_bytes: bool = False
+    ) -> None:
         self.name: Final[str] = name
+        policy = non_blocking_policy(policy)
+        self.__metrics = PipeMetricsRecorder(measure_bytes)
+        self.__seq = 0
+        self.__history: Deque[misc.Message] = collections.deque(maxlen=replay_size)
         self.__evt = asyncio.Event()
-        self.__queue: "asyncio.Queue[misc.Message]" = asyncio.Queue()
+        self.__queue = MessagesQueue(maxsize, policy, coalesce=coalesce, priority=priority)
         self.__observer = observer
-        self.__lock = asyncio.Lock()
-        self.__push_streams: dict[str, asyncio.Queue["misc.Message" | None]] = {}
+        self.__fanout = FanOut()
+        self.__detached_dropped = 0
+        self.__dispatching = False
         self.__procesor = asyncio.create_task(
             self.__worker(),
             name=f"MessagesPipe[{self.name}]"
         )
 
-    async def _add_stream(self, key: str, queue: asyncio.Queue) -> None:
-        async with self.__lock:
-            self.__push_streams[key] = queue
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the last transmitted message."""
+        return self.__seq
+
+    def __replay(self, replay_from: int | None, replay_last: int | None, _filter: SubscriptionFilter | None) -> List[misc.Message]:
+        history = list(self.__history)
+        if _filter is not None:
+            history = [msg for msg in history if _filter.matches(msg)]
+        if replay_from is not None:
+            history = [msg for msg in history if msg.seq >= replay_from]
+        if replay_last is not None:
+            history = history[len(history) - replay_last:] if replay_last > 0 else []
+        return history
+
+    async def _add_stream(
+        self,
+        key: str,
+        queue: MessagesQueue,
+        *,
+        replay_from: int | None = None,
+        replay_last: int | None = None,
+        _filter: SubscriptionFilter | None = None
+    ) -> None:
+        self._attach_stream(key, queue, replay_from=replay_from, replay_last=replay_last, _filter=_filter)
+
+    def _attach_stream(
+        self,
+        key: str,
+        queue: MessagesQueue,
+        *,
+        replay_from: int | None = None,
+        replay_last: int | None = None,
+        closing: bool = True,
+        _filter: SubscriptionFilter | None = None
+    ) -> None:
+        if replay_from is not None or replay_last is not None:
+            history = self.__replay(replay_from, replay_last, _filter)
+            if queue.maxsize > 0 and queue.policy is misc.EOverflowPolicy.BLOCK:
+                history = history[max(len(history) - (queue.maxsize - queue.qsize()), 0):]
+            for msg in history:
+                queue.put_nowait(msg)
+        # No awaits between the replay and the subscription, the subscriber receive each message only once
+        self.__fanout.subscribe(key, queue, closing=closing, _filter=_filter)
 
     async def _free_stream(self, key: str) -> None:
-        async with self.__lock:
-            self.__push_streams.pop(key)
-            self.__push_streams = dict(self.__push_streams)
+        dropped = self.__fanout.dropped(key)
+        if self.__fanout.unsubscribe(key) is not None:
+            self.__detached_dropped += dropped
+
+    def get_drop_counters(self) -> misc.DropCounters:
+        per_subscriber = {key: self.__fanout.dropped(key) for key, _ in self.__fanout.streams}
+        return misc.DropCounters(
+            pipe=self.__queue.dropped,
+            subscribers=self.__detached_dropped + sum(per_subscriber.values()),
+            per_subscriber=per_subscriber,
+        )
+
+    def get_metrics(self) -> PipeMetrics:
+        return self.__metrics.snapshot(self.name, self.__seq, self.__queue, self.__fanout.streams)
+
+    @property
+    def __in_flight(self) -> int:
+        """Amount of messages which are not dispatched yet, including the one being dispatched."""
+        return self.__queue.qsize() + self.__dispatching
 
     async def __worker(self) -> None:
         while True:
             val = await self.__queue.get()
-            async with self.__lock:
-                await asyncio.gather(
-                    *[
-                        stm.put(val)
-                        for stm in self.__push_streams.values()
-                    ]
-                )
-            self.__queue.task_done()
-
-    async def disable(self) -> None:
+            self.__dispatching = True
+            self.__history.append(val)
+            self.__metrics.on_dispatch(val)
+            try:
+                await self.__fanout.dispatch(val)
+            finally:
+                self.__dispatching = False
+                self.__queue.task_done()
+
+    async def disable(self, timeout: float | None = None) -> misc.DrainReport:
+        """
+        Close the pipe after all pending messages are dispatched to the subscribers.
+
+        :param timeout: deadline in seconds of the draining, when it's reached the pipe is closed
+            and the messages which are not dispatched yet are abandoned, a stuck subscriber can't block the closing
+        """
         self.__evt.set()
-        await self.__queue.join()
+        started = time.monotonic()
+        pending = self.__in_flight
+        timed_out = False
+        try:
+            await asyncio.wait_for(self.__queue.join(), timeout)
+        except asyncio.TimeoutError:
+            timed_out = True
+        abandoned = self.__in_flight  # including the message the worker is stuck on
         self.__procesor.cancel()
         with contextlib.suppress(asyncio.CancelledError):
             await self.__procesor
-        for stm in self.__push_streams.values():
-            stm.put_nowait(None)  # Inform to stop watching
+        self.__queue.discard_pending()
+        self.__fanout.close()  # Inform to stop watching
         self.__observer.emit(misc.DISABLED, self.name)
+        return misc.DrainReport(
+            name=self.name,
+            flushed=pending - abandoned,
+            abandoned=abandoned,
+            timed_out=timed_out,
+            duration=time.monotonic() - started,
+        )
 
     def transmit(self, msg: Any, *, msg_type: misc.EMsgType = misc.EMsgType.DATA, **meta: Any) -> None:
-        """Unblocable function"""
+        """
+        Unblocable function
+
+        When the pipe is full the message is dropped or coalesced according to the overflow policy of the pipe,
+        the sender never waits and never fails because of it.
+        """
         assert not self.__evt.is_set(), "Message pipe is closed"
-        message = misc.Message(
+        self.__seq += 1
+        message = misc.Message.construct(
             pipe_name=self.name,
+            seq=self.__seq,
+            timestamp=time.time(),
             meta=meta,
             type=msg_type,
             payload=msg
         )
+        message._enqueued = time.monotonic()
         self.__queue.put_nowait(message)
 
     def get_facade(self, suite_name: str) -> misc.PipeFacade:
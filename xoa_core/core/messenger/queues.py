@@ -0,0 +1,209 @@
+from __future__ import annotations
+import asyncio
+import collections
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Optional,
+    Tuple,
+)
+
+from . import misc
+
+COALESCED_TYPES = frozenset((misc.EMsgType.STATISTICS, misc.EMsgType.PROGRESS))
+
+CoalescingKey = Tuple[misc.EMsgType, Any, Any]
+
+
+class _Pending:
+    """Placeholder of the latest value of a coalesced message."""
+
+    __slots__ = ("key", "type")
+
+    def __init__(self, key: CoalescingKey) -> None:
+        self.key = key
+        self.type = key[0]
+
+
+LANES: Dict[misc.EMsgType, int] = {
+    misc.EMsgType.STATE: 0,
+    misc.EMsgType.ERROR: 0,
+    misc.EMsgType.WARNING: 1,
+}
+"""
+Priority lane of the message types, lower is delivered first, the rest of the types are in the last lane.
+PIPE events are in the last lane, so the DISABLED event of a pipe is never delivered before its messages.
+"""
+LANES_COUNT = 3
+
+
+class _Lanes:
+    """
+    Storage of the queue items split into priority lanes, each lane is FIFO.
+
+    Items are taken from the highest priority lane which is not empty,
+    evictions are done from the lowest priority one. The end of stream marker is in the last lane.
+    """
+
+    __slots__ = ("lanes",)
+
+    def __init__(self) -> None:
+        self.lanes: Tuple[Deque[Any], ...] = tuple(collections.deque() for _ in range(LANES_COUNT))
+
+    def __len__(self) -> int:
+        return sum(len(lane) for lane in self.lanes)
+
+    def lane(self, msg_type: misc.EMsgType) -> Deque[Any]:
+        return self.lanes[LANES.get(msg_type, LANES_COUNT - 1)]
+
+    def append(self, item: Any) -> None:
+        if item is None:
+            self.lanes[-1].append(item)
+        else:
+            self.lane(item.type).append(item)
+
+    def popleft(self) -> Any:
+        for lane in self.lanes:
+            if lane:
+                return lane.popleft()
+        raise IndexError("pop from an empty queue")
+
+    def evict(self) -> Any:
+        for lane in reversed(self.lanes):
+            if lane:
+                return lane.popleft()
+        raise IndexError("pop from an empty queue")
+
+
+class MessagesQueue(asyncio.Queue):
+    """
+    Queue of messages with an optional capacity.
+
+    When the capacity is reached the queue applies its overflow policy
+    instead of growing without limit. Only the BLOCK policy is able to make the producer wait,
+    with the rest of the policies `put` and `put_nowait` are never blocking.
+
+    In the coalescing mode only the latest pending STATISTICS and PROGRESS message
+    per `(suite_name, key)` is kept, it is delivered at the place of the first pending one.
+    The rest of the message types are never coalesced.
+
+    In the priority mode STATE and ERROR messages are delivered before WARNING ones
+    and those before the rest of the types, the order is kept within each of the priorities.
+    The overflow policy evicts the lowest priority messages first.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        policy: misc.EOverflowPolicy = misc.EOverflowPolicy.BLOCK,
+        *,
+        coalesce: bool = False,
+        priority: bool = False
+    ) -> None:
+        self.priority = priority
+        super().__init__(maxsize)
+        self.policy = policy
+        self.coalesce = coalesce
+        self.dropped = 0
+        """Amount of messages discarded by the overflow policy."""
+        self.coalesced = 0
+        """Amount of messages superseded by a newer value in the coalescing mode."""
+        self.high_water = 0
+        """The highest amount of pending messages."""
+        self.requeued = 0
+        """Amount of messages returned to the head of the queue."""
+        self.__to_head = False
+        self.__latest: Dict[CoalescingKey, misc.Message] = {}
+
+    def _init(self, maxsize: int) -> None:
+        self._queue = _Lanes() if self.priority else collections.deque()
+
+    def __coalescing_key(self, item: Optional[misc.Message]) -> Optional[CoalescingKey]:
+        if not self.coalesce or item is None or item.type not in COALESCED_TYPES:
+            return None
+        return (item.type, item.meta.get("suite_name"), item.meta.get("key"))
+
+    def _put(self, item: Optional[misc.Message]) -> None:
+        if self.__to_head:
+            lane = self._queue.lane(item.type) if self.priority else self._queue  # type: ignore
+            lane.appendleft(item)
+        elif (key := self.__coalescing_key(item)) is not None:
+            self.__latest[key] = item  # type: ignore
+            self._queue.append(_Pending(key))
+        else:
+            self._queue.append(item)
+        if len(self._queue) > self.high_water:
+            self.high_water = len(self._queue)
+
+    def _get(self) -> Optional[misc.Message]:
+        item = self._queue.popleft()
+        if isinstance(item, _Pending):
+            return self.__latest.pop(item.key)
+        return item
+
+    def __discard_oldest(self) -> None:
+        item = self._queue.evict() if self.priority else self._queue.popleft()
+        if isinstance(item, _Pending):
+            del self.__latest[item.key]
+        self.task_done()
+
+    def __discard_same_type(self, msg_type: misc.EMsgType) -> bool:
+        lane = self._queue.lane(msg_type) if self.priority else self._queue
+        for idx in range(len(lane) - 1, -1, -1):
+            item = lane[idx]
+            if getattr(item, "type", None) is msg_type:
+                del lane[idx]
+                if isinstance(item, _Pending):
+                    del self.__latest[item.key]
+                self.task_done()
+                return True
+        return False
+
+    def put_nowait(self, item: Optional[misc.Message]) -> None:
+        if (key := self.__coalescing_key(item)) is not None and key in self.__latest:
+            self.__latest[key] = item  # type: ignore
+            self.coalesced += 1
+            return None
+        if not self.full():
+            return super().put_nowait(item)
+        if self.policy is misc.EOverflowPolicy.BLOCK:
+            raise asyncio.QueueFull()
+        self.dropped += 1
+        if self.policy is misc.EOverflowPolicy.DROP_NEWEST:
+            return None
+        if self.policy is not misc.EOverflowPolicy.COALESCE or not self.__discard_same_type(item.type):
+            self.__discard_oldest()
+        super().put_nowait(item)
+
+    async def put(self, item: Optional[misc.Message]) -> None:
+        if self.policy is misc.EOverflowPolicy.BLOCK:
+            return await super().put(item)
+        self.put_nowait(item)
+
+    def discard_pending(self) -> None:
+        """Remove all pending messages, producers which are waiting for a free space are released."""
+        while not self.empty():
+            self.get_nowait()
+            self.task_done()
+
+    def put_forced(self, item: Optional[misc.Message]) -> None:
+        """Put the item regardless of the queue capacity and its overflow policy."""
+        maxsize, self._maxsize = self._maxsize, 0
+        try:
+            super().put_nowait(item)
+        finally:
+            self._maxsize = maxsize
+
+    def requeue(self, item: misc.Message) -> None:
+        """Return the item to the head of the queue, regardless of the queue capacity, it's the next to be taken."""
+        self.__to_head = True
+        try:
+            self.put_forced(item)
+        finally:
+            self.__to_head = False
+        self.requeued += 1
+
+    def close(self) -> None:
+        """Put the end of stream marker, regardless of the queue capacity."""
+        self.put_forced(None)
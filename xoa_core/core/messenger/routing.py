@@ -0,0 +1,89 @@
+from __future__ import annotations
+from typing import (
+    Any,
+    Collection,
+    FrozenSet,
+    Iterable,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from pydantic import BaseModel
+
+from . import misc
+
+_MISSING = object()
+
+
+def _accepted_values(value: Any) -> FrozenSet[Any]:
+    if isinstance(value, (set, frozenset, list, tuple)):
+        return frozenset(value)
+    return frozenset((value,))
+
+
+def _payload_keys(payload: Any) -> Collection[str]:
+    if isinstance(payload, dict):
+        return payload.keys()
+    if isinstance(payload, BaseModel):
+        return payload.__fields__.keys()
+    return ()
+
+
+class SubscriptionFilter(NamedTuple):
+    """
+    Predicates of a subscription, evaluated by the pipe worker before the message is queued to the subscriber.
+
+    Filters are hashable, subscribers with equal filters are evaluated once per message.
+    """
+
+    msg_types: Optional[FrozenSet[misc.EMsgType]]
+    """Accepted message types, all types are accepted when it's None."""
+    meta: Tuple[Tuple[str, FrozenSet[Any]], ...]
+    """Accepted values of the `Message.meta` fields."""
+    payload_keys: FrozenSet[str]
+    """Keys (or fields of a model) the payload must contain."""
+
+    @classmethod
+    def build(
+        cls,
+        msg_types: Iterable[misc.EMsgType] | None = None,
+        meta: Mapping[str, Any] | None = None,
+        payload_keys: Iterable[str] | None = None
+    ) -> Optional[SubscriptionFilter]:
+        """
+        Make a filter, None is returned when nothing is filtered.
+
+        :param meta: value or collection of accepted values per meta field
+        """
+        flt = cls(
+            msg_types=frozenset(msg_types) if msg_types else None,
+            meta=tuple(sorted((key, _accepted_values(value)) for key, value in (meta or {}).items())),
+            payload_keys=frozenset(payload_keys or ()),
+        )
+        return flt if flt.msg_types is not None or flt.predicates is not None else None
+
+    @property
+    def predicates(self) -> Optional[SubscriptionFilter]:
+        """The part of the filter which depends on the content of the message, None if there is no such part."""
+        if not self.meta and not self.payload_keys:
+            return None
+        return self._replace(msg_types=None)
+
+    def accepts_type(self, msg_type: misc.EMsgType) -> bool:
+        return self.msg_types is None or msg_type in self.msg_types
+
+    def matches(self, msg: misc.Message) -> bool:
+        if not self.accepts_type(msg.type):
+            return False
+        for key, values in self.meta:
+            try:
+                if msg.meta.get(key, _MISSING) not in values:
+                    return False
+            except TypeError:  # unhashable meta value, e.g. a list, can't be one of the accepted values
+                return False
+        if self.payload_keys:
+            keys = _payload_keys(msg.payload)
+            return all(key in keys for key in self.payload_keys)
+        return True
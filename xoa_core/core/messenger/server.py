@@ -0,0 +1,201 @@
+"""
+Access to the message pipes from other processes over a local Unix domain socket.
+
+Protocol:
+    1. The client sends one line of JSON: ``{"names": [<pipe name>, ...], "filter": [<EMsgType value>, ...]}``,
+       ``filter`` is optional and has the same meaning as the ``_filter`` of ``listen_changes``.
+       Optional ``meta`` and ``payload_keys`` have the same meaning as in ``listen_changes``,
+       optional ``replay_from`` and ``replay_last`` request a replay of the recent messages.
+    2. The server streams the messages of the pipes encoded by the :mod:`codec`,
+       the connection is closed by the server when the pipes are disabled or if any of them is not exists.
+"""
+from __future__ import annotations
+import asyncio
+import contextlib
+import json
+import os
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from . import (
+    codec,
+    misc,
+)
+from .handler import OutMessagesHandler
+
+MAX_REQUEST_SIZE = 64 * 1024
+
+
+class SubscriptionRequestError(ValueError):
+    def __init__(self, reason: str) -> None:
+        self.reason = reason
+        self.msg = f"Invalid subscription request: {reason}"
+        super().__init__(self.msg)
+
+
+class SubscriptionRequest(NamedTuple):
+    names: Tuple[str, ...]
+    msg_types: Optional[Set[misc.EMsgType]]
+    meta: Optional[Dict[str, Any]]
+    payload_keys: Optional[Tuple[str, ...]]
+    replay_from: Optional[int]
+    replay_last: Optional[int]
+
+
+def _optional_int(value: Any) -> int | None:
+    return None if value is None else int(value)
+
+
+def _optional_meta(value: Any) -> Dict[str, Any] | None:
+    if value is None:
+        return None
+    if not isinstance(value, dict):
+        raise TypeError("meta must be an object")
+    return {str(key): tuple(item) if isinstance(item, list) else item for key, item in value.items()}
+
+
+def _parse_request(line: bytes) -> SubscriptionRequest:
+    try:
+        request = json.loads(line)
+        _filter = request.get("filter")
+        return SubscriptionRequest(
+            names=tuple(str(name) for name in request["names"]),
+            msg_types={misc.EMsgType(t) for t in _filter} if _filter else None,
+            meta=_optional_meta(request.get("meta")),
+            payload_keys=tuple(str(key) for key in request["payload_keys"]) if request.get("payload_keys") else None,
+            replay_from=_optional_int(request.get("replay_from")),
+            replay_last=_optional_int(request.get("replay_last")),
+        )
+    except (ValueError, KeyError, TypeError) as e:
+        raise SubscriptionRequestError(str(e)) from None
+
+
+class MessagesServer:
+    """
+    Serves subscriptions to the message pipes over a Unix domain socket.
+
+    Each client gets its own subscriber queue of `client_buffer` messages,
+    when a client can't keep up the queue `policy` is applied, so slow clients never stall the pipes.
+    """
+
+    __slots__ = ("path", "__handler", "__client_buffer", "__policy", "__server", "__clients")
+
+    def __init__(
+        self,
+        handler: OutMessagesHandler,
+        path: str | Path,
+        *,
+        client_buffer: int = 1000,
+        policy: misc.EOverflowPolicy = misc.EOverflowPolicy.DROP_OLDEST
+    ) -> None:
+        self.path = str(path)
+        self.__handler = handler
+        self.__client_buffer = client_buffer
+        self.__policy = policy
+        self.__server: asyncio.AbstractServer | None = None
+        self.__clients: Set[asyncio.Task] = set()
+
+    @property
+    def clients_count(self) -> int:
+        return len(self.__clients)
+
+    async def start(self) -> None:
+        if self.__server is not None:
+            return None
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.path)  # socket file left by the previous run
+        self.__server = await asyncio.start_unix_server(
+            self.__on_client,
+            path=self.path,
+            limit=MAX_REQUEST_SIZE,
+        )
+
+    async def close(self) -> None:
+        if self.__server is None:
+            return None
+        self.__server.close()
+        for client in tuple(self.__clients):
+            client.cancel()
+        await asyncio.gather(*self.__clients, return_exceptions=True)
+        await self.__server.wait_closed()
+        self.__server = None
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.path)
+
+    async def __on_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        self.__clients.add(task)
+        try:
+            request = _parse_request(await reader.readline())
+            await self.__serve(reader, writer, request)
+        except (SubscriptionRequestError, ValueError, ConnectionError):
+            pass  # nothing can be reported to the client, the connection is just closed
+        finally:
+            self.__clients.discard(task)
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def __serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, request: SubscriptionRequest) -> None:
+        stream = self.__handler.changes_batched(
+            *request.names,
+            _filter=request.msg_types,
+            meta=request.meta,
+            payload_keys=request.payload_keys,
+            maxsize=self.__client_buffer,
+            policy=self.__policy,
+            replay_from=request.replay_from,
+            replay_last=request.replay_last,
+        )
+        sending = asyncio.create_task(codec.write_messages(writer, stream))
+        client_gone = asyncio.create_task(reader.read())  # client is not expected to send anything else
+        try:
+            await asyncio.wait((sending, client_gone), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in (sending, client_gone):
+                task.cancel()
+            await asyncio.gather(sending, client_gone, return_exceptions=True)
+            await stream.aclose()
+
+
+async def subscribe(
+    path: str | Path,
+    *names: str,
+    _filter: Iterable[misc.EMsgType] | None = None,
+    meta: Dict[str, Any] | None = None,
+    payload_keys: Iterable[str] | None = None,
+    replay_from: int | None = None,
+    replay_last: int | None = None
+) -> AsyncGenerator[misc.Message, None]:
+    """Client side of the `MessagesServer`, subscribe to the pipes from another process."""
+    reader, writer = await asyncio.open_unix_connection(str(path))
+    try:
+        request: Dict[str, Any] = {"names": list(names)}
+        if _filter:
+            request["filter"] = [t.value for t in _filter]
+        if meta:
+            request["meta"] = {key: list(value) if isinstance(value, (set, frozenset, tuple)) else value for key, value in meta.items()}
+        if payload_keys:
+            request["payload_keys"] = list(payload_keys)
+        if replay_from is not None:
+            request["replay_from"] = replay_from
+        if replay_last is not None:
+            request["replay_last"] = replay_last
+        writer.write(json.dumps(request).encode("utf-8") + b"\n")
+        await writer.drain()
+        async for msg in codec.read_messages(reader):
+            yield msg
+    finally:
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
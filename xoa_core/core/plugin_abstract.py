@@ -24,10 +24,14 @@ class TransmitFunc(typing.Protocol):
 class PPipeFacade(typing.Protocol):
     def __init__(self, transmit: "TransmitFunc", suite_name: str) -> None: ...  # noqa: E704
 
-    def send_statistics(self, data: typing.Union[typing.Dict, "BaseModel"]) -> None:
-        """Method used for push statistics data into the messages pipe for future distribution"""
+    def send_statistics(self, data: typing.Union[typing.Dict, "BaseModel"], key: typing.Optional[str] = None) -> None:
+        """
+            Method used for push statistics data into the messages pipe for future distribution
+
+            Optional key identifies a stream of statistics, in the coalescing mode only the latest pending sample per key is delivered.
+        """
 
-    def send_progress(self, current: int, total: int = 100, loop: int = 0) -> None:
+    def send_progress(self, current: int, total: int = 100, loop: int = 0, key: typing.Optional[str] = None) -> None:
         """Method used for push current progress value into the messages pipe for future distribution"""
 
     def send_warning(self, warning: Exception) -> None:
@@ -1,41 +1,106 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 from typing import (
     TYPE_CHECKING,
     Any,
     Iterable,
+    Optional,
 )
 if TYPE_CHECKING:
     from xoa_driver import testers
     from xoa_core.core.generic_types import TMesagesPipe
 
+from xoa_core.core.messenger.misc import EMsgType, Progress
+
 from .pool import ResourcesPool
 from .resource.facade import Resource
-from .resource.misc import Credentials
+from .resource import exceptions
+from .resource.misc import (
+    Credentials,
+    get_tester_type,
+)
+from .sessions import SessionPool
 from .storage import PrecisionStorage
 from .types import TesterID, TesterInfoModel
 
 
+STARTUP_PROGRESS_KEY = "startup"
+"""Meta `key` of the PROGRESS messages of connecting the known testers on startup."""
+
+
 class ResourcesController:
-    __slots__ = ("__store", "_pool",)
+    __slots__ = ("__store", "__msg_pipe", "__connect_concurrency", "__connect_timeout", "__startup", "__sessions", "_pool",)
 
-    def __init__(self, msg_pipe: "TMesagesPipe", data_storage: PrecisionStorage) -> None:
+    def __init__(
+        self,
+        msg_pipe: "TMesagesPipe",
+        data_storage: PrecisionStorage,
+        *,
+        connect_concurrency: int | None = None,
+        connect_timeout: float | None = None,
+        delta_events: bool = False,
+        change_window: float = 0.0,
+        session_pool_size: int = 0,
+        session_idle_timeout: float = 300.0
+    ) -> None:
         self.__store = data_storage
-        self._pool = ResourcesPool(msg_pipe.transmit)
+        self.__msg_pipe = msg_pipe
+        self.__connect_concurrency = connect_concurrency
+        self.__connect_timeout = connect_timeout
+        self.__startup: Optional[asyncio.Task] = None
+        self.__sessions = SessionPool(max_size=session_pool_size, idle_timeout=session_idle_timeout) if session_pool_size else None
+        self._pool = ResourcesPool(msg_pipe.transmit, delta_events=delta_events, change_window=change_window)
 
     async def start(self) -> None:
+        """Add the known testers to the pool, they are connected in the background."""
         known_testers = await self.__store.get_all()
-        for credential in known_testers:
-            resource = Resource(
+        await self._pool.add_many(
+            Resource(
                 Credentials.parse_obj(credential),
                 name=credential.get("name"),
                 keep_disconnected=credential.get("keep_disconnected", False)
             )
-            await self._pool.add(resource)
-        failed = await self._pool.all.connect()
+            for credential in known_testers
+        )
+        self.__startup = asyncio.create_task(self.__connect_known(), name="ResourcesStartup")
+        self.__startup.add_done_callback(self.__on_startup_done)
+
+    def __on_startup_done(self, task: asyncio.Task) -> None:
+        # the failure is reported even if nobody is waiting for the startup
+        if not task.cancelled() and (error := task.exception()) is not None:
+            self.__msg_pipe.transmit_err(f"Connecting of the known testers failed: {type(error).__name__}: {error}")
+
+    async def __connect_known(self) -> None:
+        total = sum(not resource.keep_disconnected for resource in self._pool.all.resources.values())
+        done = 0
+
+        def on_done(resource: Resource, error: Exception | None) -> None:
+            nonlocal done
+            done += 1
+            if error is not None:
+                self.__msg_pipe.transmit_warn(str(error))
+            self.__msg_pipe.transmit(
+                Progress.construct(current=done, total=total, loop=0),
+                msg_type=EMsgType.PROGRESS,
+                key=STARTUP_PROGRESS_KEY
+            )
+
+        failed = await self._pool.all.connect(
+            concurrency=self.__connect_concurrency,
+            timeout=self.__connect_timeout,
+            on_done=on_done
+        )
         for resource in failed:
             resource.dataset.keep_disconnected = True
-            await self.__store.save(resource.store_data)
+        if failed:
+            await self.__store.save_many(resource.store_data for resource in failed)
+
+    async def wait_started(self) -> None:
+        """Wait till all of the known testers are connected or failed to connect."""
+        if self.__startup is not None:
+            await asyncio.shield(self.__startup)
 
     async def add_tester(self, credentials: Credentials) -> TesterID:
         new_resource = Resource(credentials)  # InvalidTesterTypeError
@@ -49,6 +114,8 @@ class ResourcesController:
     async def remove_tester(self, id: TesterID) -> None:
         resource = await self._pool.extract(id)
         await self.__store.delete(resource.id)
+        if self.__sessions is not None:
+            self.__sessions.evict(resource.id)
         if resource.is_connected:
             await resource.disconnect()
 
@@ -60,6 +127,9 @@ class ResourcesController:
     async def list_testers_info(self) -> list[TesterInfoModel]:
         return list(self._pool.all.get_items())
 
+    async def publish_snapshot(self, ids: Iterable[TesterID] | None = None) -> None:
+        await self._pool.publish_snapshot(ids)
+
     async def get_tester_info(self, tester_id: TesterID) -> TesterInfoModel:
         resource = self._pool.get(tester_id)
         return resource.info()
@@ -71,11 +141,53 @@ class ResourcesController:
 
     async def disconnect(self, id: TesterID) -> None:
         resource = self._pool.get(id)
+        if self.__sessions is not None:
+            self.__sessions.evict(resource.id)
         await resource.disconnect()  # IsDisconnectedError
         await self.__store.save(resource.store_data)
 
+    def get_credentials_by_id(self, testers_ids: Iterable[TesterID]) -> dict[str, Credentials]:
+        return {
+            res.id: res.credentials
+            for res in self._pool.all.select(tuple(testers_ids))
+        }
+
+    def check_testers(self, testers_ids: Iterable[TesterID]) -> None:
+        """Raise `UnknownResourceError` or `InvalidTesterTypeError` if any of the testers can't be used by a test suite."""
+        for credentials in self.get_credentials_by_id(testers_ids).values():
+            if get_tester_type(credentials.product) is None:
+                raise exceptions.InvalidTesterTypeError(credentials)
+
     def get_testers_by_id(self, testers_ids: Iterable[TesterID], username: str, debug: bool = False) -> dict[str, "testers.GenericAnyTester"]:
         return {
             res.id: res.prepare_session(username, debug)
             for res in self._pool.all.select(tuple(testers_ids))
         }
+
+    @property
+    def pools_sessions(self) -> bool:
+        """The testers of the test suites are leased from the session pool by `lease_testers`."""
+        return self.__sessions is not None
+
+    def lease_testers(self, owner: str, testers_ids: Iterable[TesterID], username: str) -> dict[str, "testers.GenericAnyTester"]:
+        """
+        Testers of the pooled sessions, or new tester sessions if the session pool is disabled,
+        the pooled sessions are leased by the owner, e.g. the execution, till `release_testers`.
+        """
+        if self.__sessions is None:
+            return self.get_testers_by_id(testers_ids, username)
+        return self.__sessions.lease(owner, self._pool.all.select(tuple(testers_ids)), username)
+
+    def release_testers(self, owner: str) -> None:
+        """Return the sessions leased by the owner to the session pool."""
+        if self.__sessions is not None:
+            self.__sessions.release(owner)
+
+    async def close(self) -> None:
+        """Cancel the connecting of the known testers, if it's still running, and close the idle sessions of the session pool."""
+        if self.__startup is not None and not self.__startup.done():
+            self.__startup.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.__startup
+        if self.__sessions is not None:
+            await self.__sessions.close()
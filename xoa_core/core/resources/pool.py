@@ -5,6 +5,8 @@ from typing import (
     Any,
     Callable,
     Generator,
+    Iterable,
+    Optional,
 )
 
 from pydantic import BaseModel
@@ -12,7 +14,7 @@ from pydantic import BaseModel
 from .resource import const
 from .resource.facade import Resource
 from .resource.models.types import TesterID
-from .resource.models.tester import TesterInfoModel
+from .resource.models.tester import TesterDelta, TesterInfoModel
 from .resource.exceptions import UnknownResourceError
 
 
@@ -41,16 +43,39 @@ class MultiResActions:
     def __init__(self, resources: dict[TesterID, Resource]) -> None:
         self.resources = resources
 
-    async def connect(self) -> Generator[Resource, None, None]:
-        prefiltered = (r for r in self.resources.values() if not r.keep_disconnected)
-        result = await asyncio.gather(
-            *[r.connect() for r in prefiltered],
-            return_exceptions=True
-        )
-        return (
+    async def connect(
+        self,
+        *,
+        concurrency: int | None = None,
+        timeout: float | None = None,
+        on_done: Callable[[Resource, Optional[Exception]], None] | None = None
+    ) -> tuple[Resource, ...]:
+        """
+        Connect the resources which are not kept disconnected, returns the failed ones.
+
+        At most `concurrency` connections are established at the same time, each of them within `timeout` seconds,
+        `on_done` is called with the resource and the error, if any, after each connection attempt.
+        """
+        prefiltered = tuple(r for r in self.resources.values() if not r.keep_disconnected)
+        semaphore = asyncio.Semaphore(concurrency or len(prefiltered) or 1)
+
+        async def connect_one(resource: Resource) -> Optional[Exception]:
+            async with semaphore:
+                try:
+                    await resource.connect(timeout)
+                except Exception as e:
+                    error: Optional[Exception] = e
+                else:
+                    error = None
+            if on_done is not None:
+                on_done(resource, error)
+            return error
+
+        result = await asyncio.gather(*[connect_one(r) for r in prefiltered])
+        return tuple(
             resource
-            for result, resource in zip(result, prefiltered)
-            if isinstance(result, Exception)
+            for error, resource in zip(result, prefiltered)
+            if error is not None
         )
 
     def get_items(self) -> Generator[TesterInfoModel, None, None]:
@@ -69,11 +94,20 @@ class Msg(BaseModel):
     data: TesterInfoModel
 
 
+class DeltaMsg(BaseModel):
+    """CHANGED message of the delta mode."""
+
+    action: str
+    data: TesterDelta
+
+
 class ResourcesPool:
-    __slots__ = ("__resources", "__publisher")
+    __slots__ = ("__resources", "__publisher", "__delta_events", "__change_window")
 
-    def __init__(self, publisher: Callable[[Any], None]) -> None:
+    def __init__(self, publisher: Callable[[Any], None], *, delta_events: bool = False, change_window: float = 0.0) -> None:
         self.__publisher = publisher
+        self.__delta_events = delta_events
+        self.__change_window = change_window
         self.__resources: dict[TesterID, Resource] = dict()
 
     def __contains__(self, key: TesterID) -> bool:
@@ -90,14 +124,33 @@ class ResourcesPool:
         message = Msg(action=event, data=dataset)
         self.__publisher(message)
 
+    async def __publish_delta(self, delta: TesterDelta, event: str) -> None:
+        self.__publisher(DeltaMsg.construct(action=event, data=delta))
+
+    async def __subscribe(self, resource: Resource) -> None:
+        await self.__publish_message(resource.info(), const.ADDED)
+        resource.set_change_window(self.__change_window)
+        if self.__delta_events:
+            resource.enable_delta_events()
+            resource.events.on_changed(self.__publish_delta)
+        else:
+            resource.events.on_changed(self.__publish_message)
+        resource.events.on_connected(self.__publish_message)
+        resource.events.on_disconnected(self.__publish_message)
+
     async def add(self, resource: Resource) -> None:
         """Add Resource to the pool and subscribe on changes"""
         self.__resources[resource.id] = resource
         self.__optimize()
-        await self.__publish_message(resource.info(), const.ADDED)
-        resource.events.on_changed(self.__publish_message)
-        resource.events.on_connected(self.__publish_message)
-        resource.events.on_disconnected(self.__publish_message)
+        await self.__subscribe(resource)
+
+    async def add_many(self, resources: Iterable[Resource]) -> None:
+        """Add multiple Resources to the pool at once and subscribe on their changes"""
+        added = tuple(resources)
+        self.__resources.update((resource.id, resource) for resource in added)
+        self.__optimize()
+        for resource in added:
+            await self.__subscribe(resource)
 
     def get(self, id: TesterID) -> Resource:
         """Get a known Resource by it's ID"""
@@ -114,6 +167,12 @@ class ResourcesPool:
             return resource
         raise UnknownResourceError(id)
 
+    async def publish_snapshot(self, ids: Iterable[TesterID] | None = None) -> None:
+        """Publish the whole info of the testers, by default of all of them."""
+        resources = self.__resources.values() if ids is None else self.all.select(tuple(ids))
+        for resource in resources:
+            await self.__publish_message(resource.info(), const.SNAPSHOT)
+
     @property
     def all(self) -> MultiResActions:
         return MultiResActions(self.__resources)
@@ -6,5 +6,9 @@ CONNECTED = "CONNECTED"
 DISCONNECTED = "DISCONNECTED"
 CHANGED = "CHANGED"
 REMOVED = "REMOVED"
+SNAPSHOT = "SNAPSHOT"
 
 # endregion
+
+LOGOFF_TIMEOUT = 5.0
+"""Seconds to wait for the log off of a session which failed to connect."""
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import asdict
+import contextlib
 
 from functools import lru_cache
 from typing import (
     Any,
     Callable,
     Coroutine,
+    Union,
 )
 from xoa_driver.testers import GenericAnyTester
 from xoa_core.core.utils.observer import SimpleObserver
@@ -17,7 +18,13 @@ from . import (
     exceptions,
     misc,
 )
-from .models.tester import TesterModel, TesterInfoModel
+from .models.__snapshot import Change
+from .models.tester import (
+    FieldChange,
+    TesterDelta,
+    TesterModel,
+    TesterInfoModel,
+)
 from .models.types import (
     TesterID,
     StorageResource,
@@ -25,6 +32,7 @@ from .models.types import (
 
 
 EventCallback = Callable[[TesterInfoModel, str], Coroutine[None, None, None]]
+DeltaCallback = Callable[[TesterDelta, str], Coroutine[None, None, None]]
 
 
 class Events:
@@ -42,15 +50,18 @@ class Events:
     def on_disconnected(self, func: EventCallback) -> None:
         self.__observer.subscribe(const.DISCONNECTED, func)
 
-    def on_changed(self, func: EventCallback) -> None:
+    def on_changed(self, func: Union[EventCallback, DeltaCallback]) -> None:
+        """In the delta mode the callback receives the `TesterDelta` instead of the `TesterInfoModel`."""
         self.__observer.subscribe(const.CHANGED, func)
 
 
 class Resource:
-    __slots__ = ("tester", "dataset", "__observer")
+    __slots__ = ("tester", "dataset", "__observer", "__change_window", "__pending_changed")
 
     def __init__(self, credentials: misc.Credentials, *, name: str | None = None, keep_disconnected: bool | None = None) -> None:
         self.__observer: SimpleObserver[str] = SimpleObserver(pass_event=True)
+        self.__change_window = 0.0
+        self.__pending_changed: asyncio.TimerHandle | None = None
         self.dataset = TesterModel(
             id=misc.make_resource_id(credentials.host, credentials.port),
             product=credentials.product,
@@ -69,6 +80,7 @@ class Resource:
         raise exceptions.InvalidTesterTypeError(self.credentials)
 
     async def __on_tester_loose_connection(self, _) -> None:
+        self.__close_change_window()
         self.__observer.emit(const.DISCONNECTED, self.info())
         if self.keep_disconnected:
             return None
@@ -84,19 +96,70 @@ class Resource:
         self.dataset.keep_disconnected = True
 
     def __on_data_changed(self) -> None:
-        self.__observer.emit(const.CHANGED, self.info())
+        if not self.__change_window:
+            self.__emit_changed()
+        elif self.__pending_changed is None:
+            self.__pending_changed = asyncio.get_running_loop().call_later(self.__change_window, self.__emit_changed)
+
+    def __close_change_window(self) -> None:
+        """Drop the pending changes, the following message carries the whole tester info."""
+        if self.__pending_changed is not None:
+            self.__pending_changed.cancel()
+            self.__pending_changed = None
+        self.dataset.pop_changes()
+
+    def __emit_changed(self) -> None:
+        self.__pending_changed = None
+        changes = self.dataset.pop_changes()
+        if changes is None:
+            self.__observer.emit(const.CHANGED, self.info())
+        elif changes:
+            self.__observer.emit(const.CHANGED, self.__delta(changes))
+
+    def __delta(self, changes: list[Change]) -> TesterDelta:
+        latest: dict[tuple[tuple[int, ...], str], Any] = {}
+        for path, name, value in changes:
+            latest.pop((path, name), None)  # keep the order of the last changes
+            latest[(path, name)] = value
+        return TesterDelta.construct(
+            id=self.id,
+            changes=tuple(
+                FieldChange.construct(
+                    module_index=path[0] if len(path) > 0 else None,
+                    port_index=path[1] if len(path) > 1 else None,
+                    name=name,
+                    value=value,
+                )
+                for (path, name), value in latest.items()
+            )
+        )
+
+    def enable_delta_events(self) -> None:
+        """Emit only the changed fields on CHANGED events instead of the whole tester info."""
+        self.dataset.track_changes()
+
+    def set_change_window(self, seconds: float) -> None:
+        """Coalesce the changes made within the window into a single CHANGED event carrying the final state."""
+        self.__change_window = seconds
 
     @property
     def is_connected(self) -> bool:
         return self.tester is not None and self.tester.session.is_online
 
-    async def connect(self) -> None:
+    async def connect(self, timeout: float | None = None) -> None:
         if self.tester.session.is_online:
             raise exceptions.IsConnectedError(self.id)
         self.dataset.keep_disconnected = False
         try:
-            await self.tester
+            await asyncio.wait_for(self.tester, timeout)
+        except asyncio.CancelledError:
+            tester, self.tester = self.tester, self.__get_tester_inst()
+            self.__abort_session(tester)
+            raise
         except Exception as e:
+            # drop the half-open session, the next connect starts from scratch
+            tester, self.tester = self.tester, self.__get_tester_inst()
+            await self.__close_session(tester)
             raise exceptions.TesterCommunicationError(self.credentials, e) from None
         else:
             # IMPORTANT: To keep order of next functions call
@@ -104,9 +167,27 @@ class Resource:
             # 2 - Emit CONNECTED
             # 3 - Subscribe on tester disconnected
             await self.dataset.sync(self.tester, self.__on_data_changed)
+            self.__close_change_window()
             self.__observer.emit(const.CONNECTED, self.info())
             self.tester.on_disconnected(self.__on_tester_loose_connection)
 
+    @staticmethod
+    def __abort_session(tester: GenericAnyTester) -> None:
+        """Close the connection of the session without logging off."""
+        if conn := getattr(tester.session, "_conn", None):
+            with contextlib.suppress(Exception):
+                conn.close()
+
+    @classmethod
+    async def __close_session(cls, tester: GenericAnyTester) -> None:
+        """Best-effort log off of the session which failed to connect, it's never raising."""
+        if not tester.session.is_online:
+            return None
+        try:
+            await asyncio.wait_for(tester.session.logoff(), const.LOGOFF_TIMEOUT)
+        except Exception:
+            cls.__abort_session(tester)  # the tester is not responding, at least don't leave the connection open
+
     async def disconnect(self) -> None:
         if not self.tester.session.is_online:
             raise exceptions.IsDisconnectedError(self.id)
@@ -148,7 +229,7 @@ class Resource:
         return misc.Credentials.parse_obj(self.store_data)
 
     def info(self) -> TesterInfoModel:
-        return TesterInfoModel.parse_obj(asdict(self.dataset))
+        return self.dataset.info()
 
     @property
     def events(self) -> Events:
@@ -23,14 +23,18 @@ class Credentials(BaseModel):
     password: SecretStr = SecretStr("xena")
 
 
-def get_tester_inst(props: Credentials, username: str = "xoa-manager", debug=False) -> testers.GenericAnyTester | None:
-    tester_type: Type[testers.GenericAnyTester] | None = {
+def get_tester_type(product: EProductType) -> Type[testers.GenericAnyTester] | None:
+    return {
         EProductType.VALKYRIE: testers.L23Tester,
         EProductType.CHIMERA: testers.L23Tester,
         EProductType.VANTAGE: testers.L23Tester,
         EProductType.VULKAN: testers.L47Tester,
         EProductType.SAFIRE: testers.L47Tester,
-    }.get(props.product, None)
+    }.get(product, None)
+
+
+def get_tester_inst(props: Credentials, username: str = "xoa-manager", debug=False) -> testers.GenericAnyTester | None:
+    tester_type = get_tester_type(props.product)
     return tester_type(
         host=props.host,
         username=username,
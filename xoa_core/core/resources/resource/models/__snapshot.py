@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import abc
+from dataclasses import fields
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+_MISSING = object()
+
+Change = Tuple[Tuple[int, ...], str, Any]
+"""Indexes of the changed model in the tree, e.g. (<module index>, <port index>), the field name and the new value."""
+
+
+class SnapshotMixin(abc.ABC):
+    """
+    Caches the info model built from the fields of the dataclass.
+
+    The cache is invalidated only when a field value actually changes, together with the caches of the parents,
+    so a change of a port rebuilds the info models of the port, of its module and of its tester,
+    the rest of the ports and modules are reused. The cached info models are shared, so they are frozen (`allow_mutation = False`).
+
+    The root of the tree can record the changes of the fields of all its models, the children are located by their `index`.
+    """
+
+    _snapshot: Optional[BaseModel] = None
+    _parent: Optional[SnapshotMixin] = None
+    _changes: Optional[List[Change]] = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+            return None
+        old = self.__dict__.get(name, _MISSING)
+        object.__setattr__(self, name, value)
+        if old is value:
+            return None
+        adopted = False
+        if isinstance(value, tuple):
+            for child in value:
+                if isinstance(child, SnapshotMixin):
+                    object.__setattr__(child, "_parent", self)
+                    adopted = True
+        # the new children have no snapshots yet, so the old snapshot is dropped even if they are equal to the old ones
+        if adopted or old is _MISSING or old != value:
+            self._invalidate()
+            self._record(name, value)
+
+    def _record(self, name: str, value: Any) -> None:
+        path: List[int] = []
+        node = self
+        while node._parent is not None:
+            path.append(getattr(node, "index"))
+            node = node._parent
+        if node._changes is not None:
+            if isinstance(value, tuple) and value and isinstance(value[0], SnapshotMixin):
+                value = tuple(child.info() for child in value)
+            node._changes.append((tuple(reversed(path)), name, value))
+
+    def track_changes(self) -> None:
+        """Start recording the changes of the fields of the models of the tree."""
+        if self._changes is None:
+            object.__setattr__(self, "_changes", [])
+
+    def pop_changes(self) -> Optional[List[Change]]:
+        """Changes recorded since the previous call, None if the changes are not tracked."""
+        if self._changes is None:
+            return None
+        changes = self._changes
+        object.__setattr__(self, "_changes", [])
+        return changes
+
+    def _invalidate(self) -> None:
+        # a valid snapshot implies valid snapshots of all children, so the walk stops at the first invalid one
+        node: Optional[SnapshotMixin] = self
+        while node is not None and node._snapshot is not None:
+            object.__setattr__(node, "_snapshot", None)
+            node = node._parent
+
+    def _snapshot_of(self, model: Type[M]) -> M:
+        if self._snapshot is None:
+            values: Dict[str, Any] = {}
+            for field in fields(self):
+                value = getattr(self, field.name)
+                if isinstance(value, tuple) and value and isinstance(value[0], SnapshotMixin):
+                    value = tuple(child.info() for child in value)
+                values[field.name] = value
+            object.__setattr__(self, "_snapshot", model.parse_obj(values))
+        return self._snapshot  # type: ignore[return-value]
+
+    @abc.abstractmethod
+    def info(self) -> BaseModel:
+        """Cached info model of the fields, see `_snapshot_of`."""
@@ -17,6 +17,7 @@ from xoa_driver import (
 )
 
 from .__decorator import post_notify
+from .__snapshot import SnapshotMixin
 from .types import (
     ModuleID,
     TesterID,
@@ -28,7 +29,7 @@ from .port import (
 
 
 @dataclass
-class ModuleModel:
+class ModuleModel(SnapshotMixin):
     id: ModuleID
     index: int
     model: str
@@ -41,6 +42,9 @@ class ModuleModel:
     can_local_time_adjust: bool = False
     max_clock_ppm: int | None = None
 
+    def info(self) -> ModuleInfoModel:
+        return self._snapshot_of(ModuleInfoModel)
+
     async def on_evt_reserved_by(self, _, value) -> None:
         self.reserved_by = value.username
 
@@ -95,4 +99,9 @@ class ModuleInfoModel(BaseModel):
     is_chimera: bool
     can_local_time_adjust: bool
     max_clock_ppm: Optional[int]
-    serial_number: int
\ No newline at end of file
+    serial_number: int
+
+    class Config:
+        # the instances are cached and shared by the snapshots, see `SnapshotMixin`
+        allow_mutation = False
+        copy_on_model_validation = "none"
\ No newline at end of file
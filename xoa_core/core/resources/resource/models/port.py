@@ -20,10 +20,11 @@ from xoa_driver import (
 )
 from .types import ModuleID, PortID
 from .__decorator import post_notify
+from .__snapshot import SnapshotMixin
 
 
 @dataclass
-class PortModel:
+class PortModel(SnapshotMixin):
     id: PortID
     index: int
     model: str
@@ -56,6 +57,9 @@ class PortModel:
     speed_current: int | None = None
     speed_reduction: int | None = None
 
+    def info(self) -> PortInfoModel:
+        return self._snapshot_of(PortInfoModel)
+
     async def on_evt_traffic_state(self, _, value) -> None:
         self.traffic_state = enums.TrafficOnOff(value.on_off)
 
@@ -155,3 +159,8 @@ class PortInfoModel(BaseModel):
     speed_mode_current: Optional[enums.PortSpeedMode]
     speed_current: Optional[int]
     speed_reduction: Optional[int]
+
+    class Config:
+        # the instances are cached and shared by the snapshots, see `SnapshotMixin`
+        allow_mutation = False
+        copy_on_model_validation = "none"
@@ -7,7 +7,9 @@ from dataclasses import (
 )
 from typing import (
     TYPE_CHECKING,
+    Any,
     Callable,
+    Optional,
     Tuple,
 )
 
@@ -21,6 +23,7 @@ if TYPE_CHECKING:
 from xoa_driver import utils
 
 from .__decorator import post_notify
+from .__snapshot import SnapshotMixin
 from .module import (
     ModuleModel,
     ModuleInfoModel,
@@ -32,7 +35,7 @@ from .types import (
 
 
 @dataclass
-class TesterModel:
+class TesterModel(SnapshotMixin):
     id: TesterID
     product: EProductType
     host: str
@@ -48,6 +51,9 @@ class TesterModel:
     max_password_len: int = 0
     serial_number: int = 0
 
+    def info(self) -> TesterInfoModel:
+        return self._snapshot_of(TesterInfoModel)
+
     async def on_evt_reserved_by(self, _, value) -> None:
         self.reserved_by = value.username
 
@@ -94,4 +100,25 @@ class TesterInfoModel(BaseModel):
     max_name_len: int
     max_comment_len: int
     max_password_len: int
-    serial_number: int
\ No newline at end of file
+    serial_number: int
+
+    class Config:
+        # the instances are cached and shared by the snapshots, see `SnapshotMixin`
+        allow_mutation = False
+        copy_on_model_validation = "none"
+
+
+class FieldChange(BaseModel):
+    module_index: Optional[int] = None
+    """Index of the module of the changed field, None for a field of the tester."""
+    port_index: Optional[int] = None
+    """Index of the port of the changed field, None for a field of the tester or the module."""
+    name: str
+    value: Any
+
+
+class TesterDelta(BaseModel):
+    """Changes of a tester, in the order of occurrence."""
+
+    id: TesterID
+    changes: Tuple[FieldChange, ...]
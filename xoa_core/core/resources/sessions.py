@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+if TYPE_CHECKING:
+    from xoa_driver.testers import GenericAnyTester
+    from .resource.facade import Resource
+
+from .resource.models.types import TesterID
+
+SessionKey = Tuple[TesterID, str]
+
+RESET_TIMEOUT = 10.0
+"""Seconds to wait for the reset of a released session, the session is closed if it takes longer."""
+
+
+class _Session:
+    __slots__ = ("key", "tester", "idle_since")
+
+    def __init__(self, key: SessionKey, tester: "GenericAnyTester") -> None:
+        self.key = key
+        self.tester = tester
+        self.idle_since = 0.0
+
+    @property
+    def is_healthy(self) -> bool:
+        # a tester which was never awaited by the test suite has nothing to reuse
+        return self.tester.session.is_online
+
+    async def reset(self) -> None:
+        """Release the reservations left by the test suite, the ports first, then the modules and the tester."""
+        modules = tuple(self.tester.modules)
+        ports = tuple(port for module in modules for port in module.ports)
+        for level in (ports, modules, (self.tester,)):
+            await asyncio.gather(*(
+                item.reservation.set_release()
+                for item in level
+                if item.is_reserved_by_me()
+            ))
+
+
+class SessionPool:
+    """
+    Logged-in tester sessions reused by the consecutive executions.
+
+    Sessions are leased per tester and username by the owner, e.g. the execution, when it starts,
+    the owner gets the testers of the sessions themselves. A released session is reset, its reservations are released,
+    and it's kept idle for at most `idle_timeout` seconds, the rest of the state of the ports, e.g. their configuration,
+    is kept as the test suite left it.
+    A session is health checked when it's released and leased again, the broken ones are dropped,
+    so a test suite logging off its testers only loses the reuse of the sessions.
+    When the amount of sessions exceeds `max_size`, the longest idle sessions are closed.
+    """
+
+    __slots__ = ("max_size", "idle_timeout", "reset_timeout", "__idle", "__leased", "__evictor", "__pending", "__closed")
+
+    def __init__(self, *, max_size: int = 16, idle_timeout: float = 300.0, reset_timeout: float = RESET_TIMEOUT) -> None:
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.reset_timeout = reset_timeout
+        self.__idle: Dict[SessionKey, List[_Session]] = {}
+        self.__leased: Dict[str, List[_Session]] = {}
+        self.__evictor: Optional[asyncio.TimerHandle] = None
+        self.__pending: Set[asyncio.Task] = set()
+        self.__closed = False
+
+    def __len__(self) -> int:
+        return sum(map(len, self.__leased.values())) + sum(map(len, self.__idle.values()))
+
+    @property
+    def idle(self) -> int:
+        """Amount of the idle sessions."""
+        return sum(map(len, self.__idle.values()))
+
+    def __take_idle(self, key: SessionKey) -> Optional[_Session]:
+        idle = self.__idle.get(key, [])
+        session = None
+        while idle:
+            candidate = idle.pop()
+            if candidate.is_healthy:
+                session = candidate
+                break
+            self.__close(candidate)
+        if not idle:
+            self.__idle.pop(key, None)
+        return session
+
+    def lease(self, owner: str, resources: Iterable["Resource"], username: str) -> Dict[TesterID, "GenericAnyTester"]:
+        """
+        Testers of the idle sessions of the resources, or of the new sessions, leased by the owner till `release`.
+        The testers of the idle sessions are logged in, awaiting them again does nothing.
+        """
+        leased = self.__leased.setdefault(owner, [])
+        testers: Dict[TesterID, "GenericAnyTester"] = {}
+        for resource in resources:
+            key = (resource.id, username)
+            if (session := self.__take_idle(key)) is None:
+                session = _Session(key, resource.prepare_session(username))
+            leased.append(session)
+            testers[resource.id] = session.tester
+        return testers
+
+    def release(self, owner: str) -> None:
+        """Return the sessions leased by the owner to the pool, once they are reset."""
+        for session in self.__leased.pop(owner, ()):
+            if self.__closed or not session.is_healthy:
+                self.__close(session)
+            else:
+                self.__track(self.__return(session))
+
+    async def __return(self, session: _Session) -> None:
+        try:
+            await asyncio.wait_for(session.reset(), self.reset_timeout)
+        except Exception:
+            self.__close(session)
+            return None
+        if self.__closed or not session.is_healthy:
+            self.__close(session)
+            return None
+        loop = asyncio.get_running_loop()
+        session.idle_since = loop.time()
+        self.__idle.setdefault(session.key, []).append(session)
+        self.__shrink(len(self) - self.max_size)
+        if self.__evictor is None and self.__idle:
+            self.__evictor = loop.call_later(self.idle_timeout, self.__evict_expired)
+
+    def evict(self, tester_id: TesterID) -> None:
+        """Close the idle sessions of the tester."""
+        for key in tuple(self.__idle):
+            if key[0] == tester_id:
+                for session in self.__idle.pop(key):
+                    self.__close(session)
+
+    def __idle_sessions(self) -> List[_Session]:
+        return sorted((s for sessions in self.__idle.values() for s in sessions), key=lambda s: s.idle_since)
+
+    def __shrink(self, amount: int) -> None:
+        for session in self.__idle_sessions()[:max(amount, 0)]:
+            self.__idle[session.key].remove(session)
+            if not self.__idle[session.key]:
+                del self.__idle[session.key]
+            self.__close(session)
+
+    def __evict_expired(self) -> None:
+        self.__evictor = None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() - self.idle_timeout
+        sessions = self.__idle_sessions()
+        self.__shrink(sum(s.idle_since <= deadline for s in sessions))
+        if self.__idle:
+            self.__evictor = loop.call_later(self.__idle_sessions()[0].idle_since - deadline, self.__evict_expired)
+
+    def __track(self, coro: Coroutine) -> None:
+        task = asyncio.create_task(coro)
+        self.__pending.add(task)
+        task.add_done_callback(self.__pending.discard)
+
+    def __close(self, session: _Session) -> None:
+        if session.tester.session.is_online:
+            self.__track(session.tester.session.logoff())
+
+    async def close(self) -> None:
+        """Close all idle sessions, the leased ones are closed when they are released."""
+        self.__closed = True
+        if self.__evictor is not None:
+            self.__evictor.cancel()
+            self.__evictor = None
+        self.__shrink(len(self))
+        while self.__pending:
+            await asyncio.wait(tuple(self.__pending))
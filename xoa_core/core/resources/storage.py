@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import shelve
 from functools import partial
-from typing import TypeVar
+from typing import Iterable, TypeVar
 from typing import TypedDict
 from pydantic import SecretStr
 from .types import (
@@ -20,6 +20,12 @@ class Methods:
         with open_db() as db:
             db[params["id"]] = params
 
+    @staticmethod
+    def save_many(open_db: partial[shelve.Shelf], params: Iterable[StorageResource]) -> None:
+        with open_db() as db:
+            for item in params:
+                db[item["id"]] = item
+
     @staticmethod
     def get_all(open_db: partial[shelve.Shelf]) -> tuple[StorageResource]:
         with open_db() as db:
@@ -75,6 +81,10 @@ class PrecisionStorage:
         method = partial(Methods.save, self.__open, params)
         return await self.__run(method)
 
+    async def save_many(self, params: Iterable[StorageResource]) -> None:
+        method = partial(Methods.save_many, self.__open, tuple(params))
+        return await self.__run(method)
+
     async def delete(self, t_id: TesterID) -> None:
         method = partial(Methods.delete, self.__open, t_id)
         return await self.__run(method)
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 from .resource.misc import Credentials
-from .resource.models.tester import TesterInfoModel
+from .resource.models.tester import (
+    FieldChange,
+    TesterDelta,
+    TesterInfoModel,
+)
 from .resource.models.module import ModuleInfoModel
 from .resource.models.port import PortInfoModel
 
@@ -17,4 +21,6 @@ __all__ = (
     "TesterInfoModel",
     "ModuleInfoModel",
     "PortInfoModel",
+    "FieldChange",
+    "TesterDelta",
 )
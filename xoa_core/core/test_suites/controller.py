@@ -30,6 +30,11 @@ class PluginController:
         self.__paths += (path,)
         self.__init_plugins()
 
+    @property
+    def paths(self) -> Tuple[str | Path, ...]:
+        """Registered lookup paths of the plugins."""
+        return self.__paths
+
     def available_test_suites(self) -> List[str]:
         return list(self.__test_suites.keys())
 
@@ -0,0 +1,56 @@
+from __future__ import annotations
+import bisect
+from typing import (
+    List,
+    Sequence,
+)
+
+from pydantic import BaseModel
+
+LATENCY_BOUNDS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+"""Default upper bounds of the buckets in seconds."""
+
+
+class HistogramSnapshot(BaseModel):
+    bounds: List[float]
+    """Upper bounds of the buckets, the last bucket is unbounded."""
+    counts: List[int]
+    count: int
+    total: float
+    max: float
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class Histogram:
+    """Fixed buckets histogram of the observed values."""
+
+    __slots__ = ("__bounds", "__counts", "__count", "__total", "__max")
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BOUNDS) -> None:
+        self.__bounds = tuple(sorted(bounds))
+        self.reset()
+
+    def reset(self) -> None:
+        self.__counts = [0] * (len(self.__bounds) + 1)
+        self.__count = 0
+        self.__total = 0.0
+        self.__max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.__counts[bisect.bisect_left(self.__bounds, value)] += 1
+        self.__count += 1
+        self.__total += value
+        if value > self.__max:
+            self.__max = value
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(
+            bounds=list(self.__bounds),
+            counts=list(self.__counts),
+            count=self.__count,
+            total=self.__total,
+            max=self.__max,
+        )
@@ -0,0 +1,154 @@
+"""
+Detection of the event loop stalls.
+
+A sampler task measures how late the loop wakes it up, the lag of each sample is recorded into a histogram.
+A watchdog thread checks the heartbeat of the sampler, while the loop is not responding for longer than
+the threshold, the watchdog captures the task and the code location which are blocking the loop, the latest capture wins.
+The blocking task is found in the captured frames, the watchdog never touches the state of the loop.
+The stall is reported from the loop, as soon as the loop is responsive again.
+"""
+from __future__ import annotations
+import asyncio
+import asyncio.events
+import contextlib
+import re
+import sys
+import threading
+import time
+import traceback
+from types import FrameType
+from typing import (
+    Callable,
+    List,
+    Optional,
+)
+
+from pydantic import BaseModel
+
+from .histogram import (
+    Histogram,
+    HistogramSnapshot,
+)
+
+_EXECUTION_ID = re.compile(r"\[([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})\]$")
+STACK_DEPTH = 5
+
+
+class LoopStall(BaseModel):
+    duration: float
+    """Seconds the loop was not responding."""
+    task: Optional[str]
+    """Name of the task which was blocking the loop, if it was captured."""
+    execution_id: Optional[str]
+    """Test-Suite execution the blocking task is belong to."""
+    location: List[str]
+    """The innermost frames of the blocking code."""
+
+
+class _Capture:
+    __slots__ = ("beat", "task", "location")
+
+    def __init__(self, beat: float, task: Optional[str], location: List[str]) -> None:
+        self.beat = beat
+        """Heartbeat of the sampler the capture belongs to."""
+        self.task = task
+        self.location = location
+
+
+def _task_of(frame: Optional[FrameType]) -> Optional[str]:
+    """Name of the task run by the loop callback on the stack."""
+    while frame is not None:
+        if frame.f_code is asyncio.events.Handle._run.__code__:
+            handle = frame.f_locals.get("self")
+            owner = getattr(getattr(handle, "_callback", None), "__self__", None)
+            return owner.get_name() if isinstance(owner, asyncio.Task) else None
+        frame = frame.f_back
+    return None
+
+
+def execution_id_of(task_name: Optional[str]) -> Optional[str]:
+    """Execution id from the names of the tasks like `<suite_name>[<execution_id>]`."""
+    if task_name and (match := _EXECUTION_ID.search(task_name)):
+        return match.group(1)
+    return None
+
+
+class LoopMonitor:
+    __slots__ = ("interval", "threshold", "__on_stall", "__lag", "__beat", "__capture", "__sampler", "__watchdog", "__stopped")
+
+    def __init__(self, on_stall: Callable[[LoopStall], None], *, interval: float = 0.1, threshold: float = 0.5) -> None:
+        self.interval = interval
+        self.threshold = threshold
+        self.__on_stall = on_stall
+        self.__lag = Histogram()
+        self.__beat = time.monotonic()
+        self.__capture: Optional[_Capture] = None
+        self.__sampler: Optional[asyncio.Task] = None
+        self.__watchdog: Optional[threading.Thread] = None
+        self.__stopped = threading.Event()
+
+    @property
+    def lag(self) -> HistogramSnapshot:
+        """Distribution of the lag of the loop in seconds."""
+        return self.__lag.snapshot()
+
+    def start(self) -> None:
+        if self.__sampler is not None:
+            return None
+        self.__stopped.clear()
+        self.__beat = time.monotonic()
+        self.__sampler = asyncio.create_task(self.__sample(), name="LoopMonitor")
+        self.__watchdog = threading.Thread(
+            target=self.__watch,
+            args=(threading.get_ident(),),
+            name="LoopMonitorWatchdog",
+            daemon=True,
+        )
+        self.__watchdog.start()
+
+    async def stop(self) -> None:
+        if self.__sampler is None:
+            return None
+        self.__stopped.set()
+        self.__sampler.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self.__sampler
+        self.__sampler = None
+        if self.__watchdog is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self.__watchdog.join)
+            self.__watchdog = None
+
+    async def __sample(self) -> None:
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            beat, self.__beat = self.__beat, now
+            lag = max(now - started - self.interval, 0.0)
+            self.__lag.observe(lag)
+            capture, self.__capture = self.__capture, None
+            if capture is not None and capture.beat != beat:
+                capture = None
+            if lag >= self.threshold:
+                task = capture.task if capture else None
+                self.__on_stall(
+                    LoopStall(
+                        duration=lag,
+                        task=task,
+                        execution_id=execution_id_of(task),
+                        location=capture.location if capture else [],
+                    )
+                )
+
+    def __watch(self, loop_thread: int) -> None:
+        # a stall of the threshold length is late for half of the threshold at least for one poll
+        while not self.__stopped.wait(min(self.interval, self.threshold) / 2):
+            beat = self.__beat
+            if time.monotonic() - beat - self.interval < self.threshold / 2:
+                continue
+            frame = sys._current_frames().get(loop_thread)
+            self.__capture = _Capture(
+                beat=beat,
+                task=_task_of(frame),
+                location=[f"{f.filename}:{f.lineno} in {f.name}" for f in traceback.extract_stack(frame)[-STACK_DEPTH:]] if frame else [],
+            )
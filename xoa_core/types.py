@@ -11,31 +11,67 @@ from .core.resources.types import (
     TesterInfoModel,
     ModuleInfoModel,
     PortInfoModel,
+    FieldChange,
+    TesterDelta,
 )
 from .core.messenger.misc import (
     EMsgType,
+    EOverflowPolicy,
+    EPipeEvent,
+    PipeEvent,
+    DropCounters,
     Message,
 )
+from .core.messenger.groups import Delivery
+from .core.messenger.metrics import (
+    PipeMetrics,
+    SubscriberMetrics,
+)
 from .core.const import (
     PIPE_EXECUTOR,
-    PIPE_RESOURCES
+    PIPE_RESOURCES,
+    EXECUTIONS_PATTERN,
 )
 from .core.executors.executor_state import EState as EExecutionState
+from .core.executors.executor_state import EOutcome as EExecutionOutcome
+from .core.executors.executor_info import (
+    ActionResult,
+    EActionOutcome,
+)
+from .core.executors.history import (
+    ExecutionRecord,
+    StateTransition,
+)
 
 
 __all__ = (
     "PluginAbstract",
     "EMsgType",
+    "EOverflowPolicy",
+    "EPipeEvent",
+    "PipeEvent",
+    "DropCounters",
+    "PipeMetrics",
+    "SubscriberMetrics",
     "Message",
+    "Delivery",
     "Credentials",
     "TesterInfoModel",
     "ModuleInfoModel",
     "PortInfoModel",
+    "FieldChange",
+    "TesterDelta",
     "EProductType",
     "TesterID",
     "PIPE_EXECUTOR",
     "PIPE_RESOURCES",
+    "EXECUTIONS_PATTERN",
     "EExecutionState",
+    "EExecutionOutcome",
+    "ExecutionRecord",
+    "ActionResult",
+    "EActionOutcome",
+    "StateTransition",
     "PortIdentity",
     "TestParameters",
 )